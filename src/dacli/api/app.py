@@ -6,7 +6,7 @@ Creates and configures the FastAPI application with all routers.
 from fastapi import FastAPI
 
 from dacli import __version__
-from dacli.api import content, dependencies, manipulation, navigation
+from dacli.api import content, manipulation, navigation
 from dacli.structure_index import StructureIndex
 
 
@@ -15,7 +15,7 @@ def create_app(index: StructureIndex | None = None) -> FastAPI:
 
     Args:
         index: Optional pre-configured StructureIndex.
-               If None, the index must be set later.
+               If None, the index must be set later via ``app.state.index``.
 
     Returns:
         Configured FastAPI application
@@ -28,9 +28,8 @@ def create_app(index: StructureIndex | None = None) -> FastAPI:
         redoc_url="/redoc",
     )
 
-    # Set the index for all routers (shared via dependencies module)
-    if index is not None:
-        dependencies.set_index(index)
+    # Store the index on the app; routers receive it via Depends(get_index)
+    app.state.index = index
 
     # Include routers
     app.include_router(navigation.router)
@@ -7,7 +7,7 @@ Provides endpoints for searching and accessing document elements:
 
 import time
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from dacli.api.dependencies import get_index
 from dacli.api.models import (
@@ -21,6 +21,7 @@ from dacli.api.models import (
     SearchResponse,
     SearchResultItem,
 )
+from dacli.structure_index import StructureIndex
 
 router = APIRouter(prefix="/api/v1", tags=["Content Access"])
 
@@ -44,6 +45,14 @@ API_TYPE_TO_ELEMENT = {
     "table": ["table"],
 }
 
+# Error body for an empty search query - static, so it is built once at import time
+_INVALID_QUERY_DETAIL = ErrorResponse(
+    error=ErrorDetail(
+        code="INVALID_QUERY",
+        message="Query cannot be empty",
+    )
+).model_dump()
+
 
 @router.post(
     "/search",
@@ -51,21 +60,14 @@ API_TYPE_TO_ELEMENT = {
     summary="Search document content",
     description="Searches the documentation content and returns matching sections.",
 )
-def search_content(request: SearchRequest) -> SearchResponse:
+def search_content(
+    request: SearchRequest,
+    index: StructureIndex = Depends(get_index),
+) -> SearchResponse:
     """Search for content matching the query."""
     # Validate query is not empty
     if not request.query.strip():
-        raise HTTPException(
-            status_code=400,
-            detail=ErrorResponse(
-                error=ErrorDetail(
-                    code="INVALID_QUERY",
-                    message="Query cannot be empty",
-                )
-            ).model_dump(),
-        )
-
-    index = get_index()
+        raise HTTPException(status_code=400, detail=_INVALID_QUERY_DETAIL)
 
     # Measure search time
     start_time = time.time()
@@ -124,6 +126,7 @@ def get_elements(
         default=False,
         description="Include elements from child sections (requires path)",
     ),
+    index: StructureIndex = Depends(get_index),
 ) -> ElementsResponse:
     """Get elements filtered by type and optionally by section path."""
     # Validate element type
@@ -141,8 +144,6 @@ def get_elements(
             ).model_dump(),
         )
 
-    index = get_index()
-
     # Get internal element types that map to this API type
     internal_types = API_TYPE_TO_ELEMENT.get(type, [])
 
@@ -1,30 +1,29 @@
 """Shared dependencies for API routers.
 
-This module provides the shared StructureIndex instance used by all API routers.
-The index is set once during app initialization and accessed by routers.
+This module provides the FastAPI dependency that hands the StructureIndex to
+all API routers. The index is stored on ``app.state.index`` by create_app and
+read from the current request, so each app instance carries its own index.
 """
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
 from dacli.api.models import ErrorDetail, ErrorResponse
 from dacli.structure_index import StructureIndex
 
-# Global index reference - set by create_app, used by all routers
-_index: StructureIndex | None = None
+# Error body for a missing index - static, so it is built once at import time
+_INDEX_NOT_READY_DETAIL = ErrorResponse(
+    error=ErrorDetail(
+        code="INDEX_NOT_READY",
+        message="Server index is not initialized",
+    )
+).model_dump()
 
 
-def set_index(index: StructureIndex) -> None:
-    """Set the global structure index.
+def get_index(request: Request) -> StructureIndex:
+    """Get the structure index of the application serving this request.
 
     Args:
-        index: The StructureIndex to use for all API operations.
-    """
-    global _index
-    _index = index
-
-
-def get_index() -> StructureIndex:
-    """Get the global structure index.
+        request: The current request (injected by FastAPI).
 
     Returns:
         The configured StructureIndex.
@@ -32,14 +31,7 @@ def get_index() -> StructureIndex:
     Raises:
         HTTPException: If the index has not been initialized (503 status).
     """
-    if _index is None:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error=ErrorDetail(
-                    code="INDEX_NOT_READY",
-                    message="Server index is not initialized",
-                )
-            ).model_dump(),
-        )
-    return _index
+    index = getattr(request.app.state, "index", None)
+    if index is None:
+        raise HTTPException(status_code=503, detail=_INDEX_NOT_READY_DETAIL)
+    return index
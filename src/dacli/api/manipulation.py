@@ -7,7 +7,7 @@ Provides endpoints for modifying document content:
 
 from pathlib import Path as FilePath
 
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path
 
 from dacli.api.dependencies import get_index
 from dacli.api.models import (
@@ -20,6 +20,7 @@ from dacli.api.models import (
 )
 from dacli.file_handler import FileReadError, FileSystemHandler, FileWriteError
 from dacli.models import Section
+from dacli.structure_index import StructureIndex
 
 router = APIRouter(prefix="/api/v1", tags=["Manipulation"])
 
@@ -27,15 +28,19 @@ router = APIRouter(prefix="/api/v1", tags=["Manipulation"])
 _file_handler: FileSystemHandler = FileSystemHandler()
 
 
-def _get_section_end_line(section: Section, file_path: FilePath) -> int:
+def _get_section_end_line(
+    section: Section, file_path: FilePath, lines: list[str] | None = None
+) -> int:
     """Get the end line of a section.
 
     Uses the end_line from SourceLocation (populated by parsers).
-    Falls back to reading file length if end_line is not set.
+    Falls back to the file length if end_line is not set.
 
     Args:
         section: The section to get end line for
         file_path: Path to the file containing the section
+        lines: Optional already-read file lines; avoids re-reading the file
+               on the fallback path
 
     Returns:
         The end line number (1-based)
@@ -43,6 +48,9 @@ def _get_section_end_line(section: Section, file_path: FilePath) -> int:
     if section.source_location.end_line is not None:
         return section.source_location.end_line
 
+    if lines is not None:
+        return len(lines)
+
     # Fallback: read file to get total lines
     try:
         content = _file_handler.read_file(file_path)
@@ -51,8 +59,10 @@ def _get_section_end_line(section: Section, file_path: FilePath) -> int:
         return section.source_location.line + 10  # Last resort fallback
 
 
-def _get_section_end_with_children(section: Section, file_path: FilePath) -> int:
-    """Get the end line of a section including ALL child sections recursively.
+def _get_section_end_with_children(
+    section: Section, file_path: FilePath, lines: list[str] | None = None
+) -> int:
+    """Get the end line of a section including ALL descendant sections.
 
     Issue #208: When inserting "after" a section, we need to insert after all
     descendants, not just after the direct content of the section.
@@ -60,18 +70,41 @@ def _get_section_end_with_children(section: Section, file_path: FilePath) -> int
     Args:
         section: The section to get end line for (including children)
         file_path: Path to the file containing the section
+        lines: Optional already-read file lines (see _get_section_end_line)
 
     Returns:
         The end line number (1-based) of the last descendant, or the section
         itself if it has no children
     """
-    if not section.children:
-        # No children, use direct end_line
-        return _get_section_end_line(section, file_path)
-
-    # Find the last child recursively
-    last_child = section.children[-1]
-    return _get_section_end_with_children(last_child, file_path)
+    # Walk down to the last descendant iteratively (no recursion depth limit)
+    node = section
+    while node.children:
+        node = node.children[-1]
+    return _get_section_end_line(node, file_path, lines)
+
+
+def _path_not_found_detail(path: str) -> dict:
+    """Build the PATH_NOT_FOUND error body shared by all endpoints here."""
+    return {
+        "error": {
+            "code": "PATH_NOT_FOUND",
+            "message": f"Section '{path}' not found",
+        }
+    }
+
+
+def _write_failed_detail(file_path: FilePath, error: Exception) -> dict:
+    """Build the WRITE_FAILED error body shared by all endpoints here."""
+    return {
+        "error": {
+            "code": "WRITE_FAILED",
+            "message": "Failed to write changes to file",
+            "details": {
+                "file": str(file_path),
+                "reason": str(error),
+            },
+        }
+    }
 
 
 @router.put(
@@ -87,25 +120,16 @@ def _get_section_end_with_children(section: Section, file_path: FilePath) -> int
 def update_section(
     path: str = Path(description="Hierarchical path to the section"),
     request: UpdateSectionRequest = ...,
+    index: StructureIndex = Depends(get_index),
 ) -> UpdateSectionResponse:
     """Update a section's content."""
-    index = get_index()
-
     # Normalize path
     normalized_path = f"/{path}" if not path.startswith("/") else path
 
     # Find the section
     section = index.get_section(normalized_path)
     if section is None:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "PATH_NOT_FOUND",
-                    "message": f"Section '{normalized_path}' not found",
-                }
-            },
-        )
+        raise HTTPException(status_code=404, detail=_path_not_found_detail(normalized_path))
 
     file_path = section.source_location.file
     start_line = section.source_location.line
@@ -134,19 +158,7 @@ def update_section(
             new_content=new_content,
         )
     except FileWriteError as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "WRITE_FAILED",
-                    "message": "Failed to write changes to file",
-                    "details": {
-                        "file": str(file_path),
-                        "reason": str(e),
-                    },
-                }
-            },
-        )
+        raise HTTPException(status_code=500, detail=_write_failed_detail(file_path, e))
 
     return UpdateSectionResponse(
         success=True,
@@ -171,29 +183,19 @@ def update_section(
 def insert_content(
     path: str = Path(description="Hierarchical path to the reference section"),
     request: InsertContentRequest = ...,
+    index: StructureIndex = Depends(get_index),
 ) -> InsertContentResponse:
     """Insert content relative to a section."""
-    index = get_index()
-
     # Normalize path
     normalized_path = f"/{path}" if not path.startswith("/") else path
 
     # Find the section
     section = index.get_section(normalized_path)
     if section is None:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "PATH_NOT_FOUND",
-                    "message": f"Section '{normalized_path}' not found",
-                }
-            },
-        )
+        raise HTTPException(status_code=404, detail=_path_not_found_detail(normalized_path))
 
     file_path = section.source_location.file
     start_line = section.source_location.line
-    end_line = _get_section_end_line(section, file_path)
 
     # Determine insert position
     content = request.content
@@ -201,26 +203,28 @@ def insert_content(
         content += "\n"
 
     try:
+        # Read the file once; end-line lookups reuse these lines
         file_content = _file_handler.read_file(file_path)
         lines = file_content.splitlines(keepends=True)
+        end_line = _get_section_end_line(section, file_path, lines)
 
         if request.position == "before":
             # Insert before the section starts
             insert_line = start_line
-            new_lines = lines[: start_line - 1] + [content] + lines[start_line - 1 :]
+            lines.insert(start_line - 1, content)
         elif request.position == "after":
             # Issue #208: Insert after the section AND all its children
             # Use _get_section_end_with_children to include all descendants
-            end_with_children = _get_section_end_with_children(section, file_path)
+            end_with_children = _get_section_end_with_children(section, file_path, lines)
             insert_line = end_with_children + 1
-            new_lines = lines[:end_with_children] + [content] + lines[end_with_children:]
+            lines.insert(end_with_children, content)
         else:  # append
             # Append content at end of section (before the last line/children)
             insert_line = end_line
-            new_lines = lines[: end_line - 1] + [content] + lines[end_line - 1 :]
+            lines.insert(end_line - 1, content)
 
-        new_file_content = "".join(new_lines)
-        _file_handler.write_file(file_path, new_file_content)
+        # Write the lines directly; no joined copy of the file is built
+        _file_handler.write_file(file_path, lines)
 
     except FileReadError as e:
         raise HTTPException(
@@ -233,19 +237,7 @@ def insert_content(
             },
         )
     except FileWriteError as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "WRITE_FAILED",
-                    "message": "Failed to write changes to file",
-                    "details": {
-                        "file": str(file_path),
-                        "reason": str(e),
-                    },
-                }
-            },
-        )
+        raise HTTPException(status_code=500, detail=_write_failed_detail(file_path, e))
 
     return InsertContentResponse(
         success=True,
@@ -6,7 +6,7 @@ Provides endpoints for navigating the document structure:
 - GET /sections - Get sections at a specific level
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
 from dacli.api.dependencies import get_index
 from dacli.api.models import (
@@ -18,6 +18,7 @@ from dacli.api.models import (
     SectionSummary,
     StructureResponse,
 )
+from dacli.structure_index import StructureIndex
 
 router = APIRouter(prefix="/api/v1", tags=["Navigation"])
 
@@ -34,9 +35,9 @@ def get_structure(
         description="Maximum depth of returned structure. None for unlimited.",
         ge=1,
     ),
+    index: StructureIndex = Depends(get_index),
 ) -> StructureResponse:
     """Get the hierarchical document structure."""
-    index = get_index()
     structure = index.get_structure(max_depth=max_depth)
 
     sections = [_section_dict_to_response(s) for s in structure["sections"]]
@@ -58,10 +59,9 @@ def get_structure(
 )
 def get_section(
     path: str = Path(description="Hierarchical path to the section"),
+    index: StructureIndex = Depends(get_index),
 ) -> SectionDetailResponse:
     """Get a specific section by path."""
-    index = get_index()
-
     # Normalize path - ensure it starts with /
     normalized_path = f"/{path}" if not path.startswith("/") else path
 
@@ -112,10 +112,9 @@ def get_sections(
         description="Nesting level (1 = chapter, 2 = section, etc.)",
         ge=1,
     ),
+    index: StructureIndex = Depends(get_index),
 ) -> SectionsAtLevelResponse:
     """Get all sections at a specific level."""
-    index = get_index()
-
     sections = index.get_sections_at_level(level)
 
     section_summaries = [SectionSummary(path=s.path, title=s.title) for s in sections]
@@ -128,17 +127,22 @@ def get_sections(
 
 
 def _section_dict_to_response(section_dict: dict) -> SectionResponse:
-    """Convert a section dictionary from index to response model."""
+    """Convert a section dictionary from index to response model.
+
+    The dictionaries come from StructureIndex and are already well-typed, so
+    the models are built with model_construct() to skip per-node validation.
+    """
     children = [_section_dict_to_response(c) for c in section_dict.get("children", [])]
+    location = section_dict["location"]
 
-    return SectionResponse(
+    return SectionResponse.model_construct(
         path=section_dict["path"],
         title=section_dict["title"],
         level=section_dict["level"],
-        location=LocationResponse(
-            file=section_dict["location"]["file"],
-            line=section_dict["location"]["line"],
-            end_line=section_dict["location"].get("end_line"),
+        location=LocationResponse.model_construct(
+            file=location["file"],
+            line=location["line"],
+            end_line=location.get("end_line"),
         ),
         children=children,
     )
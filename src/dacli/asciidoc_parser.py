@@ -7,7 +7,11 @@ AC-ADOC-06, AC-ADOC-07), and cross-references (AC-ADOC-08).
 """
 
 import re
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from dacli.models import (
@@ -20,7 +24,9 @@ from dacli.models import (
     WarningType,
 )
 from dacli.parser_utils import (
+    build_title_path_map,
     collect_all_sections,
+    file_stamp,
     find_section_by_path,
     slugify,
     strip_doc_extension,
@@ -30,34 +36,36 @@ from dacli.parser_utils import (
 SECTION_PATTERN = re.compile(r"^(={1,6})\s+(.+?)(?:\s+=*)?$")
 ATTRIBUTE_PATTERN = re.compile(r"^:([a-zA-Z0-9_-]+):\s*(.*)$")
 INCLUDE_PATTERN = re.compile(r"^include::(.+?)\[(.*)\]$")
+# Attribute reference: {name}
+ATTRIBUTE_REFERENCE_PATTERN = re.compile(r"\{([a-zA-Z0-9_-]+)\}")
 
 # Element patterns - with optional whitespace after commas
-CODE_BLOCK_START_PATTERN = re.compile(r"^\[source(?:,\s*([a-zA-Z0-9_+-]+))?\]$")
-PLANTUML_BLOCK_START_PATTERN = re.compile(
-    r"^\[plantuml(?:,\s*([a-zA-Z0-9_-]+))?(?:,\s*([a-zA-Z0-9_]+))?\]$"
+# Block attribute lines, one regex for all of them:
+# [source,language] ("diagram" group is None) and
+# [plantuml|mermaid|ditaa,name,format] (mermaid and ditaa: Issue #122)
+BLOCK_ATTRIBUTE_PATTERN = re.compile(
+    r"^\[(?:source(?:,\s*(?P<language>[a-zA-Z0-9_+-]+))?"
+    r"|(?P<diagram>plantuml|mermaid|ditaa)"
+    r"(?:,\s*(?P<name>[a-zA-Z0-9_-]+))?(?:,\s*(?P<format>[a-zA-Z0-9_]+))?)\]$"
 )
-# Mermaid and Ditaa diagram patterns (Issue #122)
-MERMAID_BLOCK_START_PATTERN = re.compile(
-    r"^\[mermaid(?:,\s*([a-zA-Z0-9_-]+))?(?:,\s*([a-zA-Z0-9_]+))?\]$"
-)
-DITAA_BLOCK_START_PATTERN = re.compile(
-    r"^\[ditaa(?:,\s*([a-zA-Z0-9_-]+))?(?:,\s*([a-zA-Z0-9_]+))?\]$"
-)
-LISTING_DELIMITER_PATTERN = re.compile(r"^-{4,}$")
-# Generic block delimiter pattern (Issue #207: covers all AsciiDoc block types)
-# Matches: ---- (listing/source), .... (literal), **** (sidebar), ==== (example), ____ (quote)
-BLOCK_DELIMITER_PATTERN = re.compile(r"^(-{4,}|\.{4,}|\*{4,}|={4,}|_{4,})$")
-TABLE_DELIMITER_PATTERN = re.compile(r"^\|===$")
+# Block delimiters are a single character repeated at least four times
+# (Issue #207: covers all AsciiDoc block types), checked without a regex:
+# ---- (listing/source), .... (literal), **** (sidebar), ==== (example), ____ (quote)
+BLOCK_DELIMITER_CHARS = frozenset("-.*=_")
+BLOCK_DELIMITER_MIN_LENGTH = 4
+TABLE_DELIMITER = "|==="
 IMAGE_PATTERN = re.compile(r"^image::(.+?)\[(.*)?\]$")
 ADMONITION_PATTERN = re.compile(r"^(NOTE|TIP|IMPORTANT|WARNING|CAUTION):\s*(.*)$")
-
-# Conditional block patterns (Issue #14)
-# ifdef::attr[] or ifdef::attr[inline content]
-IFDEF_PATTERN = re.compile(r"^ifdef::([a-zA-Z0-9_-]+)\[(.*)\]$")
-# ifndef::attr[] or ifndef::attr[inline content]
-IFNDEF_PATTERN = re.compile(r"^ifndef::([a-zA-Z0-9_-]+)\[(.*)\]$")
-# endif::[] or endif::attr[]
-ENDIF_PATTERN = re.compile(r"^endif::([a-zA-Z0-9_-]*)?\[\]$")
+# First characters of the admonition labels above
+ADMONITION_CHARS = frozenset("NTIWC")
+
+# Conditional block pattern (Issue #14), one regex for all directives:
+# ifdef::attr[] / ifndef::attr[] (optionally with inline content),
+# endif::[] or endif::attr[] (the "directive" group is None for endif)
+CONDITIONAL_PATTERN = re.compile(
+    r"^(?:(?P<directive>ifn?def)::(?P<attr>[a-zA-Z0-9_-]+)\[(?P<content>.*)\]"
+    r"|endif::[a-zA-Z0-9_-]*\[\])$"
+)
 
 # Cross-reference pattern: <<target>> or <<target,display text>>
 XREF_PATTERN = re.compile(r"<<([^,>]+)(?:,([^>]+))?>>", re.MULTILINE)
@@ -68,6 +76,81 @@ ORDERED_LIST_PATTERN = re.compile(r"^\.+\s+.+$")
 DESCRIPTION_LIST_PATTERN = re.compile(r"^.+::(\s+.+)?$")
 
 
+@lru_cache(maxsize=256)
+def _read_include_lines(path: str, stamp: tuple[int, int, int, int]) -> tuple[str, ...]:
+    """Read the lines of an included file, cached by path and file stat.
+
+    Shared snippets (headers, footers, glossaries) are often included by many
+    documents; caching avoids re-reading them for every include directive.
+    The file stamp is part of the cache key, so a changed file is read again.
+
+    Args:
+        path: Resolved path of the included file
+        stamp: File stamp taken before reading (see file_stamp)
+
+    Returns:
+        Lines of the file without line endings
+    """
+    return tuple(Path(path).read_text(encoding="utf-8").splitlines())
+
+
+@lru_cache(maxsize=1024)
+def _scan_include_targets(path: str, stamp: tuple[int, int, int, int]) -> frozenset[Path]:
+    """Collect the include targets of a file, cached by path and file stat.
+
+    The index is rebuilt after every edit and scans every AsciiDoc file for
+    includes; caching means only the files that changed are read again.
+
+    Args:
+        path: Absolute path of the file to scan
+        stamp: File stamp taken before reading (see file_stamp)
+
+    Returns:
+        Resolved paths of all files named in include directives
+    """
+    file_path = Path(path)
+    included_files: set[Path] = set()
+
+    try:
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                match = INCLUDE_PATTERN.match(line)
+                if match:
+                    include_path_str = match.group(1)
+                    # Resolve path relative to file containing the include
+                    try:
+                        included_path = (file_path.parent / include_path_str).resolve()
+                        included_files.add(included_path)
+                    except (ValueError, OSError):
+                        # Invalid path or resolution error - skip it
+                        # The full parser will handle this properly
+                        pass
+    except (OSError, UnicodeDecodeError):
+        # File cannot be read - no includes
+        # The full parser will handle the error
+        pass
+
+    return frozenset(included_files)
+
+
+def _is_block_delimiter(line: str) -> bool:
+    """Check whether a line is a block delimiter such as ``----`` or ``====``.
+
+    Args:
+        line: Line text without the trailing newline
+
+    Returns:
+        True if the line repeats one of BLOCK_DELIMITER_CHARS at least
+        BLOCK_DELIMITER_MIN_LENGTH times and contains nothing else
+    """
+    return (
+        len(line) >= BLOCK_DELIMITER_MIN_LENGTH
+        and line[0] in BLOCK_DELIMITER_CHARS
+        and line.count(line[0]) == len(line)
+    )
+
+
 class CircularIncludeError(Exception):
     """Raised when a circular include is detected."""
 
@@ -84,7 +167,7 @@ class CircularIncludeError(Exception):
         super().__init__(f"Circular include detected: {chain_str} -> {file_path.name}")
 
 
-@dataclass
+@dataclass(slots=True)
 class IncludeInfo:
     """Information about a resolved include directive.
 
@@ -99,7 +182,7 @@ class IncludeInfo:
     options: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AsciidocDocument(Document):
     """A parsed AsciiDoc document.
 
@@ -129,6 +212,15 @@ class AsciidocStructureParser:
         max_include_depth: Maximum depth for nested includes (default: 20)
     """
 
+    # Parsed documents keyed by (file path, base path, max include depth).
+    # Each entry stores the stamps of the file and every include it touched,
+    # so an unchanged document set is not parsed again on re-indexing.
+    _parse_cache: OrderedDict[
+        tuple[str, str, int],
+        tuple[tuple[tuple[Path, tuple[int, int, int, int] | None], ...], "AsciidocDocument"],
+    ] = OrderedDict()
+    _PARSE_CACHE_SIZE = 256
+
     def __init__(self, base_path: Path, max_include_depth: int = 20):
         """Initialize the parser.
 
@@ -139,6 +231,33 @@ class AsciidocStructureParser:
         self.base_path = base_path
         self.max_include_depth = max_include_depth
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parse results."""
+        cls._parse_cache.clear()
+
+    @classmethod
+    def invalidate(cls, file_path: Path) -> None:
+        """Drop cached results that depend on a file the process just wrote.
+
+        Removes every parsed document that is the file or includes it, and
+        the cached include lines and include targets, since an edit within
+        one timestamp tick leaves the file stamp unchanged.
+
+        Args:
+            file_path: Path of the written file
+        """
+        written = file_path.absolute()
+        stale = [
+            key
+            for key, (stamps, _) in cls._parse_cache.items()
+            if any(path.absolute() == written for path, _ in stamps)
+        ]
+        for key in stale:
+            del cls._parse_cache[key]
+        _read_include_lines.cache_clear()
+        _scan_include_targets.cache_clear()
+
     @staticmethod
     def scan_includes(file_path: Path) -> set[Path]:
         """Scan file for include directives and return set of included file paths.
@@ -158,30 +277,15 @@ class AsciidocStructureParser:
             - Handles conditional includes (ifdef/ifndef) - all includes are collected
             - Does NOT check if included files exist (that's handled during parsing)
             - Does NOT resolve nested includes (that's handled during full parsing)
+            - Results are cached by file stamp, so re-indexing after an edit
+              only re-reads the files that changed
         """
-        included_files: set[Path] = set()
-
-        try:
-            with open(file_path, encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    line = line.strip()
-                    match = INCLUDE_PATTERN.match(line)
-                    if match:
-                        include_path_str = match.group(1)
-                        # Resolve path relative to file containing the include
-                        try:
-                            included_path = (file_path.parent / include_path_str).resolve()
-                            included_files.add(included_path)
-                        except (ValueError, OSError):
-                            # Invalid path or resolution error - skip it
-                            # The full parser will handle this properly
-                            pass
-        except (OSError, UnicodeDecodeError):
+        stamp = file_stamp(file_path)
+        if stamp is None:
             # File cannot be read - return empty set
             # The full parser will handle the error
-            pass
-
-        return included_files
+            return set()
+        return set(_scan_include_targets(str(file_path.absolute()), stamp))
 
     def _get_file_prefix(self, file_path: Path) -> str:
         """Calculate file prefix for path generation (Issue #130, ADR-008).
@@ -238,6 +342,11 @@ class AsciidocStructureParser:
     ) -> AsciidocDocument:
         """Parse an AsciiDoc file.
 
+        Results are cached per file. A cached document is returned as long as
+        the file and all of its includes (including missing ones) have the
+        same modification time and size as when it was parsed. The returned
+        document is shared between callers and must not be modified.
+
         Args:
             file_path: Path to the AsciiDoc file
             _depth: Internal parameter for tracking include depth
@@ -257,26 +366,98 @@ class AsciidocStructureParser:
         if _include_chain is None:
             _include_chain = []
 
+        cache_key = (str(file_path), str(self.base_path), self.max_include_depth)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            stamps, cached_doc = cached
+            if all(file_stamp(path) == stamp for path, stamp in stamps):
+                self._parse_cache.move_to_end(cache_key)
+                return cached_doc
+
+        # Attribute definitions are collected while conditional blocks are
+        # filtered in _parse_lines. Lines are split with str.splitlines(), like
+        # the file handler and the index, so line numbers agree for files
+        # containing form feeds or other Unicode line breaks.
+        # Every file is stamped before it is read, so a file edited while
+        # it is parsed fails the stamp check on the next lookup.
+        stamp = file_stamp(file_path)
+        lines = file_path.read_text(encoding="utf-8").splitlines()
+        include_stamps: dict[Path, tuple[int, int, int, int] | None] = {}
+        doc = self._parse_lines(lines, file_path, _depth, _include_chain, include_stamps)
+
+        stamps = ((file_path, stamp), *include_stamps.items())
+        self._parse_cache[cache_key] = (stamps, doc)
+        self._parse_cache.move_to_end(cache_key)
+        if len(self._parse_cache) > self._PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+
+        return doc
+
+    def parse_string(self, text: str, *, virtual_path: Path = Path("<memory>")) -> AsciidocDocument:
+        """Parse AsciiDoc content held in memory.
+
+        Behaves like parse_file() without reading the document from disk.
+        Includes are still resolved relative to the directory of virtual_path.
+        Results are not cached.
+
+        Args:
+            text: AsciiDoc source text
+            virtual_path: Path the content is reported under; used for source
+                locations, section path prefixes and include resolution
+
+        Returns:
+            Parsed AsciidocDocument
+
+        Raises:
+            CircularIncludeError: If a circular include is detected
+        """
+        return self._parse_lines(text.splitlines(), virtual_path, 0, [])
+
+    def _parse_lines(
+        self,
+        lines: Iterable[str],
+        file_path: Path,
+        depth: int,
+        include_chain: list[Path],
+        include_stamps: dict[Path, tuple[int, int, int, int] | None] | None = None,
+    ) -> AsciidocDocument:
+        """Parse AsciiDoc lines into a document.
+
+        Shared core of parse_file() and parse_string().
+
+        Args:
+            lines: Document lines without line endings
+            file_path: Path of the document the lines belong to
+            depth: Current include depth
+            include_chain: Chain of files for circular include detection
+            include_stamps: Optional dict that receives the stamp of every
+                            included file, taken before the file was read
+
+        Returns:
+            Parsed AsciidocDocument
+
+        Raises:
+            CircularIncludeError: If a circular include is detected
+        """
         # Check for circular include
         resolved_path = file_path.resolve()
-        if resolved_path in [p.resolve() for p in _include_chain]:
-            raise CircularIncludeError(file_path, _include_chain)
+        if resolved_path in [p.resolve() for p in include_chain]:
+            raise CircularIncludeError(file_path, include_chain)
 
         # Add current file to include chain
-        current_chain = _include_chain + [file_path]
+        current_chain = include_chain + [file_path]
 
-        content = file_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-
-        # Parse attributes first (they can be used in sections)
-        attributes = self._parse_attributes(lines)
-
-        # Filter conditional blocks (ifdef/ifndef/endif) before include expansion
-        # so that ifdef can control whether includes are processed (Issue #14)
-        lines = self._filter_conditionals(lines, attributes)
+        # Attribute definitions are collected while conditional blocks
+        # (ifdef/ifndef/endif) are filtered. This happens before include
+        # expansion so that ifdef can control whether includes are processed
+        # (Issue #14)
+        attributes: dict[str, str] = {}
+        filtered_lines = self._filter_conditionals(lines, attributes)
 
         # Expand includes and collect include info
-        expanded_lines, includes = self._expand_includes(lines, file_path, _depth, current_chain)
+        expanded_lines, includes = self._expand_includes(
+            filtered_lines, file_path, depth, current_chain, _stamps=include_stamps
+        )
 
         # Parse sections with attribute substitution
         sections, title = self._parse_sections(expanded_lines, file_path, attributes)
@@ -303,18 +484,31 @@ class AsciidocStructureParser:
 
     def _expand_includes(
         self,
-        lines: list[str],
+        lines: Iterable[str],
         file_path: Path,
         depth: int,
         include_chain: list[Path],
+        _resolved_from: SourceLocation | None = None,
+        _expanded: list[tuple[str, Path, int, SourceLocation | None]] | None = None,
+        _includes: list[IncludeInfo] | None = None,
+        _stamps: dict[Path, tuple[int, int, int, int] | None] | None = None,
     ) -> tuple[list[tuple[str, Path, int, SourceLocation | None]], list[IncludeInfo]]:
         """Expand include directives in lines.
 
+        Nested includes append directly to the caller's result lists, so each
+        expanded line is stored once instead of being copied up every level.
+
         Args:
             lines: Document lines
             file_path: Path to the source file
             depth: Current include depth
             include_chain: Chain of files for circular include detection
+            _resolved_from: Internal parameter, include directive that pulled
+                these lines in (None for the top-level document)
+            _expanded: Internal parameter, expanded lines accumulated so far
+            _includes: Internal parameter, IncludeInfo accumulated so far
+            _stamps: Internal parameter, receives the stamp of each included
+                     file as it was before reading (None if it does not exist)
 
         Returns:
             Tuple of (expanded lines with source info, list of IncludeInfo)
@@ -322,8 +516,8 @@ class AsciidocStructureParser:
         Raises:
             CircularIncludeError: If a circular include is detected
         """
-        expanded: list[tuple[str, Path, int, SourceLocation | None]] = []
-        includes: list[IncludeInfo] = []
+        expanded = [] if _expanded is None else _expanded
+        includes = [] if _includes is None else _includes
 
         for line_num, line in enumerate(lines, start=1):
             match = INCLUDE_PATTERN.match(line)
@@ -355,62 +549,36 @@ class AsciidocStructureParser:
                 includes.append(include_info)
 
                 # Expand the included file
-                if target_path.exists():
-                    included_content = target_path.read_text(encoding="utf-8")
-                    included_lines = included_content.splitlines()
-
-                    # Create resolved_from reference
-                    resolved_from = SourceLocation(file=file_path, line=line_num)
-
-                    # Recursively expand includes in the included file
-                    new_chain = include_chain + [target_path]
-                    nested_expanded, nested_includes = self._expand_includes(
-                        included_lines, target_path, depth + 1, new_chain
+                stamp = file_stamp(target_path)
+                if _stamps is not None:
+                    _stamps.setdefault(target_path, stamp)
+                if stamp is not None:
+                    included_lines = _read_include_lines(str(target_path), stamp)
+
+                    # Recursively expand the included file; its lines are
+                    # resolved from this include directive
+                    self._expand_includes(
+                        included_lines,
+                        target_path,
+                        depth + 1,
+                        include_chain + [target_path],
+                        _resolved_from=SourceLocation(file=file_path, line=line_num),
+                        _expanded=expanded,
+                        _includes=includes,
+                        _stamps=_stamps,
                     )
-                    includes.extend(nested_includes)
-
-                    # Add expanded lines with resolved_from info
-                    for inc_line, inc_file, inc_line_num, inc_resolved in nested_expanded:
-                        # Preserve original resolved_from or use current include location
-                        final_resolved = inc_resolved if inc_resolved else resolved_from
-                        expanded.append((inc_line, inc_file, inc_line_num, final_resolved))
             else:
-                expanded.append((line, file_path, line_num, None))
+                expanded.append((line, file_path, line_num, _resolved_from))
 
         return expanded, includes
 
-    def _parse_attributes(self, lines: list[str]) -> dict[str, str]:
-        """Parse document attributes from lines.
-
-        Attributes are defined as :name: value at the start of the document.
-
-        Args:
-            lines: Document lines
-
-        Returns:
-            Dictionary of attribute name to value
-        """
-        attributes: dict[str, str] = {}
-
-        for line in lines:
-            match = ATTRIBUTE_PATTERN.match(line)
-            if match:
-                name = match.group(1)
-                value = match.group(2).strip()
-                attributes[name] = value
-            elif line.strip() and not line.startswith(":"):
-                # Stop parsing attributes when we hit non-attribute content
-                # (but continue through empty lines)
-                if SECTION_PATTERN.match(line):
-                    break
-
-        return attributes
-
-    def _filter_conditionals(self, lines: list[str], attributes: dict[str, str]) -> list[str]:
+    def _filter_conditionals(self, lines: Iterable[str], attributes: dict[str, str]) -> list[str]:
         """Filter lines based on ifdef/ifndef/endif conditional blocks (Issue #14).
 
         Processes conditional directives and returns only the lines that should
-        be included based on the current attribute definitions.
+        be included based on the current attribute definitions. Attribute
+        definitions are collected in the same pass, so a directive only sees
+        attributes defined on earlier, included lines.
 
         Supports:
         - ifdef::attr[] / endif::[] - include when attribute is defined
@@ -419,8 +587,9 @@ class AsciidocStructureParser:
         - Nested conditions with proper depth tracking
 
         Args:
-            lines: Raw document lines
-            attributes: Known document attributes
+            lines: Raw document lines (any iterable, consumed once)
+            attributes: Known document attributes, updated in place with
+                definitions found on included lines
 
         Returns:
             Filtered list of lines with conditional directives removed
@@ -433,35 +602,22 @@ class AsciidocStructureParser:
         for line in lines:
             stripped = line.strip()
 
-            # Check for ifdef::attr[] or ifdef::attr[inline content]
-            ifdef_match = IFDEF_PATTERN.match(stripped)
-            if ifdef_match:
-                attr_name = ifdef_match.group(1)
-                inline_content = ifdef_match.group(2)
-                condition_met = attr_name in attributes
-
-                if inline_content:
-                    # Single-line form: ifdef::attr[content]
-                    if self._is_including(condition_stack) and condition_met:
-                        attr_match = ATTRIBUTE_PATTERN.match(inline_content)
-                        if attr_match:
-                            attributes[attr_match.group(1)] = attr_match.group(2).strip()
-                        result.append(inline_content)
-                else:
-                    # Block form: push condition onto stack
-                    currently_including = self._is_including(condition_stack)
-                    condition_stack.append(currently_including and condition_met)
-                continue
+            conditional_match = CONDITIONAL_PATTERN.match(stripped)
+            if conditional_match:
+                directive = conditional_match.group("directive")
+                if directive is None:
+                    # endif::[] or endif::attr[]
+                    if condition_stack:
+                        condition_stack.pop()
+                    continue
 
-            # Check for ifndef::attr[] or ifndef::attr[inline content]
-            ifndef_match = IFNDEF_PATTERN.match(stripped)
-            if ifndef_match:
-                attr_name = ifndef_match.group(1)
-                inline_content = ifndef_match.group(2)
-                condition_met = attr_name not in attributes
+                # ifdef includes when the attribute is defined, ifndef when it is not
+                is_defined = conditional_match.group("attr") in attributes
+                condition_met = is_defined if directive == "ifdef" else not is_defined
+                inline_content = conditional_match.group("content")
 
                 if inline_content:
-                    # Single-line form: ifndef::attr[content]
+                    # Single-line form: ifdef::attr[content] / ifndef::attr[content]
                     if self._is_including(condition_stack) and condition_met:
                         attr_match = ATTRIBUTE_PATTERN.match(inline_content)
                         if attr_match:
@@ -473,18 +629,13 @@ class AsciidocStructureParser:
                     condition_stack.append(currently_including and condition_met)
                 continue
 
-            # Check for endif::[] or endif::attr[]
-            endif_match = ENDIF_PATTERN.match(stripped)
-            if endif_match:
-                if condition_stack:
-                    condition_stack.pop()
-                continue
-
-            # Track attribute definitions inside conditional blocks
+            # Track attribute definitions on included lines; only lines
+            # starting with ':' can define one, so others skip the regex
             if self._is_including(condition_stack):
-                attr_match = ATTRIBUTE_PATTERN.match(line)
-                if attr_match:
-                    attributes[attr_match.group(1)] = attr_match.group(2).strip()
+                if line.startswith(":"):
+                    attr_match = ATTRIBUTE_PATTERN.match(line)
+                    if attr_match:
+                        attributes[attr_match.group(1)] = attr_match.group(2).strip()
                 result.append(line)
 
         return result
@@ -504,7 +655,8 @@ class AsciidocStructureParser:
     def _substitute_attributes(self, text: str, attributes: dict[str, str]) -> str:
         """Substitute attribute references in text.
 
-        Replaces {attribute} with the attribute value.
+        Replaces {attribute} with the attribute value in a single regex pass.
+        References to undefined attributes are left unchanged.
 
         Args:
             text: Text with potential attribute references
@@ -513,10 +665,11 @@ class AsciidocStructureParser:
         Returns:
             Text with attribute references substituted
         """
-        result = text
-        for name, value in attributes.items():
-            result = result.replace(f"{{{name}}}", value)
-        return result
+        if not attributes or "{" not in text:
+            return text
+        return ATTRIBUTE_REFERENCE_PATTERN.sub(
+            lambda m: attributes.get(m.group(1), m.group(0)), text
+        )
 
     def _parse_sections(
         self,
@@ -552,7 +705,10 @@ class AsciidocStructureParser:
             attributes = {}
 
         sections: list[Section] = []
+        # Open sections and their levels, kept as parallel stacks so finding
+        # the parent compares plain ints instead of reading Section.level
         section_stack: list[Section] = []
+        level_stack: list[int] = []
         document_title = ""
         # Track used paths for disambiguation (Issue #123)
         used_paths: dict[str, int] = {}
@@ -576,18 +732,20 @@ class AsciidocStructureParser:
         in_table = False
 
         for line_text, source_file, line_num, resolved_from in lines:
+            # Cheap string checks come first; only lines starting with "=" reach
+            # SECTION_PATTERN, and most lines are body text matching nothing
             # Issue #207: Track delimited blocks (----, ...., ****, ====, ____)
-            if BLOCK_DELIMITER_PATTERN.match(line_text):
+            if _is_block_delimiter(line_text):
                 in_delimited_block = not in_delimited_block
                 continue
 
             # Issue #207: Track table blocks (|===)
-            if TABLE_DELIMITER_PATTERN.match(line_text):
+            if line_text == TABLE_DELIMITER:
                 in_table = not in_table
                 continue
 
             # Issue #207: Skip section detection inside blocks
-            if in_delimited_block or in_table:
+            if in_delimited_block or in_table or not line_text.startswith("="):
                 continue
 
             match = SECTION_PATTERN.match(line_text)
@@ -621,16 +779,18 @@ class AsciidocStructureParser:
                     section.path = file_prefix
                     sections.append(section)
                     section_stack = [section]
+                    level_stack = [level]
                 else:
                     # Find parent section
-                    while section_stack and section_stack[-1].level >= level:
+                    while level_stack and level_stack[-1] >= level:
                         section_stack.pop()
+                        level_stack.pop()
 
                     slug = slugify(title)
                     if section_stack:
                         parent = section_stack[-1]
                         # Issue #130, ADR-008: Build section path with file prefix
-                        if parent.level == 0:
+                        if level_stack[-1] == 0:
                             # Direct child of document title
                             section_path = slug
                         else:
@@ -653,6 +813,7 @@ class AsciidocStructureParser:
                         sections.append(section)
 
                     section_stack.append(section)
+                    level_stack.append(level)
 
         return sections, document_title
 
@@ -685,13 +846,21 @@ class AsciidocStructureParser:
                 sections_by_file[file_path] = []
             sections_by_file[file_path].append(section)
 
-        # Count lines per file from expanded lines
+        # Count lines per file from expanded lines. Lines of one file arrive in
+        # runs of increasing line numbers (interrupted by includes), so the
+        # current run is tracked in locals and only its last line is compared
+        # against the stored maximum when the run ends.
         lines_per_file: dict[Path, int] = {}
+        run_file: Path | None = None
+        run_last = 0
         for _, source_file, line_num, _ in lines:
-            if source_file not in lines_per_file:
-                lines_per_file[source_file] = line_num
-            else:
-                lines_per_file[source_file] = max(lines_per_file[source_file], line_num)
+            if source_file is not run_file:
+                if run_file is not None and run_last > lines_per_file.get(run_file, 0):
+                    lines_per_file[run_file] = run_last
+                run_file = source_file
+            run_last = line_num
+        if run_file is not None and run_last > lines_per_file.get(run_file, 0):
+            lines_per_file[run_file] = run_last
 
         # For each file, sort sections by start line and compute end_line
         for file_path, file_sections in sections_by_file.items():
@@ -744,7 +913,7 @@ class AsciidocStructureParser:
         if name is not None:
             attrs["name"] = name
         if fmt is not None:
-            attrs["format"] = fmt
+            attrs["format"] = sys.intern(fmt)
         return Element(
             type=diagram_type,
             source_location=source_location,
@@ -819,6 +988,8 @@ class AsciidocStructureParser:
         warnings: list[ParseWarning] = []
         elements: list[Element] = []
         current_section_path = ""
+        # Headings are resolved to their section path by title
+        title_paths = build_title_path_map(sections)
         pending_code_language: str | None = None
         pending_plantuml_info: tuple[str | None, str | None] | None = None
         pending_mermaid_info: tuple[str | None, str | None] | None = None
@@ -845,54 +1016,44 @@ class AsciidocStructureParser:
             in_any_block = (
                 in_code_block or in_plantuml_block or in_mermaid_block or in_ditaa_block or in_table
             )
-            if not in_any_block:
+            if not in_any_block and line_text.startswith("="):
                 section_match = SECTION_PATTERN.match(line_text)
                 if section_match:
                     title = section_match.group(2).strip()
                     # Apply attribute substitution to section titles so they match
                     # the substituted titles stored in `sections`.
-                    if attributes:
-
-                        def _sub_attr(match: re.Match) -> str:
-                            name = match.group(1)
-                            return attributes.get(name, match.group(0))
-
-                        title = re.sub(r"\{([^}]+)\}", _sub_attr, title)
-                    current_section_path = self._find_section_path(sections, title)
+                    title = self._substitute_attributes(title, attributes)
+                    current_section_path = title_paths.get(title, "")
                     continue
 
-            # Detect code block attribute [source,language]
-            code_attr_match = CODE_BLOCK_START_PATTERN.match(line_text)
-            if code_attr_match:
-                pending_code_language = code_attr_match.group(1)
-                continue
+            # Every element pattern below starts with a fixed character (or
+            # contains "::"), so the first character decides which patterns can
+            # match at all; plain paragraph text skips the regexes entirely
+            first_char = line_text[:1]
 
-            # Detect plantuml block attribute [plantuml,name,format]
-            plantuml_attr_match = PLANTUML_BLOCK_START_PATTERN.match(line_text)
-            if plantuml_attr_match:
-                name = plantuml_attr_match.group(1)
-                fmt = plantuml_attr_match.group(2)
-                pending_plantuml_info = (name, fmt)
-                continue
-
-            # Detect mermaid block attribute [mermaid,name,format]
-            mermaid_attr_match = MERMAID_BLOCK_START_PATTERN.match(line_text)
-            if mermaid_attr_match:
-                name = mermaid_attr_match.group(1)
-                fmt = mermaid_attr_match.group(2)
-                pending_mermaid_info = (name, fmt)
-                continue
-
-            # Detect ditaa block attribute [ditaa,name,format]
-            ditaa_attr_match = DITAA_BLOCK_START_PATTERN.match(line_text)
-            if ditaa_attr_match:
-                name = ditaa_attr_match.group(1)
-                fmt = ditaa_attr_match.group(2)
-                pending_ditaa_info = (name, fmt)
+            # Detect block attribute [source,language] / [plantuml,name,format] /
+            # [mermaid,name,format] / [ditaa,name,format]
+            block_attr_match = (
+                BLOCK_ATTRIBUTE_PATTERN.match(line_text) if first_char == "[" else None
+            )
+            if block_attr_match:
+                diagram = block_attr_match["diagram"]
+                if diagram is None:
+                    # Languages recur across blocks; share one string per language
+                    language = block_attr_match["language"]
+                    pending_code_language = sys.intern(language) if language else None
+                else:
+                    info = (block_attr_match["name"], block_attr_match["format"])
+                    if diagram == "plantuml":
+                        pending_plantuml_info = info
+                    elif diagram == "mermaid":
+                        pending_mermaid_info = info
+                    else:
+                        pending_ditaa_info = info
                 continue
 
             # Detect listing delimiter ----
-            if LISTING_DELIMITER_PATTERN.match(line_text):
+            if first_char == "-" and _is_block_delimiter(line_text):
                 in_any_block = (
                     in_code_block or in_plantuml_block or in_mermaid_block or in_ditaa_block
                 )
@@ -993,7 +1154,7 @@ class AsciidocStructureParser:
                 continue
 
             # Detect table delimiter |===
-            if TABLE_DELIMITER_PATTERN.match(line_text):
+            if line_text == TABLE_DELIMITER:
                 if not in_table:
                     # Start of table
                     in_table = True
@@ -1020,7 +1181,7 @@ class AsciidocStructureParser:
                 continue
 
             # Detect image macro
-            image_match = IMAGE_PATTERN.match(line_text)
+            image_match = IMAGE_PATTERN.match(line_text) if first_char == "i" else None
             if image_match:
                 target = image_match.group(1)
                 alt_text = image_match.group(2) or ""
@@ -1041,9 +1202,11 @@ class AsciidocStructureParser:
                 continue
 
             # Detect admonition
-            admonition_match = ADMONITION_PATTERN.match(line_text)
+            admonition_match = (
+                ADMONITION_PATTERN.match(line_text) if first_char in ADMONITION_CHARS else None
+            )
             if admonition_match:
-                admonition_type = admonition_match.group(1)
+                admonition_type = sys.intern(admonition_match.group(1))
                 content = admonition_match.group(2)
                 source_location = SourceLocation(
                     file=source_file,
@@ -1068,7 +1231,7 @@ class AsciidocStructureParser:
 
             # Detect lists (unordered, ordered, description)
             # Check for unordered list (* item)
-            if UNORDERED_LIST_PATTERN.match(line_text):
+            if first_char == "*" and UNORDERED_LIST_PATTERN.match(line_text):
                 if current_list_type != "unordered":
                     # Save previous list content if any (Issue #159)
                     if current_list_element is not None and list_content:
@@ -1092,7 +1255,7 @@ class AsciidocStructureParser:
                 continue
 
             # Check for ordered list (. item)
-            if ORDERED_LIST_PATTERN.match(line_text):
+            if first_char == "." and ORDERED_LIST_PATTERN.match(line_text):
                 if current_list_type != "ordered":
                     # Save previous list content if any (Issue #159)
                     if current_list_element is not None and list_content:
@@ -1116,7 +1279,7 @@ class AsciidocStructureParser:
                 continue
 
             # Check for description list (term:: definition)
-            if DESCRIPTION_LIST_PATTERN.match(line_text):
+            if "::" in line_text and DESCRIPTION_LIST_PATTERN.match(line_text):
                 if current_list_type != "description":
                     # Start of a new description list
                     current_list_type = "description"
@@ -1189,25 +1352,6 @@ class AsciidocStructureParser:
 
         return elements, warnings
 
-    def _find_section_path(self, sections: list[Section], title: str) -> str:
-        """Find the path of a section by its title.
-
-        Args:
-            sections: List of sections to search
-            title: Title to find
-
-        Returns:
-            Section path or empty string if not found
-        """
-        for section in sections:
-            if section.title == title:
-                return section.path
-            # Search in children
-            result = self._find_section_path(section.children, title)
-            if result:
-                return result
-        return ""
-
     def _parse_cross_references(
         self,
         lines: list[tuple[str, Path, int, SourceLocation | None]],
@@ -21,6 +21,8 @@ Commands (with aliases):
 import json
 import logging
 import sys
+import typing
+from functools import cached_property
 from pathlib import Path
 
 import click
@@ -30,6 +32,7 @@ from dacli.asciidoc_parser import AsciidocStructureParser
 from dacli.file_handler import FileReadError, FileSystemHandler, FileWriteError
 from dacli.markdown_parser import MarkdownStructureParser
 from dacli.mcp_app import _build_index
+from dacli.models import Element
 from dacli.services import (
     compute_hash,
     get_project_metadata,
@@ -74,6 +77,7 @@ def _get_section_append_line(
     section: Section,
     index: StructureIndex,
     file_handler: FileSystemHandler,
+    lines: list[str] | None = None,
 ) -> int:
     """Get the line number where content should be appended (after all descendants).
 
@@ -84,11 +88,17 @@ def _get_section_append_line(
         section: The parent section to append to
         index: Structure index for finding related sections
         file_handler: File handler for reading files
+        lines: Optional already-read file lines, so the file is not read
+               again for sections without an end line
 
     Returns:
         The line number where content should be inserted (1-based)
     """
     file_path = section.source_location.file
+    if not section.has_children:
+        # Leaf section: skip scanning every section of the file for descendants
+        return _get_section_end_line(section, file_path, file_handler, lines)
+
     all_sections = index.get_sections_by_file(file_path)
 
     # Find all descendants (sections whose path starts with parent path)
@@ -111,12 +121,12 @@ def _get_section_append_line(
 
     if not descendants:
         # No children, use section's own end line
-        return _get_section_end_line(section, file_path, file_handler)
+        return _get_section_end_line(section, file_path, file_handler, lines)
 
     # Find the descendant with the highest end line
-    max_end_line = _get_section_end_line(section, file_path, file_handler)
+    max_end_line = _get_section_end_line(section, file_path, file_handler, lines)
     for desc in descendants:
-        desc_end = _get_section_end_line(desc, file_path, file_handler)
+        desc_end = _get_section_end_line(desc, file_path, file_handler, lines)
         if desc_end > max_end_line:
             max_end_line = desc_end
 
@@ -155,6 +165,10 @@ COMMAND_GROUPS = {
 COMMAND_TO_ALIAS = {v: k for k, v in COMMAND_ALIASES.items()}
 
 
+# Element types accepted by the elements command (Issue #225), taken from the
+# Element model so the CLI cannot drift from it (Issue #270)
+VALID_ELEMENT_TYPES = frozenset(typing.get_args(typing.get_type_hints(Element)["type"]))
+
 # Global options that users commonly misplace after the command (Issue #176)
 GLOBAL_OPTIONS = {
     "--format",
@@ -166,6 +180,25 @@ GLOBAL_OPTIONS = {
 }
 
 
+def _validate_non_negative(value: int, name: str, advice: str, param_hint: str) -> None:
+    """Reject negative integer arguments with a uniform error message.
+
+    Args:
+        value: The value given on the command line
+        name: Name used in the message (e.g. "max-depth")
+        advice: Sentence appended to the message explaining valid values
+        param_hint: Parameter hint shown by Click (e.g. "'--max-depth'")
+
+    Raises:
+        click.BadParameter: If value is negative
+    """
+    if value < 0:
+        raise click.BadParameter(
+            f"{name} must be non-negative, got {value}. {advice}",
+            param_hint=param_hint,
+        )
+
+
 class GlobalOptionHintCommand(click.Command):
     """A Click command that hints when users misplace global options."""
 
@@ -284,20 +317,28 @@ class CliContext:
         if not verbose:
             logging.getLogger().setLevel(logging.ERROR)
 
-        self.index = StructureIndex()
         self.file_handler = FileSystemHandler()
         self.asciidoc_parser = AsciidocStructureParser(base_path=docs_root)
         self.markdown_parser = MarkdownStructureParser(base_path=docs_root)
 
-        # Build index
+    @cached_property
+    def index(self) -> StructureIndex:
+        """Structure index of docs_root, built on first access.
+
+        The group callback runs before the subcommand parses its arguments, so
+        building lazily keeps usage errors and rejected option values from
+        scanning and parsing the whole documentation tree first.
+        """
+        index = StructureIndex()
         _build_index(
-            docs_root,
-            self.index,
+            self.docs_root,
+            index,
             self.asciidoc_parser,
             self.markdown_parser,
-            respect_gitignore=respect_gitignore,
-            include_hidden=include_hidden,
+            respect_gitignore=self.respect_gitignore,
+            include_hidden=self.include_hidden,
         )
+        return index
 
 
 def format_output(ctx: CliContext, data: dict) -> str:
@@ -427,11 +468,12 @@ Examples:
 def structure(ctx: CliContext, max_depth: int | None):
     """Get the hierarchical document structure."""
     # Validate max_depth is non-negative (Issue #248)
-    if max_depth is not None and max_depth < 0:
-        raise click.BadParameter(
-            f"max-depth must be non-negative, got {max_depth}. "
+    if max_depth is not None:
+        _validate_non_negative(
+            max_depth,
+            "max-depth",
             "Use 0 for root level only, or omit for full depth.",
-            param_hint="'--max-depth'",
+            "'--max-depth'",
         )
     result = ctx.index.get_structure(max_depth)
     click.echo(format_output(ctx, result))
@@ -531,12 +573,12 @@ def sections_at_level(ctx: CliContext, level: int):
     LEVEL must be a non-negative integer (0, 1, 2, ...).
     """
     # Validate level is non-negative (Issue #199)
-    if level < 0:
-        raise click.BadParameter(
-            f"Level must be non-negative, got {level}. "
-            "Document hierarchies start at level 0 (document root).",
-            param_hint="level",
-        )
+    _validate_non_negative(
+        level,
+        "Level",
+        "Document hierarchies start at level 0 (document root).",
+        "level",
+    )
 
     sections = ctx.index.get_sections_at_level(level)
     result = {
@@ -565,12 +607,12 @@ Examples:
 def search(ctx: CliContext, query: str, scope: str | None, max_results: int):
     """Search for content in the documentation."""
     # Validate max_results is non-negative (Issue #249)
-    if max_results < 0:
-        raise click.BadParameter(
-            f"limit must be non-negative, got {max_results}. "
-            "Use 0 for no results, or a positive number to limit results.",
-            param_hint="'--limit'",
-        )
+    _validate_non_negative(
+        max_results,
+        "limit",
+        "Use 0 for no results, or a positive number to limit results.",
+        "'--limit'",
+    )
     # Validate query is not empty
     if not query or not query.strip():
         click.echo("Error: Search query cannot be empty", err=True)
@@ -625,7 +667,7 @@ Examples:
     "--type",
     "element_type",
     default=None,
-    help="Element type: admonition, blockquote, code, image, list, plantuml, table",
+    help=f"Element type: {', '.join(sorted(VALID_ELEMENT_TYPES))}",
 )
 @click.option(
     "--recursive", is_flag=True, default=False, help="Include elements from child sections"
@@ -650,9 +692,8 @@ def elements(
 ):
     """Get elements (code blocks, tables, images) from documentation."""
     # Issue #225: Validate element type and warn if invalid
-    valid_types = {"code", "table", "image", "plantuml", "admonition", "list", "blockquote"}
-    if element_type is not None and element_type not in valid_types:
-        valid_list = ", ".join(sorted(valid_types))
+    if element_type is not None and element_type not in VALID_ELEMENT_TYPES:
+        valid_list = ", ".join(sorted(VALID_ELEMENT_TYPES))
         click.echo(f"Warning: Unknown element type '{element_type}'. Valid types are: {valid_list}")
 
     elems = ctx.index.get_elements(
@@ -840,7 +881,7 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
         elif position == "after":
             # Issue #223: Insert after the section AND all its children
             # Use _get_section_append_line to find the end of all descendants
-            after_line = _get_section_append_line(section_obj, ctx.index, ctx.file_handler)
+            after_line = _get_section_append_line(section_obj, ctx.index, ctx.file_handler, lines)
             insert_line = after_line + 1
             # Add blank line before headings if previous line is not blank
             if starts_with_heading and after_line > 0:
@@ -854,7 +895,7 @@ def insert(ctx: CliContext, path: str, position: str, content: str):
                 insert_content = ensure_trailing_blank_line(insert_content)
             new_lines = lines[:after_line] + [insert_content] + lines[after_line:]
         else:  # append - insert after all descendants
-            append_line = _get_section_append_line(section_obj, ctx.index, ctx.file_handler)
+            append_line = _get_section_append_line(section_obj, ctx.index, ctx.file_handler, lines)
             insert_line = append_line + 1
             # Add blank line before headings if previous line is not blank
             if starts_with_heading and append_line > 0:
@@ -11,8 +11,12 @@ This module provides safe file operations with:
 import logging
 import os
 import shutil
+from collections.abc import Iterable
 from pathlib import Path
 
+from dacli.asciidoc_parser import AsciidocStructureParser
+from dacli.markdown_parser import MarkdownStructureParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,7 +114,7 @@ class FileSystemHandler:
         # Convert to 0-based index and extract range
         return lines[start - 1 : end]
 
-    def write_file(self, path: Path | str, content: str) -> None:
+    def write_file(self, path: Path | str, content: str | Iterable[str]) -> None:
         """Write content to file atomically using backup-and-replace.
 
         Implements ADR-004 atomic write strategy:
@@ -120,9 +124,13 @@ class FileSystemHandler:
         4. Delete backup
         5. On error: restore backup, cleanup temp
 
+        Cached parse results of the file are dropped afterwards, whether or
+        not the write succeeded.
+
         Args:
             path: Path to the file
-            content: Content to write
+            content: Content to write, either a string or an iterable of
+                     strings (e.g. lines with newlines) written in order
 
         Raises:
             FileWriteError: If write operation fails
@@ -144,8 +152,12 @@ class FileSystemHandler:
 
             # Step 2: Write to temporary file
             try:
-                temp_path.write_text(content, encoding="utf-8")
-                temp_created = True
+                with temp_path.open("w", encoding="utf-8") as f:
+                    temp_created = True
+                    if isinstance(content, str):
+                        f.write(content)
+                    else:
+                        f.writelines(content)
                 logger.debug(f"Wrote temp file: {temp_path}")
             except PermissionError as e:
                 raise FileWriteError(f"Permission denied writing to {temp_path}") from e
@@ -179,6 +191,10 @@ class FileSystemHandler:
             # Unexpected error - cleanup and wrap
             self._cleanup_on_error(path, backup_path, temp_path, backup_created, temp_created)
             raise FileWriteError(f"Unexpected error writing {path}: {e}") from e
+        finally:
+            # The stamp check misses edits within one timestamp tick
+            AsciidocStructureParser.invalidate(path)
+            MarkdownStructureParser.invalidate(path)
 
     def _cleanup_on_error(
         self,
@@ -256,16 +272,8 @@ class FileSystemHandler:
         if end_line > total_lines:
             raise ValueError(f"End line ({end_line}) exceeds file length ({total_lines} lines)")
 
-        # Build new content:
-        # - Lines before start_line
-        # - New content
-        # - Lines after end_line
-        new_lines = (
-            lines[: start_line - 1]  # Lines before (0-indexed)
-            + [new_content]  # New content (should include newlines)
-            + lines[end_line:]  # Lines after (0-indexed, end_line is exclusive)
-        )
-
-        # Join and write
-        new_file_content = "".join(new_lines)
-        self.write_file(path, new_file_content)
+        # Replace the line range in place with the new content
+        # (0-indexed slice, end_line is exclusive; content should include newlines)
+        lines[start_line - 1 : end_line] = [new_content]
+
+        self.write_file(path, lines)
@@ -53,7 +53,7 @@ def _is_hidden_path(path: Path, root: Path) -> bool:
 
 def find_doc_files(
     docs_root: Path,
-    pattern: str,
+    pattern: str | tuple[str, ...],
     *,
     respect_gitignore: bool = True,
     include_hidden: bool = False,
@@ -65,9 +65,13 @@ def find_doc_files(
     - Respecting .gitignore patterns (when respect_gitignore=True)
     - Skipping hidden directories (when include_hidden=False)
 
+    Several patterns can be passed as a tuple; the tree is then walked only
+    once and each file is matched against all patterns.
+
     Args:
         docs_root: Root directory to scan
-        pattern: Glob pattern for files (e.g., "*.adoc", "*.md")
+        pattern: Glob pattern for files (e.g., "*.adoc", "*.md"), or a tuple
+                 of patterns (e.g., ("*.adoc", "*.md"))
         respect_gitignore: If True, exclude files matching .gitignore patterns
         include_hidden: If True, include files in hidden directories
 
@@ -77,8 +81,15 @@ def find_doc_files(
     # Load gitignore spec if requested
     gitignore_spec = load_gitignore_spec(docs_root) if respect_gitignore else None
 
+    # A single pattern is handed to rglob directly; multiple patterns share one walk
+    patterns = (pattern,) if isinstance(pattern, str) else pattern
+    walk_pattern = patterns[0] if len(patterns) == 1 else "*"
+
     # Scan for files
-    for file_path in docs_root.rglob(pattern):
+    for file_path in docs_root.rglob(walk_pattern):
+        if len(patterns) > 1 and not any(file_path.match(p) for p in patterns):
+            continue
+
         # Skip hidden directories unless explicitly included
         if not include_hidden and _is_hidden_path(file_path, docs_root):
             continue
@@ -12,6 +12,9 @@ Key differences from AsciiDoc parser:
 
 import logging
 import re
+import string
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -20,7 +23,9 @@ import yaml
 
 from dacli.models import Element, Section, SourceLocation
 from dacli.parser_utils import (
+    build_title_path_map,
     collect_all_sections,
+    file_stamp,
     find_section_by_path,
     slugify,
     strip_doc_extension,
@@ -31,7 +36,15 @@ logger = logging.getLogger(__name__)
 # Regex patterns from spec
 HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#+)?$")
 FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*(?:\n|$)", re.DOTALL)
-CODE_FENCE_PATTERN = re.compile(r"^(`{3,}|~{3,})([a-zA-Z0-9_+-]*)?\s*$")
+# Code fences (```lang or ~~~lang) are matched by _match_code_fence without a regex
+CODE_FENCE_CHARS = ("`", "~")
+CODE_FENCE_MIN_LENGTH = 3
+CODE_FENCE_INFO_CHARS = frozenset(string.ascii_letters + string.digits + "_+-")
+# Line classes produced by _scan_code_fences
+_TEXT_LINE = 0
+_FENCE_OPEN = 1
+_FENCE_CLOSE = 2
+_CODE_LINE = 3
 # Issue #214: HTML comment patterns
 HTML_COMMENT_START = "<!--"
 HTML_COMMENT_END = "-->"
@@ -42,13 +55,24 @@ TABLE_SEPARATOR_PATTERN = re.compile(r"^\|[\s:|-]+\|$")
 IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)\s]+)(?:\s+\"([^\"]*)\")?\)")
 
 # List patterns
-TASK_LIST_PATTERN = re.compile(r"^[\s]*-\s+\[([ xX])\]\s+.+$")
-UNORDERED_LIST_PATTERN = re.compile(r"^[\s]*[-*+]\s+.+$")
-ORDERED_LIST_PATTERN = re.compile(r"^[\s]*\d+\.\s+.+$")
+# One regex classifies a list item; the name of the matching group is the
+# list type. Task items are tried first since they also look like unordered items.
+LIST_ITEM_PATTERN = re.compile(
+    r"^[\s]*(?:(?P<task>-\s+\[[ xX]\]\s+.+)"
+    r"|(?P<unordered>[-*+]\s+.+)"
+    r"|(?P<ordered>\d+\.\s+.+))$"
+)
+# Markers that can start a bullet or task item (ordered items start with a digit)
+BULLET_MARKERS = ("-", "*", "+")
+# Characters allowed between the brackets of a task item ("- [ ]", "- [x]")
+TASK_STATES = " xX"
 
 # Blockquote pattern
 BLOCKQUOTE_PATTERN = re.compile(r"^>\s?(.*)$")
 
+# Numeric file name prefix used for sorting (e.g. "01_intro.md")
+NUMERIC_PREFIX_PATTERN = re.compile(r"^(\d+)[_-](.+)$")
+
 # Setext heading patterns (for warning detection - not supported)
 # H1: line of text followed by line of ='s (at least 3)
 SETEXT_H1_UNDERLINE = re.compile(r"^={3,}\s*$")
@@ -56,7 +80,97 @@ SETEXT_H1_UNDERLINE = re.compile(r"^={3,}\s*$")
 SETEXT_H2_UNDERLINE = re.compile(r"^-{3,}\s*$")
 
 
-@dataclass
+def _classify_list_item(line: str) -> str | None:
+    """Return the list type of a list item line.
+
+    Plain task items ("- [ ] text", "- [x] text") are recognized by slicing;
+    all other candidates are classified by LIST_ITEM_PATTERN.
+
+    Args:
+        line: Line to classify (may be indented)
+
+    Returns:
+        "task", "unordered" or "ordered", or None if the line is no list item
+    """
+    stripped = line.lstrip()
+    marker = stripped[:1]
+    if (
+        marker == "-"
+        and len(stripped) > 6
+        and stripped[1:3] == " ["
+        and stripped[3] in TASK_STATES
+        and stripped[4:6] == "] "
+    ):
+        return "task"
+    if marker in BULLET_MARKERS or marker.isdecimal():
+        list_match = LIST_ITEM_PATTERN.match(line)
+        if list_match:
+            return list_match.lastgroup
+    return None
+
+
+def _match_code_fence(line: str) -> tuple[str, str] | None:
+    """Match a code fence line such as "```python" or "~~~".
+
+    A fence is at least CODE_FENCE_MIN_LENGTH backticks or tildes, directly
+    followed by an optional language made of CODE_FENCE_INFO_CHARS and
+    optional trailing whitespace.
+
+    Args:
+        line: Line to check
+
+    Returns:
+        Tuple of (fence, language) with an empty language for bare fences,
+        or None if the line is not a code fence
+    """
+    if not line.startswith(CODE_FENCE_CHARS):
+        return None
+    info = line.lstrip(line[0])
+    fence_length = len(line) - len(info)
+    if fence_length < CODE_FENCE_MIN_LENGTH:
+        return None
+    info = info.rstrip()
+    if not CODE_FENCE_INFO_CHARS.issuperset(info):
+        return None
+    return line[:fence_length], info
+
+
+def _scan_code_fences(lines: list[str]) -> bytearray:
+    """Classify every line as text, code fence or code block content.
+
+    Fences are tracked once per document so that the section and element
+    passes can skip code blocks with a lookup instead of tracking fences
+    themselves. A block is closed by a fence of the same character that is
+    at least as long as the opening fence; other fence lines inside the
+    block are content.
+
+    Args:
+        lines: Document lines
+
+    Returns:
+        One entry per line: _TEXT_LINE, _FENCE_OPEN, _FENCE_CLOSE or _CODE_LINE
+    """
+    marks = bytearray(len(lines))
+    open_fence = ""
+    for i, line in enumerate(lines):
+        fence_match = _match_code_fence(line)
+        if not open_fence:
+            if fence_match:
+                open_fence = fence_match[0]
+                marks[i] = _FENCE_OPEN
+        elif (
+            fence_match
+            and fence_match[0][0] == open_fence[0]
+            and len(fence_match[0]) >= len(open_fence)
+        ):
+            open_fence = ""
+            marks[i] = _FENCE_CLOSE
+        else:
+            marks[i] = _CODE_LINE
+    return marks
+
+
+@dataclass(slots=True)
 class MarkdownDocument:
     """A parsed Markdown document.
 
@@ -75,7 +189,7 @@ class MarkdownDocument:
     elements: list[Element] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderDocument:
     """A document composed of multiple Markdown files in a folder.
 
@@ -104,7 +218,14 @@ class MarkdownStructureParser:
                    If not provided, file paths are relative to the file's parent.
     """
 
-    def __init__(self, base_path: Path | None = None):
+    # Parsed documents keyed by (file path, base path), stored with the
+    # file's stamp so an unchanged file is not parsed again on re-indexing
+    _parse_cache: OrderedDict[
+        tuple[str, str], tuple[tuple[int, int, int, int], MarkdownDocument]
+    ] = OrderedDict()
+    _PARSE_CACHE_SIZE = 256
+
+    def __init__(self, base_path: Path | None = None) -> None:
         """Initialize the parser.
 
         Args:
@@ -113,6 +234,26 @@ class MarkdownStructureParser:
         """
         self.base_path = base_path
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parse results."""
+        cls._parse_cache.clear()
+
+    @classmethod
+    def invalidate(cls, file_path: Path) -> None:
+        """Drop cached results of a file the process just wrote.
+
+        An edit within one timestamp tick leaves the file stamp unchanged,
+        so the stamp check alone would keep serving the old document.
+
+        Args:
+            file_path: Path of the written file
+        """
+        written = file_path.absolute()
+        stale = [key for key in cls._parse_cache if Path(key[0]).absolute() == written]
+        for key in stale:
+            del cls._parse_cache[key]
+
     def _get_file_prefix(self, file_path: Path) -> str:
         """Calculate file prefix for path generation (Issue #130, ADR-008).
 
@@ -140,6 +281,11 @@ class MarkdownStructureParser:
     def parse_file(self, file_path: Path) -> MarkdownDocument:
         """Parse a single Markdown file.
 
+        Results are cached per file. A cached document is returned as long as
+        the file has the same modification time and size as when it was
+        parsed. The returned document is shared between callers and must not
+        be modified.
+
         Args:
             file_path: Path to the Markdown file
 
@@ -150,27 +296,65 @@ class MarkdownStructureParser:
             FileNotFoundError: If file doesn't exist
             UnicodeDecodeError: If file has invalid encoding
         """
+        cache_key = (str(file_path), str(self.base_path))
+        stamp = file_stamp(file_path)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None and stamp is not None and cached[0] == stamp:
+            self._parse_cache.move_to_end(cache_key)
+            return cached[1]
+
         content = file_path.read_text(encoding="utf-8")
+        doc = self.parse_string(content, file_path)
+
+        if stamp is not None:
+            self._parse_cache[cache_key] = (stamp, doc)
+            self._parse_cache.move_to_end(cache_key)
+            if len(self._parse_cache) > self._PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        return doc
+
+    def parse_string(self, content: str, file_path: Path = Path("document.md")) -> MarkdownDocument:
+        """Parse Markdown content that is already in memory.
+
+        The file path is only used for section paths and source locations;
+        nothing is read from disk and the result is not cached.
+
+        Args:
+            content: Markdown source text
+            file_path: Path the content is attributed to
 
+        Returns:
+            Parsed MarkdownDocument
+        """
         # Parse frontmatter first
         frontmatter, content_without_frontmatter = self._parse_frontmatter(content)
 
-        lines = content_without_frontmatter.splitlines()
+        # Split the file once; the frontmatter always ends at a line break,
+        # so the body lines are a tail of all lines
+        all_lines = content.splitlines()
+        total_lines = len(all_lines)
 
         # Calculate line offset from frontmatter
-        frontmatter_lines = len(content.splitlines()) - len(lines)
+        frontmatter_length = len(content) - len(content_without_frontmatter)
+        frontmatter_lines = len(content[:frontmatter_length].splitlines())
+        lines = all_lines[frontmatter_lines:] if frontmatter_lines else all_lines
+
+        # Locate code blocks once for both passes below
+        fence_marks = _scan_code_fences(lines)
 
         # Parse sections (headings)
         sections, heading_title = self._parse_sections(
-            lines, file_path, line_offset=frontmatter_lines
+            lines, file_path, line_offset=frontmatter_lines, fence_marks=fence_marks
         )
 
         # Calculate end_line for all sections
-        total_lines = len(content.splitlines())
         self._compute_end_lines(sections, file_path, total_lines)
 
         # Parse elements (code blocks, tables, images)
-        elements = self._parse_elements(lines, file_path, sections, line_offset=frontmatter_lines)
+        elements = self._parse_elements(
+            lines, file_path, sections, line_offset=frontmatter_lines, fence_marks=fence_marks
+        )
 
         # Title priority: frontmatter > first H1 > empty
         title = frontmatter.get("title", heading_title)
@@ -280,7 +464,11 @@ class MarkdownStructureParser:
         return frontmatter, content_without_frontmatter
 
     def _parse_sections(
-        self, lines: list[str], file_path: Path, line_offset: int = 0
+        self,
+        lines: list[str],
+        file_path: Path,
+        line_offset: int = 0,
+        fence_marks: bytearray | None = None,
     ) -> tuple[list[Section], str]:
         """Parse headings into hierarchical sections.
 
@@ -288,6 +476,7 @@ class MarkdownStructureParser:
             lines: Document lines
             file_path: Source file path
             line_offset: Line offset from frontmatter
+            fence_marks: Result of _scan_code_fences(lines), computed if omitted
 
         Returns:
             Tuple of (sections list, document title)
@@ -309,7 +498,10 @@ class MarkdownStructureParser:
             return [root_section], filename
 
         sections: list[Section] = []
+        # Open sections and their levels, kept as parallel stacks so finding
+        # the parent compares plain ints instead of reading Section.level
         section_stack: list[Section] = []
+        level_stack: list[int] = []
         document_title = ""
         # Track used paths for disambiguation (Issue #123)
         used_paths: dict[str, int] = {}
@@ -329,22 +521,15 @@ class MarkdownStructureParser:
         # Track previous lines for Setext detection
         prev_line = ""
         prev_prev_line = ""
-        # Issue #207: Track code fence state to avoid parsing headings inside code blocks
-        in_code_block = False
+        # Issue #207: Code fences and code blocks never contain headings
+        if fence_marks is None:
+            fence_marks = _scan_code_fences(lines)
         # Issue #214: Track HTML comment state to avoid parsing headings inside comments
         in_html_comment = False
 
-        for line_num, line in enumerate(lines, start=1 + line_offset):
-            # Issue #207: Track code fences (```)
-            fence_match = CODE_FENCE_PATTERN.match(line)
-            if fence_match:
-                in_code_block = not in_code_block
-                prev_prev_line = prev_line
-                prev_line = line
-                continue
-
-            # Issue #207: Skip heading detection inside code blocks
-            if in_code_block:
+        for line_num, (mark, line) in enumerate(zip(fence_marks, lines), start=1 + line_offset):
+            # Issue #207: Skip heading detection on fences and inside code blocks
+            if mark != _TEXT_LINE:
                 prev_prev_line = prev_line
                 prev_line = line
                 continue
@@ -368,14 +553,20 @@ class MarkdownStructureParser:
                     prev_line = line
                     continue
                 # Issue #246: Inline comment closes on same line.
-                # Strip comment(s) and continue to heading detection.
-                line = INLINE_HTML_COMMENT.sub("", line).strip()
+                # Strip comment(s) and continue to heading detection. The first
+                # comment is cut at the offsets found above; the regex only
+                # runs when further comments follow on the line.
+                rest = line[end_idx + len(HTML_COMMENT_END) :]
+                if HTML_COMMENT_START in rest:
+                    rest = INLINE_HTML_COMMENT.sub("", rest)
+                line = (line[:start_idx] + rest).strip()
 
             # Detect Setext headings and warn (not supported per spec)
             self._warn_setext_heading(line, prev_line, prev_prev_line, line_num, file_path)
             prev_prev_line = prev_line
             prev_line = line
-            match = HEADING_PATTERN.match(line)
+            # Headings must start with '#'; skip the regex for all other lines
+            match = HEADING_PATTERN.match(line) if line.startswith("#") else None
             if not match:
                 continue
 
@@ -400,8 +591,9 @@ class MarkdownStructureParser:
             )
 
             # Find parent section based on level
-            while section_stack and section_stack[-1].level >= level:
+            while level_stack and level_stack[-1] >= level:
                 section_stack.pop()
+                level_stack.pop()
 
             if section_stack:
                 section_stack[-1].children.append(section)
@@ -409,6 +601,7 @@ class MarkdownStructureParser:
                 sections.append(section)
 
             section_stack.append(section)
+            level_stack.append(level)
 
         return sections, document_title
 
@@ -499,6 +692,7 @@ class MarkdownStructureParser:
         file_path: Path,
         sections: list[Section],
         line_offset: int = 0,
+        fence_marks: bytearray | None = None,
     ) -> list[Element]:
         """Parse extractable elements from document.
 
@@ -507,15 +701,18 @@ class MarkdownStructureParser:
             file_path: Source file path
             sections: Parsed sections for parent context
             line_offset: Line offset from frontmatter
+            fence_marks: Result of _scan_code_fences(lines), computed if omitted
 
         Returns:
             List of extracted elements
         """
         elements: list[Element] = []
         current_section_path = ""
+        # Headings are resolved to their section path by title
+        title_paths = build_title_path_map(sections)
+        if fence_marks is None:
+            fence_marks = _scan_code_fences(lines)
         in_code_block = False
-        code_fence_char = ""
-        code_fence_count = 0
         code_block_start_line = 0
         code_block_language: str | None = None
         code_block_content: list[str] = []
@@ -541,10 +738,12 @@ class MarkdownStructureParser:
         table_content: list[str] = []
         list_content: list[str] = []
 
-        for line_num, line in enumerate(lines, start=1 + line_offset):
+        for line_num, (mark, line) in enumerate(zip(fence_marks, lines), start=1 + line_offset):
             # Track current section
-            heading_match = HEADING_PATTERN.match(line)
-            if heading_match and not in_code_block:
+            heading_match = (
+                HEADING_PATTERN.match(line) if mark == _TEXT_LINE and line.startswith("#") else None
+            )
+            if heading_match:
                 # If we were in a table, finalize it before starting a new heading.
                 if in_table:
                     if has_separator:
@@ -570,50 +769,48 @@ class MarkdownStructureParser:
                     table_rows = 0
                     has_separator = False
                 title = heading_match.group(2).strip()
-                current_section_path = self._find_section_path(sections, title)
+                current_section_path = title_paths.get(title, "")
                 continue
 
+            # Each element pattern below is only tried when the line can start
+            # (or contain) its marker, so plain paragraph lines skip the regexes
+
             # Handle code blocks
-            fence_match = CODE_FENCE_PATTERN.match(line)
-            if fence_match:
-                fence_char = fence_match.group(1)[0]
-                fence_count = len(fence_match.group(1))
-
-                if not in_code_block:
-                    # Opening fence
-                    in_code_block = True
-                    code_fence_char = fence_char
-                    code_fence_count = fence_count
-                    code_block_start_line = line_num
-                    code_block_language = fence_match.group(2) or None
-                    code_block_content = []
-                elif fence_char == code_fence_char and fence_count >= code_fence_count:
-                    # Closing fence
-                    elements.append(
-                        Element(
-                            type="code",
-                            source_location=SourceLocation(
-                                file=file_path,
-                                line=code_block_start_line,
-                                end_line=line_num,  # Closing fence line
-                            ),
-                            attributes={
-                                "language": code_block_language,
-                                "content": "\n".join(code_block_content),
-                            },
-                            parent_section=current_section_path,
-                        )
+            if mark == _FENCE_OPEN:
+                _, language = _match_code_fence(line)
+                in_code_block = True
+                code_block_start_line = line_num
+                # Languages recur across blocks; share one string per language
+                code_block_language = sys.intern(language) if language else None
+                code_block_content = []
+                continue
+
+            if mark == _FENCE_CLOSE:
+                elements.append(
+                    Element(
+                        type="code",
+                        source_location=SourceLocation(
+                            file=file_path,
+                            line=code_block_start_line,
+                            end_line=line_num,  # Closing fence line
+                        ),
+                        attributes={
+                            "language": code_block_language,
+                            "content": "\n".join(code_block_content),
+                        },
+                        parent_section=current_section_path,
                     )
-                    in_code_block = False
+                )
+                in_code_block = False
                 continue
 
             # Collect content inside code blocks
-            if in_code_block:
+            if mark == _CODE_LINE:
                 code_block_content.append(line)
                 continue
 
             # Handle tables
-            table_row_match = TABLE_ROW_PATTERN.match(line)
+            table_row_match = TABLE_ROW_PATTERN.match(line) if line.startswith("|") else None
             if table_row_match:
                 table_end_line = line_num  # Update end_line for each row
                 if not in_table:
@@ -656,7 +853,7 @@ class MarkdownStructureParser:
                 in_table = False
 
             # Handle images
-            image_match = IMAGE_PATTERN.search(line)
+            image_match = IMAGE_PATTERN.search(line) if "![" in line else None
             if image_match:
                 image_attributes = {
                     "alt": image_match.group(1),
@@ -684,8 +881,8 @@ class MarkdownStructureParser:
                 continue
 
             # Handle blockquotes (Issue #28)
-            blockquote_match = BLOCKQUOTE_PATTERN.match(line)
-            if blockquote_match and not in_code_block and not in_table:
+            blockquote_match = BLOCKQUOTE_PATTERN.match(line) if line.startswith(">") else None
+            if blockquote_match and not in_table:
                 # Finalize any open list before starting blockquote
                 if current_list_element is not None and list_content:
                     current_list_element.attributes["content"] = "\n".join(list_content)
@@ -719,70 +916,22 @@ class MarkdownStructureParser:
                 blockquote_content = []
 
             # Handle lists (unordered, ordered, and task lists)
-            if not in_code_block and not in_table:
-                # Check for task list (- [ ] or - [x]) before unordered list
-                # since task list items also match unordered list pattern
-                if TASK_LIST_PATTERN.match(line):
-                    if current_list_type != "task":
-                        # Save previous list content if any (Issue #159)
-                        if current_list_element is not None and list_content:
-                            current_list_element.attributes["content"] = "\n".join(list_content)
-                        current_list_type = "task"
-                        list_content = []
-                        element = Element(
-                            type="list",
-                            source_location=SourceLocation(
-                                file=file_path, line=line_num, end_line=line_num
-                            ),
-                            attributes={"list_type": "task"},
-                            parent_section=current_section_path,
-                        )
-                        elements.append(element)
-                        current_list_element = element
-                    list_content.append(line)
-                    if current_list_element is not None:
-                        current_list_element.source_location.end_line = line_num
-                    continue
-
-                # Check for unordered list (*, -, +)
-                if UNORDERED_LIST_PATTERN.match(line):
-                    if current_list_type != "unordered":
+            if not in_table:
+                # "task", "unordered", "ordered" or None
+                list_type = _classify_list_item(line)
+                if list_type:
+                    if current_list_type != list_type:
                         # Save previous list content if any (Issue #159)
                         if current_list_element is not None and list_content:
                             current_list_element.attributes["content"] = "\n".join(list_content)
-                        current_list_type = "unordered"
+                        current_list_type = list_type
                         list_content = []  # Initialize content tracking (Issue #159)
                         element = Element(
                             type="list",
                             source_location=SourceLocation(
                                 file=file_path, line=line_num, end_line=line_num
                             ),
-                            attributes={"list_type": "unordered"},
-                            parent_section=current_section_path,
-                        )
-                        elements.append(element)
-                        current_list_element = element
-                    # Collect list item content (Issue #159)
-                    list_content.append(line)
-                    # Update end_line for each list item
-                    if current_list_element is not None:
-                        current_list_element.source_location.end_line = line_num
-                    continue
-
-                # Check for ordered list (1., 2., etc.)
-                if ORDERED_LIST_PATTERN.match(line):
-                    if current_list_type != "ordered":
-                        # Save previous list content if any (Issue #159)
-                        if current_list_element is not None and list_content:
-                            current_list_element.attributes["content"] = "\n".join(list_content)
-                        current_list_type = "ordered"
-                        list_content = []  # Initialize content tracking (Issue #159)
-                        element = Element(
-                            type="list",
-                            source_location=SourceLocation(
-                                file=file_path, line=line_num, end_line=line_num
-                            ),
-                            attributes={"list_type": "ordered"},
+                            attributes={"list_type": list_type},
                             parent_section=current_section_path,
                         )
                         elements.append(element)
@@ -934,29 +1083,11 @@ class MarkdownStructureParser:
         Returns:
             Tuple of (number or None, rest of name)
         """
-        match = re.match(r"^(\d+)[_-](.+)$", name)
+        match = NUMERIC_PREFIX_PATTERN.match(name)
         if match:
             return int(match.group(1)), match.group(2)
         return None, name
 
-    def _find_section_path(self, sections: list[Section], title: str) -> str:
-        """Find section path by title.
-
-        Args:
-            sections: Sections to search
-            title: Title to find
-
-        Returns:
-            Section path or empty string
-        """
-        for section in sections:
-            if section.title == title:
-                return section.path
-            found = self._find_section_path(section.children, title)
-            if found:
-                return found
-        return ""
-
     def _build_path(
         self, section_stack: list[Section], title: str, level: int, file_prefix: str
     ) -> str:
@@ -980,7 +1111,7 @@ class MarkdownStructureParser:
         slug = slugify(title)
 
         # Find ancestors at lower levels
-        ancestors = []
+        ancestors: list[Section] = []
         for s in section_stack:
             if s.level < level:
                 ancestors.append(s)
@@ -52,6 +52,7 @@ def _get_section_append_line(
     section: Section,
     index: StructureIndex,
     file_handler,
+    lines: list[str] | None = None,
 ) -> int:
     """Get the line number where content should be appended (after all descendants).
 
@@ -62,11 +63,17 @@ def _get_section_append_line(
         section: The parent section to append to
         index: Structure index for finding related sections
         file_handler: File handler for reading files
+        lines: Optional already-read file lines, so the file is not read
+               again for sections without an end line
 
     Returns:
         The line number where content should be inserted (1-based)
     """
     file_path = section.source_location.file
+    if not section.has_children:
+        # Leaf section: skip scanning every section of the file for descendants
+        return _get_section_end_line(section, file_path, file_handler, lines)
+
     all_sections = index.get_sections_by_file(file_path)
 
     # Find all descendants (sections whose path starts with parent path)
@@ -88,12 +95,12 @@ def _get_section_append_line(
 
     if not descendants:
         # No children, use section's own end line
-        return _get_section_end_line(section, file_path, file_handler)
+        return _get_section_end_line(section, file_path, file_handler, lines)
 
     # Find the descendant with the highest end line
-    max_end_line = _get_section_end_line(section, file_path, file_handler)
+    max_end_line = _get_section_end_line(section, file_path, file_handler, lines)
     for desc in descendants:
-        desc_end = _get_section_end_line(desc, file_path, file_handler)
+        desc_end = _get_section_end_line(desc, file_path, file_handler, lines)
         if desc_end > max_end_line:
             max_end_line = desc_end
 
@@ -531,7 +538,7 @@ def create_mcp_server(
                 new_lines = lines[: start_line - 1] + [insert_content] + lines[start_line - 1 :]
             elif position == "after":
                 # Issue #229: Insert after the section AND all its children
-                after_line = _get_section_append_line(section, index, file_handler)
+                after_line = _get_section_append_line(section, index, file_handler, lines)
                 insert_line = after_line + 1
                 # Issue #232: Add blank line before heading if previous line not blank
                 if starts_with_heading and after_line > 0:
@@ -545,7 +552,7 @@ def create_mcp_server(
                 new_lines = lines[:after_line] + [insert_content] + lines[after_line:]
             else:  # append
                 # Issue #229: Append after all descendants
-                append_line = _get_section_append_line(section, index, file_handler)
+                append_line = _get_section_append_line(section, index, file_handler, lines)
                 insert_line = append_line
                 # Issue #232: Add blank line before heading if previous line not blank
                 if starts_with_heading and append_line > 0:
@@ -664,9 +671,13 @@ def _build_index(
 
     # Scan for include directives to identify included files (Issue #184)
     # Included files should not be parsed as separate root documents
+    # Each file is scanned once; the results also feed the cycle detection below
+    includes_by_file = {
+        adoc_file: AsciidocStructureParser.scan_includes(adoc_file) for adoc_file in all_adoc_files
+    }
     included_files: set[Path] = set()
-    for adoc_file in all_adoc_files:
-        included_files.update(AsciidocStructureParser.scan_includes(adoc_file))
+    for includes in includes_by_file.values():
+        included_files.update(includes)
 
     # Filter: only parse files that are NOT included by others (Issue #184)
     root_adoc_files = [f for f in all_adoc_files if f not in included_files]
@@ -677,10 +688,8 @@ def _build_index(
     circular_include_errors: list[dict] = []
     if all_adoc_files:
         include_graph: dict[Path, set[Path]] = {}
-        for adoc_file in all_adoc_files:
-            resolved = adoc_file.resolve()
-            includes = AsciidocStructureParser.scan_includes(adoc_file)
-            include_graph[resolved] = includes
+        for adoc_file, includes in includes_by_file.items():
+            include_graph[adoc_file.resolve()] = includes
 
         circular_files: set[Path] = set()
         visited: set[Path] = set()
@@ -1,7 +1,8 @@
 """Core data models for MCP Documentation Server.
 
 This module defines the shared data models used across all parsers and services.
-All models are implemented as dataclasses for simplicity and spec conformity.
+All models are implemented as slotted dataclasses for simplicity and spec conformity;
+slots keep the many Section and Element instances of a large index small.
 JSON serialization is provided via the model_to_dict() helper function.
 
 Models:
@@ -12,7 +13,7 @@ Models:
 - Document: Base class for parsed documents
 """
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
 from typing import Any, Literal
@@ -25,7 +26,7 @@ class WarningType(Enum):
     UNCLOSED_TABLE = "unclosed_table"
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceLocation:
     """Position in a source document.
 
@@ -46,7 +47,7 @@ class SourceLocation:
     resolved_from: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A hierarchical section in a document.
 
@@ -69,8 +70,13 @@ class Section:
     children: list["Section"] = field(default_factory=list)
     anchor: str | None = None
 
+    @property
+    def has_children(self) -> bool:
+        """Whether this section has sub-sections, without walking them."""
+        return bool(self.children)
 
-@dataclass
+
+@dataclass(slots=True)
 class Element:
     """An extractable content element.
 
@@ -92,7 +98,7 @@ class Element:
     index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossReference:
     """A cross-reference in a document.
 
@@ -112,7 +118,7 @@ class CrossReference:
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseWarning:
     """A warning detected during document parsing.
 
@@ -131,7 +137,7 @@ class ParseWarning:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Base class for parsed documents.
 
@@ -156,7 +162,8 @@ def model_to_dict(obj: Any) -> Any:
     """Convert a dataclass model to a JSON-serializable dictionary.
 
     Handles Path objects by converting them to strings.
-    Recursively processes nested dataclasses and lists.
+    Recursively processes nested dataclasses and lists in a single pass,
+    without first deep-copying the model.
 
     Args:
         obj: A dataclass instance or any value
@@ -165,11 +172,7 @@ def model_to_dict(obj: Any) -> Any:
         A JSON-serializable dictionary or value
     """
     if hasattr(obj, "__dataclass_fields__"):
-        # It's a dataclass - convert to dict and process values
-        result = {}
-        for key, value in asdict(obj).items():
-            result[key] = _convert_value(value)
-        return result
+        return _convert_value(obj)
     return obj
 
 
@@ -182,7 +185,9 @@ def _convert_value(value: Any) -> Any:
     Returns:
         JSON-serializable version of the value
     """
-    if isinstance(value, Path):
+    if hasattr(value, "__dataclass_fields__") and not isinstance(value, type):
+        return {f.name: _convert_value(getattr(value, f.name)) for f in fields(value)}
+    elif isinstance(value, Path):
         return str(value)
     elif isinstance(value, Enum):
         return value.value
@@ -190,5 +195,7 @@ def _convert_value(value: Any) -> Any:
         return {k: _convert_value(v) for k, v in value.items()}
     elif isinstance(value, list):
         return [_convert_value(item) for item in value]
+    elif isinstance(value, tuple):
+        return tuple(_convert_value(item) for item in value)
     else:
         return value
@@ -5,6 +5,7 @@ and Markdown parsers, following the DRY principle.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from dacli.models import Section
@@ -12,6 +13,24 @@ from dacli.models import Section
 # Known document extensions to strip from file paths (Issue #266)
 KNOWN_DOC_EXTENSIONS = {".md", ".adoc", ".asciidoc"}
 
+# Slug patterns: characters to drop, and runs of separators to turn into one dash
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_-]+")
+# ASCII fast path for slugify, derived from the two patterns above: separators
+# become a dash, stripped characters are dropped and word characters are kept
+SLUG_ASCII_TABLE = str.maketrans(
+    {
+        chr(code): (
+            "-"
+            if SLUG_SEPARATOR_PATTERN.match(chr(code))
+            else None
+            if SLUG_STRIP_PATTERN.match(chr(code))
+            else chr(code)
+        )
+        for code in range(128)
+    }
+)
+
 
 def strip_doc_extension(file_path: Path) -> str:
     """Remove only known document extensions from a file path.
@@ -34,9 +53,37 @@ def strip_doc_extension(file_path: Path) -> str:
     return path_str
 
 
+def file_stamp(path: Path) -> tuple[int, int, int, int] | None:
+    """Return (inode, mtime_ns, ctime_ns, size) of a file, or None if it cannot be stat'ed.
+
+    The parsers use the stamp to tell whether a cached parse result is still
+    current. The inode changes when a file is replaced by an atomic rename,
+    and the change time cannot be set back by tools that restore mtime.
+    Edits within one timestamp tick can still leave the stamp unchanged, so
+    the process's own writes also invalidate the caches (see
+    FileSystemHandler.write_file).
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Inode number, modification and change time in nanoseconds and size
+        in bytes, or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug.
 
+    Results are memoized, since the same titles ("Overview", "Examples")
+    recur across documents and index rebuilds.
+
     Args:
         text: Text to convert
 
@@ -53,18 +100,20 @@ def slugify(text: str) -> str:
         >>> slugify("hello_world")
         'hello-world'
     """
+    text = text.lower()
+    if text.isascii():
+        # One translate pass, then drop empty pieces to collapse and trim dashes
+        return "-".join(filter(None, text.translate(SLUG_ASCII_TABLE).split("-")))
     # Remove special characters but preserve Unicode word characters
-    slug = re.sub(r"[^\w\s-]", "", text.lower())
-    # Convert spaces and underscores to dashes
-    slug = re.sub(r"[\s_]+", "-", slug)
-    # Collapse multiple dashes
-    slug = re.sub(r"-+", "-", slug)
+    slug = SLUG_STRIP_PATTERN.sub("", text)
+    # Convert runs of spaces, underscores and dashes to a single dash
+    slug = SLUG_SEPARATOR_PATTERN.sub("-", slug)
     # Trim leading/trailing dashes
     return slug.strip("-")
 
 
 def collect_all_sections(sections: list[Section], result: list[Section]) -> None:
-    """Recursively collect all sections into a flat list.
+    """Collect all sections into a flat list in document order.
 
     Args:
         sections: List of sections to process
@@ -74,9 +123,13 @@ def collect_all_sections(sections: list[Section], result: list[Section]) -> None
         >>> all_sections = []
         >>> collect_all_sections(doc.sections, all_sections)
     """
-    for section in sections:
+    # Explicit stack instead of recursion: no call per section and no
+    # recursion limit; children are pushed reversed to keep document order
+    stack = list(reversed(sections))
+    while stack:
+        section = stack.pop()
         result.append(section)
-        collect_all_sections(section.children, result)
+        stack.extend(reversed(section.children))
 
 
 def find_section_by_path(sections: list[Section], path: str) -> Section | None:
@@ -97,3 +150,25 @@ def find_section_by_path(sections: list[Section], path: str) -> Section | None:
         if found:
             return found
     return None
+
+
+def build_title_path_map(sections: list[Section]) -> dict[str, str]:
+    """Map each section title to the path of its first section in document order.
+
+    Parsers resolve the section a heading line belongs to by its title; a
+    prebuilt map turns that into one dict lookup per heading instead of a
+    walk over the whole section tree.
+
+    Args:
+        sections: Top-level sections of a document
+
+    Returns:
+        Dictionary mapping titles to section paths. If several sections share
+        a title, the first one in document order wins.
+    """
+    all_sections: list[Section] = []
+    collect_all_sections(sections, all_sections)
+    title_paths: dict[str, str] = {}
+    for section in all_sections:
+        title_paths.setdefault(section.title, section.path)
+    return title_paths
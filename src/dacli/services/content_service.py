@@ -22,7 +22,12 @@ def compute_hash(content: str) -> str:
     return hashlib.md5(content.encode("utf-8")).hexdigest()[:8]
 
 
-def _get_section_end_line(section, file_path: Path, file_handler: FileSystemHandler) -> int:
+def _get_section_end_line(
+    section,
+    file_path: Path,
+    file_handler: FileSystemHandler,
+    lines: list[str] | None = None,
+) -> int:
     """Get the end line of a section.
 
     If the section has an end_line in source_location, use that.
@@ -32,6 +37,8 @@ def _get_section_end_line(section, file_path: Path, file_handler: FileSystemHand
         section: The section object.
         file_path: Path to the file.
         file_handler: File system handler.
+        lines: Optional already-read file lines; avoids re-reading the file
+               on the fallback path.
 
     Returns:
         The line number where the section ends.
@@ -40,6 +47,9 @@ def _get_section_end_line(section, file_path: Path, file_handler: FileSystemHand
     if section.source_location.end_line is not None:
         return section.source_location.end_line
 
+    if lines is not None:
+        return len(lines)
+
     # Fallback: read file and calculate
     try:
         content = file_handler.read_file(file_path)
@@ -158,7 +168,7 @@ def update_section(
         # Issue #245: Always reject heading level changes to prevent
         # hierarchy corruption, even for sections without children.
         if new_level != section.level:
-            if section.children:
+            if section.has_children:
                 reason = (
                     f"because section '{normalized_path}' has "
                     f"{len(section.children)} child section(s). "
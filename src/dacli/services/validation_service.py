@@ -3,91 +3,110 @@
 Provides shared logic for CLI and MCP validation operations.
 """
 
+import os
+import re
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from dacli.file_utils import find_doc_files
 from dacli.structure_index import StructureIndex
 
+# Format: "Duplicate section path: 'path' (first at file:line, duplicate at file:line)"
+DUPLICATE_PATH_PATTERN = re.compile(r"Duplicate section path: '([^']+)'")
 
-def validate_structure(index: StructureIndex, docs_root: Path) -> dict:
-    """Validate the document structure.
 
-    Checks for:
-    - Orphaned files (not included in any document)
-    - Parse warnings (unclosed blocks, tables)
+@dataclass
+class _IndexFindings:
+    """Validation results that depend only on the index contents.
+
+    Attributes:
+        revision: Index revision the findings were computed for
+        root_prefix: Resolved docs root (plus separator) used for relative paths
+        errors: Circular include errors
+        warnings: Parse warnings and duplicate-path warnings
+        circular_files: Resolved paths of files involved in circular includes
+        includes: (target path, "source:line", relative target) per include
+    """
+
+    revision: int
+    root_prefix: str
+    errors: list[dict]
+    warnings: list[dict]
+    circular_files: set[str]
+    includes: list[tuple[Path, str, str]]
+
+
+# Findings per index, reused until the index is rebuilt. Weak keys so the
+# cache never keeps an index alive.
+_index_findings: "weakref.WeakKeyDictionary[StructureIndex, _IndexFindings]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _relative_path(path: Path, root_prefix: str) -> str:
+    """Return path relative to the docs root, or unchanged if outside it.
+
+    Uses a plain string prefix check instead of Path.relative_to(), which
+    builds a new path and raises ValueError for paths outside the root.
+
+    Args:
+        path: Path to make relative.
+        root_prefix: Resolved docs root ending in os.sep.
+
+    Returns:
+        The relative path as a string, or str(path) if it is not under the root.
+    """
+    return str(path).removeprefix(root_prefix)
+
+
+def _discover_doc_files(docs_root: Path) -> set[str]:
+    """Find all doc files in docs_root (respecting gitignore) in a single walk.
 
     Args:
-        index: The structure index to validate.
         docs_root: Root directory of documentation.
 
     Returns:
-        Dictionary with:
-        - valid: True if no errors, False otherwise
-        - errors: List of error objects
-        - warnings: List of warning objects
-        - validation_time_ms: Time taken for validation
+        Set of resolved file paths as strings (see os.path.realpath).
     """
-    start_time = time.time()
+    return {os.path.realpath(f) for f in find_doc_files(docs_root, ("*.adoc", "*.md"))}
+
+
+def _collect_index_findings(index: StructureIndex, root_prefix: str) -> _IndexFindings:
+    """Collect the validation results that depend only on the index.
 
+    Args:
+        index: The structure index to validate.
+        root_prefix: Resolved docs root ending in os.sep.
+
+    Returns:
+        The index findings for the current index revision.
+    """
     errors: list[dict] = []
     warnings: list[dict] = []
 
     # Issue #251: Report circular include errors explicitly
-    docs_root_resolved = docs_root.resolve()
-    circular_files: set[Path] = set()
+    circular_files: set[str] = set()
     for circ_error in index._circular_include_errors:
         file_path = circ_error["file"]
-        try:
-            rel_path = file_path.relative_to(docs_root_resolved)
-        except ValueError:
-            rel_path = file_path
         errors.append(
             {
                 "type": "circular_include",
-                "path": str(rel_path),
+                "path": _relative_path(file_path, root_prefix),
                 "message": circ_error["message"],
             }
         )
         # Track all files involved in circular includes
-        circular_files.add(file_path.resolve())
+        circular_files.add(os.path.realpath(file_path))
         for chain_path in circ_error["include_chain"]:
-            circular_files.add(chain_path.resolve())
-
-    # Get all indexed files
-    indexed_files = set(index._file_to_sections.keys())
-
-    # Get all doc files in docs_root (respecting gitignore)
-    all_doc_files: set[Path] = set()
-    for adoc_file in find_doc_files(docs_root, "*.adoc"):
-        all_doc_files.add(adoc_file.resolve())
-    for md_file in find_doc_files(docs_root, "*.md"):
-        all_doc_files.add(md_file.resolve())
-
-    # Check for orphaned files (files not indexed)
-    # Issue #251: Exclude files involved in circular includes from orphaned detection
-    indexed_resolved = {f.resolve() for f in indexed_files}
-    for doc_file in all_doc_files:
-        if doc_file not in indexed_resolved and doc_file not in circular_files:
-            try:
-                rel_path = doc_file.relative_to(docs_root_resolved)
-            except ValueError:
-                rel_path = doc_file
-            warnings.append(
-                {
-                    "type": "orphaned_file",
-                    "path": str(rel_path),
-                    "message": "File is not included in any document",
-                }
-            )
+            circular_files.add(os.path.realpath(chain_path))
 
     # Collect parse warnings from all documents (Issue #148)
     for doc in index._documents:
         for pw in doc.parse_warnings:
-            try:
-                rel_path = pw.file.relative_to(docs_root_resolved)
-            except ValueError:
-                rel_path = pw.file
+            rel_path = _relative_path(pw.file, root_prefix)
             warnings.append(
                 {
                     "type": pw.type.value,
@@ -100,10 +119,7 @@ def validate_structure(index: StructureIndex, docs_root: Path) -> dict:
     for build_warning in index._build_warnings:
         if "Duplicate section path" in build_warning:
             # Parse the warning string to extract the path
-            # Format: "Duplicate section path: 'path' (first at file:line, duplicate at file:line)"
-            import re
-
-            match = re.search(r"Duplicate section path: '([^']+)'", build_warning)
+            match = DUPLICATE_PATH_PATTERN.search(build_warning)
             dup_path = match.group(1) if match else "unknown"
             warnings.append(
                 {
@@ -113,29 +129,107 @@ def validate_structure(index: StructureIndex, docs_root: Path) -> dict:
                 }
             )
 
-    # Issue #219: Check for unresolved includes
+    # Issue #219: Collect includes; whether their targets exist is checked
+    # on every validation since files can change without an index rebuild
+    includes: list[tuple[Path, str, str]] = []
     for doc in index._documents:
         # Only AsciiDoc documents have includes (check for attribute)
         if hasattr(doc, "includes"):
             for include in doc.includes:
-                if not include.target_path.exists():
-                    source_loc = include.source_location
-                    try:
-                        rel_source = source_loc.file.relative_to(docs_root_resolved)
-                    except ValueError:
-                        rel_source = source_loc.file
-                    try:
-                        rel_target = include.target_path.relative_to(docs_root_resolved)
-                    except ValueError:
-                        rel_target = include.target_path
-                    errors.append(
-                        {
-                            "type": "unresolved_include",
-                            "path": f"{rel_source}:{source_loc.line}",
-                            "include_path": str(rel_target),
-                            "message": f"Include file '{rel_target}' not found",
-                        }
+                source_loc = include.source_location
+                rel_source = _relative_path(source_loc.file, root_prefix)
+                includes.append(
+                    (
+                        include.target_path,
+                        f"{rel_source}:{source_loc.line}",
+                        _relative_path(include.target_path, root_prefix),
                     )
+                )
+
+    return _IndexFindings(
+        revision=index.get_revision(),
+        root_prefix=root_prefix,
+        errors=errors,
+        warnings=warnings,
+        circular_files=circular_files,
+        includes=includes,
+    )
+
+
+def validate_structure(index: StructureIndex, docs_root: Path) -> dict:
+    """Validate the document structure.
+
+    Checks for:
+    - Orphaned files (not included in any document)
+    - Parse warnings (unclosed blocks, tables)
+
+    Results derived only from the index are cached until the index is
+    rebuilt; filesystem checks (orphaned files, missing include targets)
+    run on every call.
+
+    Args:
+        index: The structure index to validate.
+        docs_root: Root directory of documentation.
+
+    Returns:
+        Dictionary with:
+        - valid: True if no errors, False otherwise
+        - errors: List of error objects
+        - warnings: List of warning objects
+        - validation_time_ms: Time taken for validation
+    """
+    start_time = time.time()
+
+    # The filesystem walk for orphan detection is independent of the index
+    # checks below, so it runs in a worker thread while those are done
+    executor = ThreadPoolExecutor(max_workers=1)
+    doc_files_future = executor.submit(_discover_doc_files, docs_root)
+    executor.shutdown(wait=False)
+
+    # Resolved paths are compared as plain strings (os.path.realpath) and made
+    # relative by prefix, avoiding Path objects for every discovered file.
+    # os.path.join adds the separator only if missing (a filesystem root has it)
+    root_prefix = os.path.join(str(docs_root.resolve()), "")
+
+    findings = _index_findings.get(index)
+    if (
+        findings is None
+        or findings.revision != index.get_revision()
+        or findings.root_prefix != root_prefix
+    ):
+        findings = _collect_index_findings(index, root_prefix)
+        _index_findings[index] = findings
+
+    # Copy cached entries so callers cannot modify the cache
+    errors = [dict(error) for error in findings.errors]
+    warnings = [dict(warning) for warning in findings.warnings]
+
+    # Issue #219: Check for unresolved includes
+    for target_path, source, rel_target in findings.includes:
+        if not target_path.exists():
+            errors.append(
+                {
+                    "type": "unresolved_include",
+                    "path": source,
+                    "include_path": rel_target,
+                    "message": f"Include file '{rel_target}' not found",
+                }
+            )
+
+    # Check for orphaned files (files not indexed), reported before all
+    # other warnings in a stable order
+    # Issue #251: Exclude files involved in circular includes from orphaned detection
+    indexed_resolved = index.get_resolved_files()
+    orphan_warnings = [
+        {
+            "type": "orphaned_file",
+            "path": doc_file.removeprefix(root_prefix),
+            "message": "File is not included in any document",
+        }
+        for doc_file in sorted(doc_files_future.result())
+        if doc_file not in indexed_resolved and doc_file not in findings.circular_files
+    ]
+    warnings = orphan_warnings + warnings
 
     # Calculate validation time
     elapsed_ms = int((time.time() - start_time) * 1000)
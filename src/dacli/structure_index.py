@@ -12,6 +12,7 @@ Key features:
 """
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -21,7 +22,7 @@ from dacli.models import Document, Element, Section
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result with context.
 
@@ -53,10 +54,16 @@ class StructureIndex:
         _section_to_elements: Mapping of section path to list of Elements
         _file_to_sections: Mapping of file path to list of Sections
         _section_content: Mapping of section path to content for full-text search
+        _resolved_files: Cached set of resolved indexed file paths (None until requested)
+        _structure_cache: Cached get_structure() results keyed by max_depth
+        _revision: Counter bumped whenever the index is cleared or rebuilt
         _documents: List of indexed documents
         _index_ready: Whether the index has been built
     """
 
+    # Distinct max_depth values kept by get_structure() before the cache is reset
+    _STRUCTURE_CACHE_SIZE = 16
+
     def __init__(self) -> None:
         """Initialize an empty index."""
         self._path_to_section: dict[str, Section] = {}
@@ -66,11 +73,14 @@ class StructureIndex:
         self._section_to_elements: dict[str, list[Element]] = {}
         self._file_to_sections: dict[Path, list[Section]] = {}
         self._section_content: dict[str, str] = {}  # Content for full-text search
+        self._resolved_files: set[str] | None = None  # Lazily computed, reset on clear()
+        self._structure_cache: dict[int | None, dict] = {}  # Reset on clear()
         self._documents: list[Document] = []
         self._top_level_sections: list[Section] = []
         self._circular_include_errors: list[dict] = []
         self._build_warnings: list[str] = []  # Issue #268: Store duplicate path warnings
         self._index_ready: bool = False
+        self._revision: int = 0
 
     def build_from_documents(self, documents: list[Document]) -> list[str]:
         """Build index from parsed documents.
@@ -88,12 +98,15 @@ class StructureIndex:
 
         self._documents = documents
 
+        # Lines of each file read during this build, shared by all its sections
+        file_lines: dict[Path, list[str]] = {}
+
         # Index all sections and elements from each document
         for doc in documents:
-            # Index sections recursively
+            # Index each section tree
             for section in doc.sections:
                 self._top_level_sections.append(section)
-                section_warnings = self._index_section(section)
+                section_warnings = self._index_section(section, file_lines)
                 warnings.extend(section_warnings)
 
             # Index elements
@@ -112,12 +125,20 @@ class StructureIndex:
     def get_structure(self, max_depth: int | None = None) -> dict:
         """Get hierarchical document structure.
 
+        The result is cached per max_depth until the index is rebuilt or
+        cleared. The returned dictionary is shared between callers and must
+        not be modified.
+
         Args:
             max_depth: Maximum depth to return (None for unlimited)
 
         Returns:
             Dictionary with 'sections' (hierarchical tree) and 'total_sections'
         """
+        cached = self._structure_cache.get(max_depth)
+        if cached is not None:
+            return cached
+
         if max_depth is not None:
             sections = [
                 self._section_to_dict(s, max_depth, current_depth=1)
@@ -129,10 +150,14 @@ class StructureIndex:
                 for s in self._top_level_sections
             ]
 
-        return {
+        structure = {
             "sections": sections,
             "total_sections": len(self._path_to_section),
         }
+        if len(self._structure_cache) >= self._STRUCTURE_CACHE_SIZE:
+            self._structure_cache.clear()
+        self._structure_cache[max_depth] = structure
+        return structure
 
     def get_section(self, path: str) -> Section | None:
         """Find section by hierarchical path.
@@ -167,6 +192,30 @@ class StructureIndex:
         """
         return self._file_to_sections.get(file_path, [])
 
+    def get_revision(self) -> int:
+        """Get the index revision.
+
+        The revision changes whenever the index is cleared or rebuilt, so
+        callers can cache results derived from the index contents.
+
+        Returns:
+            Current revision number
+        """
+        return self._revision
+
+    def get_resolved_files(self) -> set[str]:
+        """Get the resolved paths of all files that contain indexed sections.
+
+        The set is computed on first use and cached until the index is
+        rebuilt or cleared, so repeated validations avoid re-resolving paths.
+
+        Returns:
+            Set of resolved file paths as strings (see os.path.realpath)
+        """
+        if self._resolved_files is None:
+            self._resolved_files = {os.path.realpath(f) for f in self._file_to_sections}
+        return self._resolved_files
+
     def get_suggestions(self, requested_path: str, max_suggestions: int = 5) -> list[str]:
         """Get path suggestions for a non-existent path.
 
@@ -492,11 +541,14 @@ class StructureIndex:
         self._section_to_elements.clear()
         self._file_to_sections.clear()
         self._section_content.clear()
+        self._resolved_files = None
+        self._structure_cache.clear()
         self._documents.clear()
         self._top_level_sections.clear()
         self._circular_include_errors.clear()
         self._build_warnings.clear()
         self._index_ready = False
+        self._revision += 1
 
     def stats(self) -> dict:
         """Return index statistics.
@@ -539,7 +591,7 @@ class StructureIndex:
             docs_root = doc.file_path.parent
             source_key = doc.file_path.name
 
-            targets = []
+            targets: list[str] = []
             for inc in doc.includes:
                 try:
                     rel_target = inc.target_path.relative_to(docs_root)
@@ -553,69 +605,85 @@ class StructureIndex:
 
         return {"include_tree": include_tree, "cross_references": []}
 
-    def _index_section(self, section: Section) -> list[str]:
-        """Index a section and its children recursively.
+    def _index_section(
+        self, section: Section, file_lines: dict[Path, list[str]] | None = None
+    ) -> list[str]:
+        """Index a section and all of its descendants.
+
+        The subtree is walked with an explicit stack in document order, so
+        deeply nested documents cannot hit the recursion limit.
 
         Args:
             section: Section to index
+            file_lines: Optional cache of file lines shared across one build,
+                        so each file is read once rather than once per section
 
         Returns:
             List of warning messages
         """
         warnings: list[str] = []
+        stack = [section]
+
+        while stack:
+            current = stack.pop()
+            # Push children reversed so they are visited in document order
+            stack.extend(reversed(current.children))
+
+            # Check for duplicate path
+            first = self._path_to_section.get(current.path)
+            if first is not None:
+                warnings.append(
+                    f"Duplicate section path: '{current.path}' "
+                    f"(first at {first.source_location.file}:"
+                    f"{first.source_location.line}, "
+                    f"duplicate at {current.source_location.file}:{current.source_location.line})"
+                )
+                # Reject the duplicate - do not add to any index
+                # Its children are still indexed in case they have unique paths
+                continue
+
+            # Index by path
+            self._path_to_section[current.path] = current
+
+            # Index by level
+            level_sections = self._level_to_sections.get(current.level)
+            if level_sections is None:
+                level_sections = self._level_to_sections[current.level] = []
+            level_sections.append(current)
+
+            # Index by file
+            file_path = current.source_location.file
+            file_sections = self._file_to_sections.get(file_path)
+            if file_sections is None:
+                file_sections = self._file_to_sections[file_path] = []
+            file_sections.append(current)
 
-        # Check for duplicate path
-        if section.path in self._path_to_section:
-            warnings.append(
-                f"Duplicate section path: '{section.path}' "
-                f"(first at {self._path_to_section[section.path].source_location.file}:"
-                f"{self._path_to_section[section.path].source_location.line}, "
-                f"duplicate at {section.source_location.file}:{section.source_location.line})"
-            )
-            # Reject the duplicate - do not add to any index
-            # Still index children recursively in case they have unique paths
-            for child in section.children:
-                child_warnings = self._index_section(child)
-                warnings.extend(child_warnings)
-            return warnings
-
-        # Index by path
-        self._path_to_section[section.path] = section
-
-        # Index by level
-        if section.level not in self._level_to_sections:
-            self._level_to_sections[section.level] = []
-        self._level_to_sections[section.level].append(section)
-
-        # Index by file
-        file_path = section.source_location.file
-        if file_path not in self._file_to_sections:
-            self._file_to_sections[file_path] = []
-        self._file_to_sections[file_path].append(section)
-
-        # Read and store section content for full-text search
-        self._store_section_content(section)
-
-        # Index children recursively
-        for child in section.children:
-            child_warnings = self._index_section(child)
-            warnings.extend(child_warnings)
+            # Read and store section content for full-text search
+            self._store_section_content(current, file_lines)
 
         return warnings
 
-    def _store_section_content(self, section: Section) -> None:
+    def _store_section_content(
+        self, section: Section, file_lines: dict[Path, list[str]] | None = None
+    ) -> None:
         """Read and store section content for full-text search.
 
         Args:
             section: Section to read content for
+            file_lines: Optional cache of already-read file lines, filled on
+                        first read of each file
         """
         try:
             file_path = section.source_location.file
-            if not file_path.exists():
-                return
+            lines = file_lines.get(file_path) if file_lines is not None else None
+            if lines is None:
+                if not file_path.exists():
+                    return
 
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
+                content = file_path.read_text(encoding="utf-8")
+                lines = content.splitlines()
+                if file_lines is not None:
+                    file_lines[file_path] = lines
 
             start_line = section.source_location.line - 1  # Convert to 0-based
             end_line = section.source_location.end_line
@@ -634,20 +702,22 @@ class StructureIndex:
             element: Element to index
         """
         # Assign index within parent section (0-based)
-        if element.parent_section not in self._section_to_elements:
-            self._section_to_elements[element.parent_section] = []
-        element.index = len(self._section_to_elements[element.parent_section])
+        section_elements = self._section_to_elements.get(element.parent_section)
+        if section_elements is None:
+            section_elements = self._section_to_elements[element.parent_section] = []
+        element.index = len(section_elements)
 
         # Add to all elements list
         self._elements.append(element)
 
         # Index by type
-        if element.type not in self._type_to_elements:
-            self._type_to_elements[element.type] = []
-        self._type_to_elements[element.type].append(element)
+        type_elements = self._type_to_elements.get(element.type)
+        if type_elements is None:
+            type_elements = self._type_to_elements[element.type] = []
+        type_elements.append(element)
 
         # Index by parent section
-        self._section_to_elements[element.parent_section].append(element)
+        section_elements.append(element)
 
     def _section_to_dict(
         self,
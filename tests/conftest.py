@@ -0,0 +1,40 @@
+"""Shared pytest configuration for the dacli test suite."""
+
+import pytest
+
+from dacli.asciidoc_parser import AsciidocStructureParser
+from dacli.markdown_parser import MarkdownStructureParser
+
+
+@pytest.fixture(autouse=True)
+def _isolate_parse_cache():
+    """Start every test with empty AsciiDoc and Markdown parse caches.
+
+    Parsed documents are cached per process and shared between callers, so a
+    test that modifies a parsed fixture document must not leak into the next
+    one. Clearing the cache keeps tests independent of execution order and of
+    how they are distributed across worker processes.
+    """
+    AsciidocStructureParser.clear_cache()
+    MarkdownStructureParser.clear_cache()
+    yield
+
+
+def _walk_section_paths(sections: list[dict]) -> list[str]:
+    """Return the paths of nested structure sections in document order.
+
+    Uses an explicit stack instead of recursion, like collect_all_sections.
+    """
+    paths: list[str] = []
+    stack = list(reversed(sections))
+    while stack:
+        section = stack.pop()
+        paths.append(section["path"])
+        stack.extend(reversed(section.get("children") or ()))
+    return paths
+
+
+@pytest.fixture
+def section_paths():
+    """Provide a function that lists all section paths of a get_structure() result."""
+    return _walk_section_paths
@@ -17,8 +17,7 @@ class TestIfdefBasic:
 
     def test_ifdef_includes_content_when_attr_defined(self, tmp_path):
         """Content inside ifdef block appears when attribute is defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -27,9 +26,9 @@ ifdef::backend[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Visible Section" in section_titles
@@ -37,8 +36,7 @@ endif::[]
 
     def test_ifdef_excludes_content_when_attr_not_defined(self, tmp_path):
         """Content inside ifdef block is skipped when attribute is NOT defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 ifdef::nonexistent[]
@@ -46,9 +44,9 @@ ifdef::nonexistent[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Hidden Section" not in section_titles
@@ -56,17 +54,16 @@ endif::[]
 
     def test_ifdef_with_value_attribute(self, tmp_path):
         """ifdef works when attribute has a value."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :version: 1.0
 
 ifdef::version[]
 == Version Info
 endif::[]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Version Info" in section_titles
@@ -77,8 +74,7 @@ class TestIfndefBasic:
 
     def test_ifndef_includes_content_when_attr_not_defined(self, tmp_path):
         """Content inside ifndef block appears when attribute is NOT defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 ifndef::print[]
@@ -86,9 +82,9 @@ ifndef::print[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Screen Only" in section_titles
@@ -96,8 +92,7 @@ endif::[]
 
     def test_ifndef_excludes_content_when_attr_defined(self, tmp_path):
         """Content inside ifndef block is skipped when attribute IS defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :print: true
 
@@ -106,9 +101,9 @@ ifndef::print[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Screen Only" not in section_titles
@@ -120,17 +115,16 @@ class TestSingleLineForm:
 
     def test_ifdef_single_line_included(self, tmp_path):
         """Single-line ifdef::attr[content] includes content when attr defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
 ifdef::backend[NOTE: Backend is html]
 
 == Section
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         admonitions = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonitions) == 1
@@ -138,49 +132,46 @@ ifdef::backend[NOTE: Backend is html]
 
     def test_ifdef_single_line_excluded(self, tmp_path):
         """Single-line ifdef::attr[content] skips content when attr not defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 ifdef::nonexistent[NOTE: This should not appear]
 
 == Section
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         admonitions = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonitions) == 0
 
     def test_ifndef_single_line_included(self, tmp_path):
         """Single-line ifndef::attr[content] includes when attr not defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 ifndef::nonexistent[NOTE: This should appear]
 
 == Section
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         admonitions = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonitions) == 1
 
     def test_ifndef_single_line_excluded(self, tmp_path):
         """Single-line ifndef::attr[content] skips when attr IS defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
 ifndef::backend[NOTE: This should not appear]
 
 == Section
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         admonitions = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonitions) == 0
@@ -191,8 +182,7 @@ class TestNestedConditions:
 
     def test_nested_ifdef_both_true(self, tmp_path):
         """Nested ifdef blocks: both conditions true -> content visible."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 :format: web
@@ -204,17 +194,16 @@ endif::[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Nested Visible" in section_titles
 
     def test_nested_ifdef_outer_false(self, tmp_path):
         """Nested ifdef: outer condition false -> all content hidden."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :format: web
 
@@ -225,9 +214,9 @@ endif::[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Should Be Hidden" not in section_titles
@@ -235,8 +224,7 @@ endif::[]
 
     def test_nested_ifdef_inner_false(self, tmp_path):
         """Nested ifdef: inner condition false -> inner content hidden."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -248,9 +236,9 @@ endif::[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Outer Visible" in section_titles
@@ -259,8 +247,7 @@ endif::[]
 
     def test_nested_ifndef_inside_ifdef(self, tmp_path):
         """ifndef nested inside ifdef works correctly."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -269,9 +256,9 @@ ifndef::print[]
 == Web Only Content
 endif::[]
 endif::[]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Web Only Content" in section_titles
@@ -282,8 +269,7 @@ class TestAttributeTracking:
 
     def test_attributes_defined_before_ifdef_are_tracked(self, tmp_path):
         """Attributes defined in document header are available for ifdef."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :sectnums:
 :toc:
@@ -292,38 +278,54 @@ class TestAttributeTracking:
 ifdef::custom-attr[]
 == Custom Section
 endif::[]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Custom Section" in section_titles
 
     def test_attribute_without_value_is_still_defined(self, tmp_path):
         """Attribute set as :attr: (empty value) is still considered defined."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :sectnums:
 
 ifdef::sectnums[]
 == Numbered Section
 endif::[]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Numbered Section" in section_titles
 
+    def test_attribute_in_excluded_block_is_not_defined(self, tmp_path):
+        """Attributes defined inside an excluded ifdef block are not set."""
+        text = """\
+= Test Document
+ifdef::missing[]
+:hidden: yes
+endif::[]
+
+ifdef::hidden[]
+== Hidden Section
+endif::[]
+"""
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
+
+        assert "hidden" not in doc.attributes
+        assert doc.sections[0].children == []
+
 
 class TestEndifVariants:
     """Tests for endif directive variants."""
 
     def test_endif_with_attribute_name(self, tmp_path):
         """endif::attr[] (with attribute name) works as block closer."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -332,9 +334,9 @@ ifdef::backend[]
 endif::backend[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Visible" in section_titles
@@ -342,8 +344,7 @@ endif::backend[]
 
     def test_endif_without_attribute_name(self, tmp_path):
         """endif::[] (without attribute name) works as block closer."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -352,9 +353,9 @@ ifdef::backend[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Visible" in section_titles
@@ -366,8 +367,7 @@ class TestConditionalWithElements:
 
     def test_ifdef_hides_code_block(self, tmp_path):
         """Code block inside false ifdef is not extracted as element."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 == Section
@@ -385,9 +385,9 @@ endif::[]
 def visible():
     pass
 ----
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         code_elements = [e for e in doc.elements if e.type == "code"]
         assert len(code_elements) == 1
@@ -395,8 +395,7 @@ def visible():
 
     def test_ifdef_hides_admonition(self, tmp_path):
         """Admonition inside false ifdef is not extracted as element."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 == Section
@@ -406,9 +405,9 @@ WARNING: This should be hidden
 endif::[]
 
 NOTE: This should be visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         admonitions = [e for e in doc.elements if e.type == "admonition"]
         assert len(admonitions) == 1
@@ -416,8 +415,7 @@ NOTE: This should be visible
 
     def test_ifdef_hides_image(self, tmp_path):
         """Image inside false ifdef is not extracted as element."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 == Section
@@ -427,9 +425,9 @@ image::hidden.png[Hidden]
 endif::[]
 
 image::visible.png[Visible]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         images = [e for e in doc.elements if e.type == "image"]
         assert len(images) == 1
@@ -444,8 +442,7 @@ class TestConditionalWithIncludes:
         included = tmp_path / "included.adoc"
         included.write_text("== Included Section\n\nContent from include.\n")
 
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 
 ifdef::nonexistent[]
@@ -453,9 +450,9 @@ include::included.adoc[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Included Section" not in section_titles
@@ -466,8 +463,7 @@ endif::[]
         included = tmp_path / "included.adoc"
         included.write_text("== Included Section\n\nContent from include.\n")
 
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -476,9 +472,9 @@ include::included.adoc[]
 endif::[]
 
 == Always Visible
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "Included Section" in section_titles
@@ -490,8 +486,7 @@ class TestRealWorldPatterns:
 
     def test_imagesdir_conditional(self, tmp_path):
         """Common pattern: ifndef::imagesdir[:imagesdir: default] works."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 ifndef::imagesdir[:imagesdir: ./images]
 
 = Test Document
@@ -499,16 +494,15 @@ ifndef::imagesdir[:imagesdir: ./images]
 == Section
 
 image::diagram.png[Diagram]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         assert doc.attributes.get("imagesdir") == "./images"
 
     def test_multiple_ifdef_blocks(self, tmp_path):
         """Multiple sequential ifdef/endif blocks work correctly."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 = Test Document
 :backend: html
 
@@ -523,9 +517,9 @@ endif::[]
 ifdef::backend[]
 == Another HTML Section
 endif::[]
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         section_titles = [s.title for s in doc.sections[0].children]
         assert "HTML Section" in section_titles
@@ -534,8 +528,7 @@ endif::[]
 
     def test_spec_file_ifdef_pattern(self, tmp_path):
         """Pattern from actual spec file: ifndef at file start."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text("""\
+        text = """\
 :jbake-title: Test Spec
 :jbake-type: page_toc
 ifndef::imagesdir[:imagesdir: ../../images]
@@ -545,9 +538,9 @@ ifndef::imagesdir[:imagesdir: ../../images]
 == Introduction
 
 Content here.
-""")
+"""
         parser = AsciidocStructureParser(base_path=tmp_path)
-        doc = parser.parse_file(test_file)
+        doc = parser.parse_string(text, virtual_path=tmp_path / "test.adoc")
 
         assert doc.title == "Test Specification"
         assert "imagesdir" in doc.attributes
@@ -343,6 +343,17 @@ class TestDocumentAttributes:
         # Title should have {project} resolved to "MCP Server"
         assert doc.title == "MCP Server Dokumentation"
 
+    def test_substitute_attributes_single_pass(self):
+        """Test multiple references resolve and undefined ones stay literal."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        parser = AsciidocStructureParser(base_path=FIXTURES_DIR)
+        attributes = {"project": "dacli", "version": "1.0", "raw": "{version}"}
+
+        result = parser._substitute_attributes("{project} {version} {unknown} {raw}", attributes)
+
+        assert result == "dacli 1.0 {unknown} {version}"
+
 
 class TestIncludeDirectives:
     """Tests for include directive handling (AC-ADOC-03, AC-ADOC-04)."""
@@ -402,6 +413,103 @@ class TestIncludeDirectives:
             == FIXTURES_DIR / "with_include.adoc"
         )
 
+    def test_changed_include_is_read_again(self, tmp_path: Path):
+        """Test that a modified included file is not served from the read cache."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        (tmp_path / "main.adoc").write_text("= Main\n\ninclude::part.adoc[]\n")
+        part = tmp_path / "part.adoc"
+        part.write_text("== Old Title\n")
+
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        first = parser.parse_file(tmp_path / "main.adoc")
+        part.write_text("== Replaced Title\n")
+        second = parser.parse_file(tmp_path / "main.adoc")
+
+        assert first.sections[0].children[0].title == "Old Title"
+        assert second.sections[0].children[0].title == "Replaced Title"
+
+    def test_unchanged_file_is_served_from_parse_cache(self, tmp_path: Path):
+        """Test that re-parsing an unchanged file returns the cached document."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        (tmp_path / "main.adoc").write_text("= Main\n\n== Section\n")
+
+        first = AsciidocStructureParser(base_path=tmp_path).parse_file(tmp_path / "main.adoc")
+        second = AsciidocStructureParser(base_path=tmp_path).parse_file(tmp_path / "main.adoc")
+
+        assert second is first
+
+    def test_parse_string_matches_parse_file(self):
+        """Test that in-memory parsing yields the same structure as parsing the file."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        file_path = FIXTURES_DIR / "with_include.adoc"
+        parser = AsciidocStructureParser(base_path=FIXTURES_DIR)
+        from_file = parser.parse_file(file_path)
+        from_text = parser.parse_string(file_path.read_text(), virtual_path=file_path)
+
+        assert from_text.title == from_file.title
+        assert from_text.sections == from_file.sections
+        assert from_text.includes == from_file.includes
+
+    def test_created_include_invalidates_parse_cache(self, tmp_path: Path):
+        """Test that an include that appears after parsing triggers a re-parse."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        (tmp_path / "main.adoc").write_text("= Main\n\ninclude::part.adoc[]\n")
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        first = parser.parse_file(tmp_path / "main.adoc")
+        (tmp_path / "part.adoc").write_text("== Part\n")
+        second = parser.parse_file(tmp_path / "main.adoc")
+
+        assert first.sections[0].children == []
+        assert second.sections[0].children[0].title == "Part"
+
+    def test_include_edited_during_parse_is_read_again(self, tmp_path: Path, monkeypatch):
+        """Test that an include changed after it was read is not cached as current."""
+        from dacli import asciidoc_parser
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        (tmp_path / "main.adoc").write_text("= Main\n\ninclude::part.adoc[]\n")
+        part = tmp_path / "part.adoc"
+        part.write_text("== Old Title\n")
+        read_include_lines = asciidoc_parser._read_include_lines
+
+        def read_then_edit(path, stamp):
+            lines = read_include_lines(path, stamp)
+            part.write_text("== Edited Title\n")
+            return lines
+
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        monkeypatch.setattr(asciidoc_parser, "_read_include_lines", read_then_edit)
+        first = parser.parse_file(tmp_path / "main.adoc")
+        monkeypatch.setattr(asciidoc_parser, "_read_include_lines", read_include_lines)
+        second = parser.parse_file(tmp_path / "main.adoc")
+
+        assert first.sections[0].children[0].title == "Old Title"
+        assert second.sections[0].children[0].title == "Edited Title"
+
+    def test_write_invalidates_including_document(self, tmp_path: Path, monkeypatch):
+        """Test that writing an include drops the cache even if its stamp is unchanged."""
+        from dacli import asciidoc_parser
+        from dacli.asciidoc_parser import AsciidocStructureParser
+        from dacli.file_handler import FileSystemHandler
+
+        (tmp_path / "main.adoc").write_text("= Main\n\ninclude::part.adoc[]\n")
+        part = tmp_path / "part.adoc"
+        part.write_text("== Foo\n")
+        # Simulate a same-size edit within one timestamp tick
+        monkeypatch.setattr(asciidoc_parser, "file_stamp", lambda path: (1, 1, 1, 1))
+
+        parser = AsciidocStructureParser(base_path=tmp_path)
+        first = parser.parse_file(tmp_path / "main.adoc")
+        FileSystemHandler().write_file(part, "== Bar\n")
+        second = parser.parse_file(tmp_path / "main.adoc")
+
+        assert first.sections[0].children[0].title == "Foo"
+        assert second.sections[0].children[0].title == "Bar"
+
 
 class TestElementExtraction:
     """Tests for element extraction (AC-ADOC-05, AC-ADOC-06, AC-ADOC-07)."""
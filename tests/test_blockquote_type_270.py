@@ -3,9 +3,25 @@
 blockquote is listed in --help but rejected at runtime by valid_types check.
 """
 
+import typing
+
+import pytest
 from click.testing import CliRunner
 
 from dacli.cli import cli
+from dacli.models import Element
+
+# All valid types from the Element model's type field
+# (Element.type is Literal["code", "table", ...])
+MODEL_ELEMENT_TYPES = typing.get_args(typing.get_type_hints(Element)["type"])
+
+
+@pytest.fixture(scope="module")
+def elements_docs_root(tmp_path_factory):
+    """Docs root with one Markdown file, shared by the per-type tests."""
+    docs_root = tmp_path_factory.mktemp("elements")
+    (docs_root / "test.md").write_text("# Test\n\nSome content.\n")
+    return docs_root
 
 
 class TestBlockquoteElementType:
@@ -43,35 +59,22 @@ class TestBlockquoteElementType:
         # Help says: "Element type: admonition, blockquote, code, image, list, plantuml, table"
         assert "blockquote" in result.output, "blockquote missing from --help"
 
-    def test_all_model_element_types_accepted(self, tmp_path):
+    @pytest.mark.parametrize("etype", MODEL_ELEMENT_TYPES)
+    def test_all_model_element_types_accepted(self, elements_docs_root, etype):
         """Every ElementType in the model should be accepted by CLI validation."""
-        from dacli.models import Element
-
-        doc = tmp_path / "test.md"
-        doc.write_text("# Test\n\nSome content.\n")
-
         runner = CliRunner()
-        # Get all valid types from the Element model's type field
-        # The Literal type annotation lists all valid values
-        import typing
-
-        type_hints = typing.get_type_hints(Element)
-        # Element.type is Literal["code", "table", ...]
-        literal_args = typing.get_args(type_hints["type"])
-
-        for etype in literal_args:
-            result = runner.invoke(
-                cli,
-                [
-                    "--docs-root",
-                    str(tmp_path),
-                    "--format",
-                    "json",
-                    "elements",
-                    "--type",
-                    etype,
-                ],
-            )
-            assert (
-                "Unknown element type" not in result.output
-            ), f"Element type '{etype}' rejected by CLI but defined in model"
+        result = runner.invoke(
+            cli,
+            [
+                "--docs-root",
+                str(elements_docs_root),
+                "--format",
+                "json",
+                "elements",
+                "--type",
+                etype,
+            ],
+        )
+        assert (
+            "Unknown element type" not in result.output
+        ), f"Element type '{etype}' rejected by CLI but defined in model"
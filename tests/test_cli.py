@@ -10,6 +10,32 @@ import pytest
 from click.testing import CliRunner
 
 
+@pytest.fixture(scope="module")
+def sample_docs(tmp_path_factory):
+    """Create sample documentation files, shared by the read-only tests below."""
+    tmp_path = tmp_path_factory.mktemp("docs")
+    doc_file = tmp_path / "test.adoc"
+    doc_file.write_text("""= Test Document
+
+== Introduction
+
+Some introduction text about testing.
+
+== Architecture
+
+Architecture description.
+
+== Authentication
+
+This section covers authentication topics.
+
+== Section One
+
+Content.
+""")
+    return tmp_path
+
+
 class TestCliBasic:
     """Test basic CLI functionality."""
 
@@ -45,22 +71,6 @@ class TestCliBasic:
 class TestCliCommandAliases:
     """Test command aliases for shorter typing."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Introduction
-
-Some introduction text about testing.
-
-== Architecture
-
-Architecture description.
-""")
-        return tmp_path
-
     def test_str_alias_for_structure(self, sample_docs):
         """'str' should work as alias for 'structure'."""
         from dacli.cli import cli
@@ -151,23 +161,6 @@ Architecture description.
 class TestCliStructureCommand:
     """Test the 'structure' command."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        # Create a simple AsciiDoc file
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Introduction
-
-Some introduction text.
-
-== Architecture
-
-Architecture description.
-""")
-        return tmp_path
-
     def test_structure_returns_json_when_requested(self, sample_docs):
         """structure command should return valid JSON when --format json is specified."""
         from dacli.cli import cli
@@ -200,18 +193,6 @@ Architecture description.
 class TestCliSectionCommand:
     """Test the 'section' command."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Introduction
-
-Introduction content here.
-""")
-        return tmp_path
-
     def test_section_returns_content(self, sample_docs):
         """section command should return section content as JSON when requested."""
         from dacli.cli import cli
@@ -245,18 +226,6 @@ Introduction content here.
 class TestCliSearchCommand:
     """Test the 'search' command."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Authentication
-
-This section covers authentication topics.
-""")
-        return tmp_path
-
     def test_search_returns_results(self, sample_docs):
         """search command should return JSON results when requested."""
         from dacli.cli import cli
@@ -348,18 +317,6 @@ This section covers authentication topics.
 class TestCliMetadataCommand:
     """Test the 'metadata' command."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Section One
-
-Content.
-""")
-        return tmp_path
-
     def test_metadata_project_level(self, sample_docs):
         """metadata without path should return project metadata."""
         from dacli.cli import cli
@@ -392,18 +349,6 @@ Content.
 class TestCliValidateCommand:
     """Test the 'validate' command."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test Document
-
-== Section
-
-Content.
-""")
-        return tmp_path
-
     def test_validate_returns_result(self, sample_docs):
         """validate command should return validation result."""
         from dacli.cli import cli
@@ -570,18 +515,6 @@ Content after.
 class TestCliOutputFormats:
     """Test output format options."""
 
-    @pytest.fixture
-    def sample_docs(self, tmp_path):
-        """Create sample documentation files for testing."""
-        doc_file = tmp_path / "test.adoc"
-        doc_file.write_text("""= Test
-
-== Section
-
-Content.
-""")
-        return tmp_path
-
     def test_text_format_is_default(self, sample_docs):
         """Default output should be text format."""
         from dacli.cli import cli
@@ -8,16 +8,19 @@ following the same pattern as sections-at-level (Issue #199).
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
 from dacli.cli import cli
 
 
-@pytest.fixture
-def temp_doc_dir(tmp_path: Path) -> Path:
-    """Create a temporary directory with test documents."""
+@pytest.fixture(scope="module")
+def temp_doc_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory with test documents, shared read-only by this module."""
+    tmp_path = tmp_path_factory.mktemp("docs")
     doc_file = tmp_path / "test.adoc"
     doc_file.write_text(
         """= Test Document
@@ -175,3 +178,32 @@ class TestSearchNegativeLimit:
 
         assert result.exit_code != 0
         assert "limit must be non-negative" in result.output
+
+
+class TestValidateNonNegative:
+    """The shared validator behind the negative-value checks."""
+
+    def test_negative_value_raises_with_value_in_message(self):
+        """A negative value raises BadParameter naming the option and value."""
+        from dacli.cli import _validate_non_negative
+
+        with pytest.raises(click.BadParameter, match="max-depth must be non-negative, got -5"):
+            _validate_non_negative(-5, "max-depth", "Use 0 or more.", "'--max-depth'")
+
+    def test_zero_is_accepted(self):
+        """Zero is a valid value."""
+        from dacli.cli import _validate_non_negative
+
+        _validate_non_negative(0, "limit", "Use 0 or more.", "'--limit'")
+
+    def test_rejected_value_does_not_build_index(self, temp_doc_dir: Path):
+        """Arguments are rejected before the documentation is indexed."""
+        runner = CliRunner()
+        with patch("dacli.cli._build_index") as mock_build:
+            result = runner.invoke(
+                cli,
+                ["--docs-root", str(temp_doc_dir), "structure", "--max-depth", "-1"],
+            )
+
+        assert result.exit_code != 0
+        mock_build.assert_not_called()
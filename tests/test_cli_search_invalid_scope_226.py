@@ -12,9 +12,10 @@ from click.testing import CliRunner
 from dacli.cli import cli
 
 
-@pytest.fixture
-def temp_doc_with_sections(tmp_path: Path) -> Path:
-    """Create a Markdown file with sections."""
+@pytest.fixture(scope="module")
+def temp_doc_with_sections(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a Markdown file with sections, shared read-only by this module."""
+    tmp_path = tmp_path_factory.mktemp("docs")
     doc_file = tmp_path / "test.md"
     doc_file.write_text(
         """# Test Document
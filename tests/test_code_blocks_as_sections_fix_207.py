@@ -8,23 +8,12 @@ from pathlib import Path
 
 import pytest
 
-from dacli.asciidoc_parser import AsciidocStructureParser
+from dacli.asciidoc_parser import AsciidocStructureParser, _is_block_delimiter
 from dacli.markdown_parser import MarkdownStructureParser
+from dacli.parser_utils import collect_all_sections
 
-
-class TestAsciiDocCodeBlocks:
-    """Test that AsciiDoc code blocks don't create phantom sections."""
-
-    @pytest.fixture
-    def parser(self, tmp_path: Path) -> AsciidocStructureParser:
-        """Create parser instance."""
-        return AsciidocStructureParser(base_path=tmp_path)
-
-    def test_source_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside source blocks should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+# Documents under test
+_ADOC_SOURCE_BLOCK = """= Document
 
 == Section with Code
 
@@ -37,35 +26,9 @@ Should not be parsed as section
 == Real Next Section
 
 Content here.
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        # Should have 3 sections: document title + 2 real sections
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
+"""
 
-        assert len(all_sections) == 3
-        section_titles = [s.title for s in all_sections]
-        assert "Document" in section_titles
-        assert "Section with Code" in section_titles
-        assert "Real Next Section" in section_titles
-        # The phantom section should NOT exist
-        assert "This looks like a section but is code" not in section_titles
-
-    def test_listing_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside listing blocks should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_LISTING_BLOCK = """= Document
 
 == Section
 
@@ -75,29 +38,9 @@ Not a real section
 ----
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "This is inside a listing block" not in section_titles
+"""
 
-    def test_literal_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside literal blocks (....) should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_LITERAL_BLOCK = """= Document
 
 == Section
 
@@ -107,29 +50,9 @@ Not a real section
 ....
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "This is inside a literal block" not in section_titles
+"""
 
-    def test_sidebar_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside sidebar blocks (****) should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_SIDEBAR_BLOCK = """= Document
 
 == Section
 
@@ -139,29 +62,9 @@ Not a real section
 ****
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "This is inside a sidebar block" not in section_titles
+"""
 
-    def test_example_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside example blocks (====) should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_EXAMPLE_BLOCK = """= Document
 
 == Section
 
@@ -171,29 +74,9 @@ Not a real section
 ====
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "This is inside an example block" not in section_titles
+"""
 
-    def test_quote_block_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside quote blocks (____) should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_QUOTE_BLOCK = """= Document
 
 == Section
 
@@ -203,29 +86,9 @@ Not a real section
 ____
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "This is inside a quote block" not in section_titles
+"""
 
-    def test_table_with_section_marker(self, parser, tmp_path: Path):
-        """Section markers inside tables should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_TABLE = """= Document
 
 == Section
 
@@ -236,29 +99,9 @@ ____
 |===
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "Not a section" not in section_titles
+"""
 
-    def test_multiple_code_blocks_with_sections(self, parser, tmp_path: Path):
-        """Multiple code blocks with section markers should all be ignored (Issue #207)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_MULTIPLE_CODE_BLOCKS = """= Document
 
 == First Section
 
@@ -275,32 +118,9 @@ ____
 ----
 
 == Third Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        # Should have 4 sections: document + 3 real sections
-        assert len(all_sections) == 4
-        section_titles = [s.title for s in all_sections]
-        assert "Phantom 1" not in section_titles
-        assert "Phantom 2" not in section_titles
+"""
 
-    def test_nested_block_example(self, parser, tmp_path: Path):
-        """Code block showing another code block should not create phantom sections."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document
+_ADOC_NESTED_BLOCK = """= Document
 
 == How to Write AsciiDoc
 
@@ -317,29 +137,9 @@ print("hello")
 ----
 
 == Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "Example Section" not in section_titles  # Inside code block
+"""
 
-    def test_real_sections_still_work(self, parser, tmp_path: Path):
-        """Real sections outside blocks should still be parsed correctly (regression)."""
-        test_file = tmp_path / "test.adoc"
-        test_file.write_text(
-            """= Document Title
+_ADOC_REAL_SECTIONS = """= Document Title
 
 == Chapter 1
 
@@ -352,43 +152,9 @@ Content 1.1
 == Chapter 2
 
 Content 2
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        # Should have all real sections
-        assert len(all_sections) == 4
-        section_titles = [s.title for s in all_sections]
-        assert "Document Title" in section_titles
-        assert "Chapter 1" in section_titles
-        assert "Subsection 1.1" in section_titles
-        assert "Chapter 2" in section_titles
-
-
-class TestMarkdownCodeBlocks:
-    """Test that Markdown code blocks don't create phantom sections."""
-
-    @pytest.fixture
-    def parser(self, tmp_path: Path) -> MarkdownStructureParser:
-        """Create parser instance."""
-        return MarkdownStructureParser(base_path=tmp_path)
+"""
 
-    def test_fenced_code_block_with_heading(self, parser, tmp_path: Path):
-        """Headings inside fenced code blocks should be ignored (Issue #207)."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
+_MD_FENCED_CODE_BLOCK = """# Document
 
 ## Section with Code
 
@@ -400,33 +166,9 @@ Should not be parsed as section
 ## Real Next Section
 
 Content here.
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
+"""
 
-        section_titles = [s.title for s in all_sections]
-        assert "Document" in section_titles
-        assert "Section with Code" in section_titles
-        assert "Real Next Section" in section_titles
-        # The phantom section should NOT exist
-        assert "This looks like a heading but is code" not in section_titles
-
-    def test_multiple_heading_levels_in_code(self, parser, tmp_path: Path):
-        """Multiple heading levels inside code blocks should all be ignored."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
+_MD_HEADING_LEVELS_IN_CODE = """# Document
 
 ## Section
 
@@ -437,31 +179,9 @@ Content here.
 ```
 
 ## Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "H1 in code" not in section_titles
-        assert "H2 in code" not in section_titles
-        assert "H3 in code" not in section_titles
+"""
 
-    def test_code_fence_with_language_specifier(self, parser, tmp_path: Path):
-        """Code blocks with language specifiers should ignore headings."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
+_MD_LANGUAGE_FENCE = """# Document
 
 ## API Documentation
 
@@ -473,30 +193,9 @@ def hello():
 ```
 
 ## Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "Not a markdown heading, just a Python comment" not in section_titles
-        assert "Also not a heading" not in section_titles
+"""
 
-    def test_tildes_code_fence(self, parser, tmp_path: Path):
-        """Tilde code fences (~~~) should also prevent heading parsing."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
+_MD_TILDE_FENCE = """# Document
 
 ## Section
 
@@ -505,29 +204,9 @@ def hello():
 ~~~
 
 ## Next Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "Heading inside tildes" not in section_titles
+"""
 
-    def test_multiple_code_blocks(self, parser, tmp_path: Path):
-        """Multiple code blocks with headings should all be handled correctly."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
+_MD_MULTIPLE_CODE_BLOCKS = """# Document
 
 ## First Section
 
@@ -542,30 +221,9 @@ def hello():
 ```
 
 ## Third Section
-""",
-            encoding="utf-8",
-        )
-
-        doc = parser.parse_file(test_file)
-
-        all_sections = []
-
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
-
-        collect(doc.sections)
-
-        section_titles = [s.title for s in all_sections]
-        assert "Phantom 1" not in section_titles
-        assert "Phantom 2" not in section_titles
+"""
 
-    def test_real_headings_still_work(self, parser, tmp_path: Path):
-        """Real headings outside code blocks should still be parsed (regression)."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document Title
+_MD_REAL_HEADINGS = """# Document Title
 
 ## Chapter 1
 
@@ -578,55 +236,244 @@ Content 1.1
 ## Chapter 2
 
 Content 2
-""",
-            encoding="utf-8",
-        )
+"""
+
+_MD_BLOCKQUOTE = """# Document
+
+## Section
 
-        doc = parser.parse_file(test_file)
+> ## This is a quoted heading
+> Not a real section
+
+## Next Section
+"""
+
+
+@pytest.fixture(scope="module")
+def adoc_parser(tmp_path_factory: pytest.TempPathFactory) -> AsciidocStructureParser:
+    """Create one AsciiDoc parser instance for the whole module.
+
+    The test file lives outside base_path, so section paths are
+    prefixed with the bare file name.
+    """
+    return AsciidocStructureParser(base_path=tmp_path_factory.mktemp("adoc_parser_root"))
+
+
+@pytest.fixture(scope="module")
+def md_parser(tmp_path_factory: pytest.TempPathFactory) -> MarkdownStructureParser:
+    """Create one Markdown parser instance for the whole module.
+
+    The test file lives outside base_path, so section paths are
+    prefixed with the bare file name.
+    """
+    return MarkdownStructureParser(base_path=tmp_path_factory.mktemp("md_parser_root"))
+
+
+@pytest.fixture(scope="module")
+def adoc_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of the AsciiDoc document file, shared by the module.
+
+    Every test writes its whole document before parsing, so no cleanup
+    is needed between tests.
+    """
+    return tmp_path_factory.mktemp("adoc_docs") / "test.adoc"
+
+
+@pytest.fixture(scope="module")
+def md_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of the Markdown document file, shared by the module.
+
+    Every test writes its whole document before parsing, so no cleanup
+    is needed between tests.
+    """
+    return tmp_path_factory.mktemp("md_docs") / "test.md"
+
+
+class TestAsciiDocCodeBlocks:
+    """Test that AsciiDoc code blocks don't create phantom sections."""
 
-        all_sections = []
+    @pytest.mark.parametrize(
+        ("document", "expected_titles", "phantom_titles"),
+        [
+            pytest.param(
+                _ADOC_SOURCE_BLOCK,
+                ["Document", "Section with Code", "Real Next Section"],
+                ["This looks like a section but is code"],
+                id="source-block",
+            ),
+            pytest.param(
+                _ADOC_LISTING_BLOCK,
+                ["Document", "Section", "Next Section"],
+                ["This is inside a listing block"],
+                id="listing-block",
+            ),
+            pytest.param(
+                _ADOC_LITERAL_BLOCK,
+                ["Document", "Section", "Next Section"],
+                ["This is inside a literal block"],
+                id="literal-block",
+            ),
+            pytest.param(
+                _ADOC_SIDEBAR_BLOCK,
+                ["Document", "Section", "Next Section"],
+                ["This is inside a sidebar block"],
+                id="sidebar-block",
+            ),
+            pytest.param(
+                _ADOC_EXAMPLE_BLOCK,
+                ["Document", "Section", "Next Section"],
+                ["This is inside an example block"],
+                id="example-block",
+            ),
+            pytest.param(
+                _ADOC_QUOTE_BLOCK,
+                ["Document", "Section", "Next Section"],
+                ["This is inside a quote block"],
+                id="quote-block",
+            ),
+            pytest.param(
+                _ADOC_TABLE,
+                ["Document", "Section", "Next Section"],
+                ["Not a section"],
+                id="table",
+            ),
+            pytest.param(
+                _ADOC_MULTIPLE_CODE_BLOCKS,
+                ["Document", "First Section", "Second Section", "Third Section"],
+                ["Phantom 1", "Phantom 2"],
+                id="multiple-code-blocks",
+            ),
+            pytest.param(
+                _ADOC_NESTED_BLOCK,
+                ["Document", "How to Write AsciiDoc", "Next Section"],
+                ["Example Section"],
+                id="nested-block-example",
+            ),
+        ],
+    )
+    def test_section_marker_inside_block_is_ignored(
+        self, adoc_parser, adoc_file: Path, document, expected_titles, phantom_titles
+    ):
+        """Section markers inside delimited blocks and tables should be ignored (Issue #207)."""
+        adoc_file.write_text(document, encoding="utf-8")
+
+        doc = adoc_parser.parse_file(adoc_file)
+
+        all_sections: list = []
+        collect_all_sections(doc.sections, all_sections)
 
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
+        section_titles = [s.title for s in all_sections]
+        assert section_titles == expected_titles
+        for phantom in phantom_titles:
+            assert phantom not in section_titles
+
+    def test_real_sections_still_work(self, adoc_parser, adoc_file: Path):
+        """Real sections outside blocks should still be parsed correctly (regression)."""
+        adoc_file.write_text(_ADOC_REAL_SECTIONS, encoding="utf-8")
 
-        collect(doc.sections)
+        doc = adoc_parser.parse_file(adoc_file)
+
+        all_sections: list = []
+        collect_all_sections(doc.sections, all_sections)
 
         # Should have all real sections
+        assert len(all_sections) == 4
         section_titles = [s.title for s in all_sections]
         assert "Document Title" in section_titles
         assert "Chapter 1" in section_titles
         assert "Subsection 1.1" in section_titles
         assert "Chapter 2" in section_titles
 
-    def test_blockquote_with_heading_is_already_safe(self, parser, tmp_path: Path):
-        """Blockquotes with headings don't match HEADING_PATTERN (verification test)."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(
-            """# Document
 
-## Section
+class TestIsBlockDelimiter:
+    """Test the regex-free AsciiDoc block delimiter check."""
 
-> ## This is a quoted heading
-> Not a real section
+    @pytest.mark.parametrize("line", ["----", "....", "****", "====", "____", "------", "========"])
+    def test_delimiters(self, line: str):
+        """A delimiter character repeated four or more times is a delimiter."""
+        assert _is_block_delimiter(line)
 
-## Next Section
-""",
-            encoding="utf-8",
-        )
+    @pytest.mark.parametrize(
+        "line", ["", "---", "===", "-----x", "--==", "---- ", " ----", "== Title", "|==="]
+    )
+    def test_non_delimiters(self, line: str):
+        """Short, mixed, padded or non-delimiter lines are not delimiters."""
+        assert not _is_block_delimiter(line)
 
-        doc = parser.parse_file(test_file)
 
-        all_sections = []
+class TestMarkdownCodeBlocks:
+    """Test that Markdown code blocks don't create phantom sections."""
 
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s)
-                collect(s.children)
+    @pytest.mark.parametrize(
+        ("document", "expected_titles", "phantom_titles"),
+        [
+            pytest.param(
+                _MD_FENCED_CODE_BLOCK,
+                ["Document", "Section with Code", "Real Next Section"],
+                ["This looks like a heading but is code"],
+                id="fenced-code-block",
+            ),
+            pytest.param(
+                _MD_HEADING_LEVELS_IN_CODE,
+                ["Document", "Section", "Next Section"],
+                ["H1 in code", "H2 in code", "H3 in code"],
+                id="heading-levels-in-code",
+            ),
+            pytest.param(
+                _MD_LANGUAGE_FENCE,
+                ["Document", "API Documentation", "Next Section"],
+                ["Not a markdown heading, just a Python comment", "Also not a heading"],
+                id="language-specifier",
+            ),
+            pytest.param(
+                _MD_TILDE_FENCE,
+                ["Document", "Section", "Next Section"],
+                ["Heading inside tildes"],
+                id="tilde-fence",
+            ),
+            pytest.param(
+                _MD_MULTIPLE_CODE_BLOCKS,
+                ["Document", "First Section", "Second Section", "Third Section"],
+                ["Phantom 1", "Phantom 2"],
+                id="multiple-code-blocks",
+            ),
+            # Blockquotes already don't match because pattern starts with ^#{1,6}
+            pytest.param(
+                _MD_BLOCKQUOTE,
+                ["Document", "Section", "Next Section"],
+                ["This is a quoted heading"],
+                id="blockquote",
+            ),
+        ],
+    )
+    def test_heading_inside_block_is_ignored(
+        self, md_parser, md_file: Path, document, expected_titles, phantom_titles
+    ):
+        """Headings inside code fences and blockquotes should be ignored (Issue #207)."""
+        md_file.write_text(document, encoding="utf-8")
+
+        doc = md_parser.parse_file(md_file)
+
+        all_sections: list = []
+        collect_all_sections(doc.sections, all_sections)
 
-        collect(doc.sections)
+        section_titles = [s.title for s in all_sections]
+        assert section_titles == expected_titles
+        for phantom in phantom_titles:
+            assert phantom not in section_titles
+
+    def test_real_headings_still_work(self, md_parser, md_file: Path):
+        """Real headings outside code blocks should still be parsed (regression)."""
+        md_file.write_text(_MD_REAL_HEADINGS, encoding="utf-8")
+
+        doc = md_parser.parse_file(md_file)
+
+        all_sections: list = []
+        collect_all_sections(doc.sections, all_sections)
 
+        # Should have all real sections
         section_titles = [s.title for s in all_sections]
-        # Blockquotes already don't match because pattern starts with ^#{1,6}
-        assert "This is a quoted heading" not in section_titles
+        assert "Document Title" in section_titles
+        assert "Chapter 1" in section_titles
+        assert "Subsection 1.1" in section_titles
+        assert "Chapter 2" in section_titles
@@ -145,6 +145,25 @@ Content 2
         # Should have proper spacing
         assert "\n\n" in updated_content
 
+    def test_update_after_form_feed_keeps_line_numbers(self, tmp_path, cli_runner):
+        """Test that a form feed in the text does not shift section line numbers."""
+        from dacli.asciidoc_parser import AsciidocStructureParser
+
+        test_file = tmp_path / "a.adoc"
+        test_file.write_text("= Doc\n\nIntro\x0cmore\n\n== Sec\n\ntext\n", encoding="utf-8")
+
+        doc = AsciidocStructureParser(base_path=tmp_path).parse_file(test_file)
+        assert doc.sections[0].children[0].source_location.line == 6
+
+        result = cli_runner.invoke(
+            ["--docs-root", str(tmp_path), "update", "a:sec", "--content", "new text"]
+        )
+
+        assert result.exit_code == 0
+        updated_content = test_file.read_text(encoding="utf-8")
+        assert updated_content.startswith("= Doc\n\nIntro\x0cmore\n\n== Sec\n\nnew text\n")
+        assert "\ntext\n" not in updated_content
+
 
 class TestAppendPositionFix197:
     """Tests for Issue #197: append inserts at beginning instead of end."""
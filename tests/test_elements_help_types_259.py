@@ -9,63 +9,69 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
-from dacli.cli import cli
+from dacli.cli import VALID_ELEMENT_TYPES, cli
 from dacli.mcp_app import create_mcp_server
 
 
-@pytest.fixture
-def docs_dir(tmp_path: Path) -> Path:
-    """Create minimal docs for testing."""
+@pytest.fixture(scope="module")
+def docs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create minimal docs for testing, shared read-only by this module."""
+    tmp_path = tmp_path_factory.mktemp("docs")
     (tmp_path / "test.md").write_text("# Test\n\nContent.\n", encoding="utf-8")
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def mcp_server(docs_dir: Path):
+    """Create the MCP server once for the tests that inspect its tools."""
+    return create_mcp_server(docs_dir)
+
+
+@pytest.fixture(scope="module")
+def tools_by_name(mcp_server) -> dict:
+    """Map the MCP server's tool names to their tools for direct lookup."""
+    return {tool.name: tool for tool in mcp_server._tool_manager._tools.values()}
+
+
 class TestElementsHelpTypes:
     """Test that element type help texts match actual valid types."""
 
-    VALID_TYPES = {"admonition", "code", "image", "list", "plantuml", "table"}
+    VALID_TYPES = frozenset({"admonition", "code", "image", "list", "plantuml", "table"})
 
     def test_cli_help_lists_correct_types(self, docs_dir: Path):
         """CLI help for elements should list all valid types including plantuml/admonition."""
         runner = CliRunner()
         result = runner.invoke(cli, ["--docs-root", str(docs_dir), "elements", "--help"])
         assert result.exit_code == 0
+        output = result.output
         # Should contain the correct types
-        assert "plantuml" in result.output
-        assert "admonition" in result.output
+        missing = sorted(t for t in self.VALID_TYPES if t not in output)
+        assert not missing, f"Types missing from help: {missing}"
         # Should NOT contain 'diagram' as a type
-        assert "diagram" not in result.output
+        assert "diagram" not in output
 
-    def test_mcp_tool_docstring_lists_correct_types(self, docs_dir: Path):
+    def test_mcp_tool_docstring_lists_correct_types(self, tools_by_name: dict):
         """MCP get_elements tool docstring should list correct types in Args section."""
-        mcp = create_mcp_server(docs_dir)
-        elements_tool = None
-        for tool in mcp._tool_manager._tools.values():
-            if tool.name == "get_elements":
-                elements_tool = tool
-                break
-        assert elements_tool is not None
-        docstring = elements_tool.fn.__doc__
+        assert "get_elements" in tools_by_name
+        docstring = tools_by_name["get_elements"].fn.__doc__
         # The Args section listing valid types should include the correct ones
         assert "'plantuml'" in docstring
         assert "'admonition'" in docstring
         # The type listing should NOT contain 'diagram' as a quoted type
         assert "'diagram'" not in docstring
 
-    def test_cli_accepts_plantuml_type(self, docs_dir: Path):
-        """CLI should accept plantuml as a valid element type without warning."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli, ["--docs-root", str(docs_dir), "elements", "--type", "plantuml"]
-        )
-        assert "Warning" not in result.output
+    def test_valid_element_types_match_model(self):
+        """The CLI's valid types should be exactly the Element model's types."""
+        assert VALID_ELEMENT_TYPES == self.VALID_TYPES | {"blockquote"}
 
-    def test_cli_accepts_admonition_type(self, docs_dir: Path):
-        """CLI should accept admonition as a valid element type without warning."""
+    @pytest.mark.parametrize("element_type", ["plantuml", "admonition"])
+    def test_cli_accepts_type_without_warning(self, docs_dir: Path, element_type: str):
+        """CLI should accept plantuml and admonition as element types without warning."""
         runner = CliRunner()
         result = runner.invoke(
-            cli, ["--docs-root", str(docs_dir), "elements", "--type", "admonition"]
+            cli, ["--docs-root", str(docs_dir), "elements", "--type", element_type]
         )
+        assert result.exit_code == 0
         assert "Warning" not in result.output
 
     def test_cli_warns_on_diagram_type(self, docs_dir: Path):
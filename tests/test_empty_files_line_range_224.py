@@ -3,6 +3,7 @@
 Empty files should either be skipped or have a valid line range (end_line >= line).
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -11,9 +12,13 @@ from click.testing import CliRunner
 from dacli.cli import cli
 
 
-@pytest.fixture
-def temp_doc_with_empty_file(tmp_path: Path) -> Path:
-    """Create a folder with an empty file and a normal file."""
+@pytest.fixture(scope="module")
+def temp_doc_with_empty_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a folder with an empty file and a normal file.
+
+    Module-scoped: the tests only read the folder.
+    """
+    tmp_path = tmp_path_factory.mktemp("empty_files_224")
     # Empty file
     empty_file = tmp_path / "empty.md"
     empty_file.write_text("", encoding="utf-8")
@@ -30,58 +35,43 @@ Some content here.
     return tmp_path
 
 
-class TestEmptyFilesLineRange:
-    """Test that empty files have valid line ranges."""
-
-    def test_empty_file_valid_line_range(self, temp_doc_with_empty_file: Path):
-        """Issue #224: Empty files should have valid line range (end_line >= line)."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            ["--docs-root", str(temp_doc_with_empty_file), "--format", "json", "structure"],
-        )
-
-        assert result.exit_code == 0
-
-        import json
-
-        data = json.loads(result.output)
-
-        # Find all sections and check line ranges
-        def check_line_ranges(sections):
-            for section in sections:
-                location = section.get("location", {})
-                line = location.get("line", 1)
-                end_line = location.get("end_line", 1)
+@pytest.fixture(scope="module")
+def structure_data(temp_doc_with_empty_file: Path) -> dict:
+    """Run the structure command once and return its parsed JSON output."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["--docs-root", str(temp_doc_with_empty_file), "--format", "json", "structure"],
+    )
 
-                # end_line should be >= line (valid range)
-                assert end_line >= line, (
-                    f"Invalid line range for '{section.get('path')}': "
-                    f"line={line}, end_line={end_line}"
-                )
+    assert result.exit_code == 0
+    return json.loads(result.output)
 
-                # Check children recursively
-                if section.get("children"):
-                    check_line_ranges(section["children"])
 
-        check_line_ranges(data.get("sections", []))
+class TestEmptyFilesLineRange:
+    """Test that empty files have valid line ranges."""
 
-    def test_normal_file_line_range(self, temp_doc_with_empty_file: Path):
+    def test_empty_file_valid_line_range(self, structure_data: dict):
+        """Issue #224: Empty files should have valid line range (end_line >= line)."""
+        # Walk all sections with an explicit stack and collect invalid line
+        # ranges (end_line < line), then report them in one assertion
+        invalid = []
+        pending = list(structure_data.get("sections", []))
+        while pending:
+            section = pending.pop()
+            location = section.get("location", {})
+            line = location.get("line", 1)
+            end_line = location.get("end_line", 1)
+            if end_line < line:
+                invalid.append(f"{section.get('path')}: line={line}, end_line={end_line}")
+            pending.extend(section.get("children", []))
+
+        assert not invalid, f"Invalid line ranges: {invalid}"
+
+    def test_normal_file_line_range(self, structure_data: dict):
         """Normal files should have proper line ranges."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            ["--docs-root", str(temp_doc_with_empty_file), "--format", "json", "structure"],
-        )
-
-        assert result.exit_code == 0
-
-        import json
-
-        data = json.loads(result.output)
-
         # Find the normal document
-        for section in data.get("sections", []):
+        for section in structure_data.get("sections", []):
             if "normal" in section.get("path", "").lower():
                 location = section.get("location", {})
                 assert location.get("line", 0) >= 1
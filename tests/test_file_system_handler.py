@@ -179,6 +179,12 @@ class TestWriteFile:
         assert new_file.exists()
         assert new_file.read_text(encoding="utf-8") == "Brand new content\n"
 
+    def test_write_file_accepts_lines(self, handler: FileSystemHandler, temp_file: Path):
+        """Write an iterable of lines in order."""
+        handler.write_file(temp_file, ["First line\n", "Second line\n"])
+
+        assert temp_file.read_text(encoding="utf-8") == "First line\nSecond line\n"
+
     def test_write_file_no_backup_remains(self, handler: FileSystemHandler, temp_file: Path):
         """No .bak file remains after successful write."""
         handler.write_file(temp_file, "New content\n")
@@ -112,6 +112,20 @@ class TestFindDocFiles:
         assert len(files) == 2
         assert all(f.suffix == ".md" for f in files)
 
+    def test_finds_files_for_multiple_patterns(self, tmp_path: Path):
+        """Should find files matching any of several patterns in one walk."""
+        from dacli.file_utils import find_doc_files
+
+        subdir = tmp_path / "chapters"
+        subdir.mkdir()
+        (tmp_path / "doc1.adoc").write_text("= Doc 1")
+        (subdir / "doc2.md").write_text("# Doc 2")
+        (tmp_path / "notes.txt").write_text("Not a doc")
+
+        files = list(find_doc_files(tmp_path, ("*.adoc", "*.md")))
+
+        assert sorted(f.name for f in files) == ["doc1.adoc", "doc2.md"]
+
     def test_finds_files_recursively(self, tmp_path: Path):
         """Should find files in subdirectories."""
         from dacli.file_utils import find_doc_files
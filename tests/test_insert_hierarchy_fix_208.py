@@ -371,3 +371,36 @@ Child
         assert section_a_new is not None
         assert len(section_a_new.children) == 1
         assert section_a_new.children[0].title == "Subsection A1"
+
+
+class TestInsertAfterDeepHierarchy:
+    """Test that the last-descendant lookup does not depend on recursion depth."""
+
+    def test_end_with_children_beyond_recursion_limit(self, tmp_path: Path):
+        """A descendant chain deeper than the recursion limit resolves to the deepest leaf."""
+        import sys
+
+        from dacli.api.manipulation import _get_section_end_with_children
+        from dacli.models import Section, SourceLocation
+
+        test_file = tmp_path / "test.adoc"
+        depth = sys.getrecursionlimit() + 100
+
+        root = Section(
+            title="Root",
+            level=1,
+            path="test:root",
+            source_location=SourceLocation(file=test_file, line=1, end_line=1),
+        )
+        node = root
+        for i in range(depth):
+            child = Section(
+                title=f"Child {i}",
+                level=2,
+                path=f"test:root.child-{i}",
+                source_location=SourceLocation(file=test_file, line=i + 2, end_line=i + 2),
+            )
+            node.children.append(child)
+            node = child
+
+        assert _get_section_end_with_children(root, test_file) == depth + 1
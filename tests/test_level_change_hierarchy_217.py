@@ -10,18 +10,24 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
+from dacli.asciidoc_parser import AsciidocStructureParser
 from dacli.cli import cli
 from dacli.file_handler import FileSystemHandler
 from dacli.services.content_service import update_section as service_update_section
 from dacli.structure_index import StructureIndex
 
 
-@pytest.fixture
-def temp_doc_with_children(tmp_path: Path) -> Path:
-    """Create a temporary directory with a document that has parent-child sections."""
-    doc_file = tmp_path / "test.adoc"
-    doc_file.write_text(
-        """= Test Document
+def _assert_file_contains(path: Path, *needles: str, forbid: tuple[str, ...] = ()) -> None:
+    """Read a file once and check which strings it does and does not contain."""
+    text = path.read_text(encoding="utf-8")
+    for needle in needles:
+        assert needle in text, f"{needle!r} not found in {path.name}"
+    for needle in forbid:
+        assert needle not in text, f"{needle!r} unexpectedly found in {path.name}"
+
+
+# Document under test
+_DOC_WITH_CHILDREN = """= Test Document
 
 == Parent Section
 
@@ -34,28 +40,60 @@ Content of child section.
 == Another Section
 
 Content of another section.
-""",
-        encoding="utf-8",
-    )
+"""
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Return (mtime_ns, size) of a file to detect whether it was written."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@pytest.fixture(scope="class")
+def temp_doc_with_children(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory with a document that has parent-child sections.
+
+    Class-scoped; restore_doc_file puts the original text back after each test.
+    """
+    tmp_path = tmp_path_factory.mktemp("level_change_217")
+    doc_file = tmp_path / "test.adoc"
+    doc_file.write_text(_DOC_WITH_CHILDREN, encoding="utf-8")
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def restore_doc_file(temp_doc_with_children: Path):
+    """Restore the document text after each test that updated it.
+
+    Most tests leave the file alone, so the rewrite is skipped unless the
+    file's modification time or size changed during the test.
+    """
+    doc_file = temp_doc_with_children / "test.adoc"
+    stamp = _file_stamp(doc_file)
+    yield
+    if _file_stamp(doc_file) != stamp:
+        doc_file.write_text(_DOC_WITH_CHILDREN, encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def cli_runner() -> CliRunner:
+    """Create one CLI runner for the module; invoke() keeps no state between calls."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="class")
 def index_and_handler(temp_doc_with_children: Path):
-    """Create index and file handler for tests."""
-    from dacli.asciidoc_parser import AsciidocStructureParser
+    """Create index and file handler for tests.
 
+    Class-scoped: update_section does not modify the index, and the document
+    is restored after each test, so the index stays valid for the whole class.
+    """
     parser = AsciidocStructureParser(base_path=temp_doc_with_children)
     index = StructureIndex()
     file_handler = FileSystemHandler()
 
-    # Parse and index the test documents
-    documents = []
-    for doc_file in temp_doc_with_children.glob("*.adoc"):
-        doc = parser.parse_file(doc_file)
-        documents.append(doc)
-
-    index.build_from_documents(documents)
+    # The fixture folder holds exactly one known document
+    index.build_from_documents([parser.parse_file(temp_doc_with_children / "test.adoc")])
 
     return index, file_handler
 
@@ -85,10 +123,12 @@ class TestLevelChangeWithChildrenRejected:
         assert "level" in error_msg or "children" in error_msg or "hierarchy" in error_msg
 
         # Verify the original content is unchanged
-        doc_file = temp_doc_with_children / "test.adoc"
-        file_content = doc_file.read_text(encoding="utf-8")
-        assert "== Parent Section" in file_content
-        assert "=== Child Section" in file_content
+        _assert_file_contains(
+            temp_doc_with_children / "test.adoc",
+            "== Parent Section",
+            "=== Child Section",
+            forbid=("Parent Now Level 2",),
+        )
 
     def test_same_level_with_children_succeeds(
         self, index_and_handler, temp_doc_with_children: Path
@@ -107,11 +147,10 @@ class TestLevelChangeWithChildrenRejected:
 
         assert result["success"] is True
 
-        # Verify the title was changed
-        doc_file = temp_doc_with_children / "test.adoc"
-        file_content = doc_file.read_text(encoding="utf-8")
-        assert "== Renamed Parent" in file_content
-        assert "=== Child Section" in file_content  # Child still there
+        # Verify the title was changed and the child is still there
+        _assert_file_contains(
+            temp_doc_with_children / "test.adoc", "== Renamed Parent", "=== Child Section"
+        )
 
     def test_level_change_without_children_rejected(
         self, index_and_handler, temp_doc_with_children: Path
@@ -135,10 +174,11 @@ class TestLevelChangeWithChildrenRejected:
 class TestCLILevelChangeValidation:
     """Test CLI --no-preserve-title with level change validation."""
 
-    def test_cli_level_change_with_children_fails(self, temp_doc_with_children: Path):
+    def test_cli_level_change_with_children_fails(
+        self, cli_runner: CliRunner, temp_doc_with_children: Path
+    ):
         """CLI --no-preserve-title with level change on parent should fail."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             cli,
             [
                 "--docs-root",
@@ -157,14 +197,17 @@ class TestCLILevelChangeValidation:
         assert "level" in error_msg or "children" in error_msg or "hierarchy" in error_msg
 
         # Verify original content unchanged
-        doc_file = temp_doc_with_children / "test.adoc"
-        file_content = doc_file.read_text(encoding="utf-8")
-        assert "== Parent Section" in file_content
+        _assert_file_contains(
+            temp_doc_with_children / "test.adoc",
+            "== Parent Section",
+            forbid=("Parent Now Level 2",),
+        )
 
-    def test_cli_same_level_with_children_succeeds(self, temp_doc_with_children: Path):
+    def test_cli_same_level_with_children_succeeds(
+        self, cli_runner: CliRunner, temp_doc_with_children: Path
+    ):
         """CLI --no-preserve-title keeping same level should succeed."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             cli,
             [
                 "--docs-root",
@@ -180,6 +223,4 @@ class TestCLILevelChangeValidation:
         assert result.exit_code == 0
 
         # Verify the change was made
-        doc_file = temp_doc_with_children / "test.adoc"
-        file_content = doc_file.read_text(encoding="utf-8")
-        assert "== Renamed Parent" in file_content
+        _assert_file_contains(temp_doc_with_children / "test.adoc", "== Renamed Parent")
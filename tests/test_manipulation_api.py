@@ -286,6 +286,22 @@ class TestInsertContent:
         file_content = doc_file.read_text(encoding="utf-8")
         assert "Additional paragraph at end" in file_content
 
+    def test_insert_reads_file_once(self, client: TestClient, temp_doc_dir: Path):
+        """UC-09: Insert reads the target file only once, even without end_line."""
+        from dacli.api.manipulation import _file_handler
+
+        with patch.object(_file_handler, "read_file", wraps=_file_handler.read_file) as mock_read:
+            response = client.post(
+                "/api/v1/section/introduction/insert",
+                json={
+                    "position": "after",
+                    "content": "\n== Summary\n\nThis is a summary.\n",
+                },
+            )
+
+        assert response.status_code == 200
+        assert mock_read.call_count == 1
+
     def test_insert_invalid_position(self, client: TestClient):
         """UC-09: Invalid position returns 422 (validation error)."""
         response = client.post(
@@ -17,6 +17,16 @@ from dacli.mcp_app import create_mcp_server
 from dacli.services.content_service import update_section as service_update_section
 from dacli.structure_index import StructureIndex
 
+
+def _assert_file_contains(path: Path, *needles: str, forbid: tuple[str, ...] = ()) -> None:
+    """Read a file once and check which strings it does and does not contain."""
+    text = path.read_text(encoding="utf-8")
+    for needle in needles:
+        assert needle in text, f"{needle!r} not found in {path.name}"
+    for needle in forbid:
+        assert needle not in text, f"{needle!r} unexpectedly found in {path.name}"
+
+
 # ============================================================================
 # Bug #245: update_section preserve_title=False heading level validation
 # ============================================================================
@@ -121,10 +131,12 @@ class TestBug245HeadingLevelValidation:
         assert "heading level" in result["error"].lower()
 
         # Verify original content is unchanged
-        doc_file = adoc_doc_dir / "test.adoc"
-        file_content = doc_file.read_text(encoding="utf-8")
-        assert "== Section 1" in file_content
-        assert "Content of section 1." in file_content
+        _assert_file_contains(
+            adoc_doc_dir / "test.adoc",
+            "== Section 1",
+            "Content of section 1.",
+            forbid=("Wrong Level Title",),
+        )
 
     def test_deeper_level_without_children_rejected(self, index_and_handler, adoc_doc_dir: Path):
         """Bug #245: Changing from level 1 to level 3 should fail."""
@@ -258,15 +270,10 @@ class TestBug244InsertAfterBlankLine:
 
         doc_file = md_for_insert / "test.md"
         content = doc_file.read_text()
-        lines = content.split("\n")
-
-        # Find "## Section 2" line
-        sec2_idx = next(i for i, line in enumerate(lines) if "## Section 2" in line)
 
         # The line before Section 2 should be blank
-        assert lines[sec2_idx - 1].strip() == "", (
-            f"Expected blank line before '## Section 2' but got: '{lines[sec2_idx - 1]}'\n"
-            f"Full content:\n{content}"
+        assert "\n\n## Section 2" in content, (
+            f"Expected blank line before '## Section 2'\nFull content:\n{content}"
         )
 
     def test_insert_plain_text_after_section_blank_line_before_next(self, md_for_insert: Path):
@@ -286,15 +293,10 @@ class TestBug244InsertAfterBlankLine:
 
         doc_file = md_for_insert / "test.md"
         content = doc_file.read_text()
-        lines = content.split("\n")
-
-        # Find "## Section 2" line
-        sec2_idx = next(i for i, line in enumerate(lines) if "## Section 2" in line)
 
         # The line before Section 2 should be blank
-        assert lines[sec2_idx - 1].strip() == "", (
-            f"Expected blank line before '## Section 2' but got: '{lines[sec2_idx - 1]}'\n"
-            f"Full content:\n{content}"
+        assert "\n\n## Section 2" in content, (
+            f"Expected blank line before '## Section 2'\nFull content:\n{content}"
         )
 
     def test_insert_heading_after_has_blank_line_separation(self, md_for_insert: Path):
@@ -314,18 +316,11 @@ class TestBug244InsertAfterBlankLine:
 
         doc_file = md_for_insert / "test.md"
         content = doc_file.read_text()
-        lines = content.split("\n")
-
-        # Find all heading positions
-        sec2_idx = next(i for i, line in enumerate(lines) if "## Section 2" in line)
-        inserted_idx = next(i for i, line in enumerate(lines) if "## Inserted Heading" in line)
 
         # Inserted heading should come before Section 2
-        assert inserted_idx < sec2_idx
+        assert content.index("## Inserted Heading") < content.index("## Section 2")
 
         # There should be a blank line between inserted content and Section 2
-        assert lines[sec2_idx - 1].strip() == "", (
-            f"Expected blank line before '## Section 2' "
-            f"but got: '{lines[sec2_idx - 1]}'\n"
-            f"Full content:\n{content}"
+        assert "\n\n## Section 2" in content, (
+            f"Expected blank line before '## Section 2'\nFull content:\n{content}"
         )
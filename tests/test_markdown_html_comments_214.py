@@ -93,7 +93,7 @@ More content
 class TestMarkdownHtmlComments:
     """Test that HTML comments are properly ignored."""
 
-    def test_multiline_comment_ignored(self, temp_doc_with_html_comment: Path):
+    def test_multiline_comment_ignored(self, temp_doc_with_html_comment: Path, section_paths):
         """Issue #214: Multi-line HTML comments should be ignored."""
         parser = MarkdownStructureParser(base_path=temp_doc_with_html_comment)
         index = StructureIndex()
@@ -107,15 +107,7 @@ class TestMarkdownHtmlComments:
 
         # Get all section paths
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         # Should have 3 sections: document, section-1, section-2
         assert (
@@ -124,7 +116,9 @@ class TestMarkdownHtmlComments:
         assert "test:section-1" in paths
         assert "test:section-2" in paths
 
-    def test_single_line_comment_ignored(self, temp_doc_with_single_line_comment: Path):
+    def test_single_line_comment_ignored(
+        self, temp_doc_with_single_line_comment: Path, section_paths
+    ):
         """Single-line HTML comments should also be ignored."""
         parser = MarkdownStructureParser(base_path=temp_doc_with_single_line_comment)
         index = StructureIndex()
@@ -137,21 +131,15 @@ class TestMarkdownHtmlComments:
         index.build_from_documents(documents)
 
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         assert "test:single-line-commented-heading" not in paths
         assert "test:section-1" in paths
         assert "test:section-2" in paths
 
-    def test_multiple_comments_all_ignored(self, temp_doc_with_multiple_comments: Path):
+    def test_multiple_comments_all_ignored(
+        self, temp_doc_with_multiple_comments: Path, section_paths
+    ):
         """Multiple HTML comments should all be ignored."""
         parser = MarkdownStructureParser(base_path=temp_doc_with_multiple_comments)
         index = StructureIndex()
@@ -164,15 +152,7 @@ class TestMarkdownHtmlComments:
         index.build_from_documents(documents)
 
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         # Should only have sections 1-4, no commented headings
         assert (
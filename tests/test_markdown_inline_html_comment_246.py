@@ -9,12 +9,24 @@ from pathlib import Path
 import pytest
 
 from dacli.markdown_parser import MarkdownStructureParser
+from dacli.models import Document
 from dacli.structure_index import StructureIndex
 
 
-@pytest.fixture
-def temp_doc_inline_comment(tmp_path: Path) -> Path:
-    """Create a Markdown file with headings containing inline HTML comments."""
+def _parse_docs(docs_root: Path) -> list[Document]:
+    """Parse every Markdown file in docs_root."""
+    parser = MarkdownStructureParser(base_path=docs_root)
+    return [parser.parse_file(doc_file) for doc_file in docs_root.glob("*.md")]
+
+
+@pytest.fixture(scope="module")
+def inline_comment_docs(tmp_path_factory: pytest.TempPathFactory) -> list[Document]:
+    """Parse a Markdown file with headings containing inline HTML comments.
+
+    The tests only read the parsed documents, so the file is written and
+    parsed once per module.
+    """
+    tmp_path = tmp_path_factory.mktemp("inline_comment")
     doc_file = tmp_path / "test.md"
     doc_file.write_text(
         """# Document
@@ -29,12 +41,13 @@ More content.
 """,
         encoding="utf-8",
     )
-    return tmp_path
+    return _parse_docs(tmp_path)
 
 
-@pytest.fixture
-def temp_doc_multiple_inline_comments(tmp_path: Path) -> Path:
-    """Create a Markdown file with various inline comment patterns."""
+@pytest.fixture(scope="module")
+def multiple_inline_comment_docs(tmp_path_factory: pytest.TempPathFactory) -> list[Document]:
+    """Parse a Markdown file with various inline comment patterns."""
+    tmp_path = tmp_path_factory.mktemp("multiple_inline_comments")
     doc_file = tmp_path / "test.md"
     doc_file.write_text(
         """# Project <!-- draft -->
@@ -53,12 +66,13 @@ Questions.
 """,
         encoding="utf-8",
     )
-    return tmp_path
+    return _parse_docs(tmp_path)
 
 
-@pytest.fixture
-def temp_doc_mixed_comments(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def mixed_comment_docs(tmp_path_factory: pytest.TempPathFactory) -> list[Document]:
     """Inline comments on headings + block comments (should still skip block)."""
+    tmp_path = tmp_path_factory.mktemp("mixed_comments")
     doc_file = tmp_path / "test.md"
     doc_file.write_text(
         """# Document
@@ -78,46 +92,30 @@ More content.
 """,
         encoding="utf-8",
     )
-    return tmp_path
+    return _parse_docs(tmp_path)
 
 
 class TestInlineHtmlCommentHeadings:
     """Issue #246: Headings with inline HTML comments should be recognized."""
 
-    def test_heading_with_inline_comment_is_recognized(self, temp_doc_inline_comment: Path):
+    def test_heading_with_inline_comment_is_recognized(
+        self, inline_comment_docs: list[Document], section_paths
+    ):
         """A heading with an inline HTML comment should appear in structure."""
-        parser = MarkdownStructureParser(base_path=temp_doc_inline_comment)
         index = StructureIndex()
-
-        documents = []
-        for doc_file in temp_doc_inline_comment.glob("*.md"):
-            doc = parser.parse_file(doc_file)
-            documents.append(doc)
-
-        index.build_from_documents(documents)
+        index.build_from_documents(inline_comment_docs)
 
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         assert (
             "test:important" in paths
         ), f"Heading with inline comment should be recognized. Paths: {paths}"
         assert "test:normal-section" in paths
 
-    def test_inline_comment_stripped_from_title(self, temp_doc_inline_comment: Path):
+    def test_inline_comment_stripped_from_title(self, inline_comment_docs: list[Document]):
         """The inline HTML comment should be stripped from the heading title."""
-        parser = MarkdownStructureParser(base_path=temp_doc_inline_comment)
-
-        for doc_file in temp_doc_inline_comment.glob("*.md"):
-            doc = parser.parse_file(doc_file)
+        doc = inline_comment_docs[0]
 
         root = doc.sections[0]
         # Find the "Important" section
@@ -127,68 +125,51 @@ class TestInlineHtmlCommentHeadings:
         assert "-->" not in important_section.title
         assert important_section.title == "Important"
 
-    def test_multiple_inline_comments_all_recognized(self, temp_doc_multiple_inline_comments: Path):
+    def test_multiple_inline_comments_all_recognized(
+        self, multiple_inline_comment_docs: list[Document], section_paths
+    ):
         """Multiple headings with inline comments should all be recognized."""
-        parser = MarkdownStructureParser(base_path=temp_doc_multiple_inline_comments)
         index = StructureIndex()
-
-        documents = []
-        for doc_file in temp_doc_multiple_inline_comments.glob("*.md"):
-            doc = parser.parse_file(doc_file)
-            documents.append(doc)
-
-        index.build_from_documents(documents)
+        index.build_from_documents(multiple_inline_comment_docs)
 
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         assert "test:getting-started" in paths
         assert "test:installation" in paths
         assert "test:faq" in paths
 
-    def test_h1_with_inline_comment_title_cleaned(self, temp_doc_multiple_inline_comments: Path):
+    def test_h1_with_inline_comment_title_cleaned(
+        self, multiple_inline_comment_docs: list[Document]
+    ):
         """H1 document title should have inline comment stripped."""
-        parser = MarkdownStructureParser(base_path=temp_doc_multiple_inline_comments)
-
-        for doc_file in temp_doc_multiple_inline_comments.glob("*.md"):
-            doc = parser.parse_file(doc_file)
+        doc = multiple_inline_comment_docs[0]
 
         assert doc.title == "Project"
         assert "<!--" not in doc.title
 
-    def test_mixed_inline_and_block_comments(self, temp_doc_mixed_comments: Path):
+    def test_mixed_inline_and_block_comments(
+        self, mixed_comment_docs: list[Document], section_paths
+    ):
         """Inline comments on headings + block comments should both work."""
-        parser = MarkdownStructureParser(base_path=temp_doc_mixed_comments)
         index = StructureIndex()
-
-        documents = []
-        for doc_file in temp_doc_mixed_comments.glob("*.md"):
-            doc = parser.parse_file(doc_file)
-            documents.append(doc)
-
-        index.build_from_documents(documents)
+        index.build_from_documents(mixed_comment_docs)
 
         structure = index.get_structure()
-        paths = []
-
-        def collect_paths(sections):
-            for s in sections:
-                paths.append(s["path"])
-                if s.get("children"):
-                    collect_paths(s["children"])
-
-        collect_paths(structure["sections"])
+        paths = section_paths(structure["sections"])
 
         # Inline comment heading should be visible
         assert "test:visible" in paths
         assert "test:also-visible" in paths
         # Block comment heading should remain hidden
         assert "test:hidden-heading" not in paths
+
+    def test_comments_inside_title_are_stripped(self):
+        """Comments before and after title text are all removed."""
+        parser = MarkdownStructureParser()
+        doc = parser.parse_string(
+            "# Document\n\n## Release<!-- v2 --> Notes <!-- WIP --><!-- x -->\n",
+            Path("test.md"),
+        )
+
+        assert doc.sections[0].children[0].title == "Release Notes"
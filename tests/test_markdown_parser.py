@@ -6,6 +6,8 @@ Tests are organized by acceptance criteria from 04_markdown_parser.adoc.
 import tempfile
 from pathlib import Path
 
+import pytest
+
 
 class TestMarkdownStructureParserBasic:
     """Basic parser instantiation tests."""
@@ -30,6 +32,61 @@ class TestMarkdownStructureParserBasic:
 
         assert isinstance(doc, MarkdownDocument)
 
+    def test_unchanged_file_is_served_from_parse_cache(self, tmp_path: Path):
+        """Re-parsing an unchanged file returns the cached document."""
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        doc_file = tmp_path / "test.md"
+        doc_file.write_text("# Test\n\n## Section\n", encoding="utf-8")
+
+        first = MarkdownStructureParser(base_path=tmp_path).parse_file(doc_file)
+        second = MarkdownStructureParser(base_path=tmp_path).parse_file(doc_file)
+
+        assert second is first
+
+    def test_changed_file_is_parsed_again(self, tmp_path: Path):
+        """A file whose size changed after parsing is parsed again."""
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        doc_file = tmp_path / "test.md"
+        doc_file.write_text("# Test\n", encoding="utf-8")
+        parser = MarkdownStructureParser(base_path=tmp_path)
+        first = parser.parse_file(doc_file)
+        doc_file.write_text("# Renamed Test\n", encoding="utf-8")
+        second = parser.parse_file(doc_file)
+
+        assert first.title == "Test"
+        assert second.title == "Renamed Test"
+
+    def test_write_invalidates_parse_cache(self, tmp_path: Path, monkeypatch):
+        """Writing a file drops its cached document even if its stamp is unchanged."""
+        from dacli import markdown_parser
+        from dacli.file_handler import FileSystemHandler
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        doc_file = tmp_path / "test.md"
+        doc_file.write_text("# Foo\n", encoding="utf-8")
+        # Simulate a same-size edit within one timestamp tick
+        monkeypatch.setattr(markdown_parser, "file_stamp", lambda path: (1, 1, 1, 1))
+        parser = MarkdownStructureParser(base_path=tmp_path)
+        first = parser.parse_file(doc_file)
+        FileSystemHandler().write_file(doc_file, "# Bar\n")
+        second = parser.parse_file(doc_file)
+
+        assert first.title == "Foo"
+        assert second.title == "Bar"
+
+    def test_parse_string_matches_parse_file(self, tmp_path: Path):
+        """parse_string produces the same document as parsing the file."""
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        content = "---\ntitle: Guide\n---\n# Test\n\n## Section\n\n```python\nx = 1\n```\n"
+        doc_file = tmp_path / "test.md"
+        doc_file.write_text(content, encoding="utf-8")
+        parser = MarkdownStructureParser(base_path=tmp_path)
+
+        assert parser.parse_string(content, doc_file) == parser.parse_file(doc_file)
+
 
 class TestHeadingExtraction:
     """AC-MD-01: Headings are correctly extracted."""
@@ -695,6 +752,17 @@ puts "hello"
         assert len(doc.elements) == 1
         assert doc.elements[0].attributes["language"] == "ruby"
 
+    def test_repeated_language_is_shared(self):
+        """Code blocks in the same language share one language string."""
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        content = "# Code\n\n```python\na = 1\n```\n\n```python\nb = 2\n```\n"
+        doc = MarkdownStructureParser().parse_string(content, Path("code.md"))
+
+        first, second = (e.attributes["language"] for e in doc.elements)
+        assert first == "python"
+        assert first is second
+
     def test_unclosed_code_block_logs_warning(self, caplog):
         """Unclosed code block at end of file logs a warning."""
         from dacli.markdown_parser import MarkdownStructureParser
@@ -725,6 +793,113 @@ def hello():
         assert "will be ignored" in caplog.text
 
 
+class TestMatchCodeFence:
+    """Code fence lines are recognised without a regex."""
+
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ("```", ("```", "")),
+            ("~~~~", ("~~~~", "")),
+            ("```python", ("```", "python")),
+            ("```c++  ", ("```", "c++")),
+            ("~~~objective-c", ("~~~", "objective-c")),
+        ],
+    )
+    def test_fences(self, line, expected):
+        """Fences return the fence run and the language."""
+        from dacli.markdown_parser import _match_code_fence
+
+        assert _match_code_fence(line) == expected
+
+    @pytest.mark.parametrize("line", ["", "``", "`~~", " ```", "``` python", "```py thon", "```a`"])
+    def test_non_fences(self, line):
+        """Short, indented or malformed fences are not matched."""
+        from dacli.markdown_parser import _match_code_fence
+
+        assert _match_code_fence(line) is None
+
+
+class TestClassifyListItem:
+    """List items are classified with a slicing fast path for task items."""
+
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ("- [ ] Buy milk", "task"),
+            ("  - [x] Done", "task"),
+            ("- [X]  Done", "task"),
+            ("-  [ ] Extra space", "task"),
+            ("-\t[x] Tab", "task"),
+            ("- [ ] ", "unordered"),
+            ("- [y] Not a task", "unordered"),
+            ("* [ ] Star", "unordered"),
+            ("+ Item", "unordered"),
+            ("12. Item", "ordered"),
+            ("-", None),
+            ("Text", None),
+            ("", None),
+        ],
+    )
+    def test_list_types(self, line, expected):
+        """The fast path agrees with LIST_ITEM_PATTERN."""
+        from dacli.markdown_parser import LIST_ITEM_PATTERN, _classify_list_item
+
+        match = LIST_ITEM_PATTERN.match(line)
+        assert _classify_list_item(line) == expected
+        assert (match.lastgroup if match else None) == expected
+
+
+class TestScanCodeFences:
+    """Code blocks are located once per document and shared by both passes."""
+
+    def test_lines_are_classified(self):
+        """Fences, code lines and text lines are told apart."""
+        from dacli.markdown_parser import (
+            _CODE_LINE,
+            _FENCE_CLOSE,
+            _FENCE_OPEN,
+            _TEXT_LINE,
+            _scan_code_fences,
+        )
+
+        lines = ["text", "```python", "code", "```", "text"]
+
+        assert list(_scan_code_fences(lines)) == [
+            _TEXT_LINE,
+            _FENCE_OPEN,
+            _CODE_LINE,
+            _FENCE_CLOSE,
+            _TEXT_LINE,
+        ]
+
+    def test_other_fences_inside_block_are_content(self):
+        """Only a matching fence closes a block; headings inside stay hidden."""
+        from dacli.markdown_parser import MarkdownStructureParser
+
+        parser = MarkdownStructureParser()
+        content = """# Doc
+
+````markdown
+```
+## Not A Heading
+~~~
+````
+
+## Real Section
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write(content)
+            f.flush()
+            doc = parser.parse_file(Path(f.name))
+
+        assert [s.title for s in doc.sections[0].children] == ["Real Section"]
+        code_blocks = [e for e in doc.elements if e.type == "code"]
+        assert len(code_blocks) == 1
+        assert code_blocks[0].attributes["content"] == "```\n## Not A Heading\n~~~"
+
+
 class TestCodeBlockContent:
     """Code block content extraction per spec line 236."""
 
@@ -1360,17 +1535,14 @@ Content.
                 doc = parser.parse_file(Path(f.name))
 
         # Should only have 2 sections: Main Title and ATX Section
-        all_sections = []
+        from dacli.parser_utils import collect_all_sections
 
-        def collect(sections):
-            for s in sections:
-                all_sections.append(s.title)
-                collect(s.children)
-
-        collect(doc.sections)
-        assert "Main Title" in all_sections
-        assert "ATX Section" in all_sections
-        assert "Setext Title" not in all_sections
+        all_sections = []
+        collect_all_sections(doc.sections, all_sections)
+        titles = [s.title for s in all_sections]
+        assert "Main Title" in titles
+        assert "ATX Section" in titles
+        assert "Setext Title" not in titles
 
     def test_horizontal_rule_does_not_trigger_warning(self, caplog):
         """Horizontal rule (--- with blank before) should NOT warn."""
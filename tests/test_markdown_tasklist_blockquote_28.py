@@ -5,7 +5,6 @@ Task lists (- [ ], - [x]) and blockquotes (> text) should be recognized
 as element types.
 """
 
-import tempfile
 from pathlib import Path
 
 
@@ -23,10 +22,7 @@ class TestTaskListRecognition:
 - [ ] Write tests
 - [ ] Deploy app
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         task_lists = [e for e in list_elements if e.attributes.get("list_type") == "task"]
@@ -43,10 +39,7 @@ class TestTaskListRecognition:
 - [x] Write tests
 - [ ] Deploy app
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         task_lists = [e for e in list_elements if e.attributes.get("list_type") == "task"]
@@ -63,10 +56,7 @@ class TestTaskListRecognition:
 - [x] Second task
 - [ ] Third task
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         task_lists = [e for e in list_elements if e.attributes.get("list_type") == "task"]
@@ -86,10 +76,7 @@ class TestTaskListRecognition:
 - [ ] Item A
 - [x] Item B
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         task_lists = [e for e in list_elements if e.attributes.get("list_type") == "task"]
@@ -106,10 +93,7 @@ class TestTaskListRecognition:
 - [ ] Buy milk
 - [x] Write tests
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         task_lists = [e for e in list_elements if e.attributes.get("list_type") == "task"]
@@ -130,10 +114,7 @@ class TestTaskListRecognition:
 - [ ] Task item 1
 - [x] Task item 2
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         list_elements = [e for e in doc.elements if e.type == "list"]
         unordered = [e for e in list_elements if e.attributes.get("list_type") == "unordered"]
@@ -155,10 +136,7 @@ class TestBlockquoteRecognition:
 > This is a blockquote.
 > It has multiple lines.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) >= 1
@@ -174,10 +152,7 @@ class TestBlockquoteRecognition:
 > Second line of quote.
 > Third line of quote.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) == 1
@@ -195,10 +170,7 @@ class TestBlockquoteRecognition:
 
 > A famous quote.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) >= 1
@@ -214,10 +186,7 @@ class TestBlockquoteRecognition:
 > First line.
 > Second line.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) >= 1
@@ -237,10 +206,7 @@ Some text.
 
 > Second quote.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) == 2
@@ -257,10 +223,7 @@ Some text.
 > It's inside a code block
 ```
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) == 0
@@ -276,10 +239,7 @@ Some text.
 >
 > Second paragraph.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            doc = parser.parse_file(Path(f.name))
+        doc = parser.parse_string(content, Path("test.md"))
 
         blockquotes = [e for e in doc.elements if e.type == "blockquote"]
         assert len(blockquotes) == 1
@@ -5,19 +5,16 @@ The MCP insert_content tool should handle blank lines like the CLI does:
 - Add blank line after content when next line is a heading
 """
 
-from pathlib import Path
+from weakref import WeakKeyDictionary
 
 import pytest
+from fastmcp import FastMCP
 
 from dacli.mcp_app import create_mcp_server
 
+pytestmark = pytest.mark.mcp
 
-@pytest.fixture
-def temp_doc_for_blank_lines(tmp_path: Path) -> Path:
-    """Create a Markdown file for testing blank line handling."""
-    doc_file = tmp_path / "test.md"
-    doc_file.write_text(
-        """# Document
+_DOC_CONTENT = b"""# Document
 
 ## Section 1
 
@@ -26,74 +23,74 @@ Content 1.
 ## Section 2
 
 Content 2.
-""",
-        encoding="utf-8",
-    )
-    return tmp_path
+"""
+
+# One copy of the document per test, so edits made through the shared
+# server never leak into another test. All copies must exist before the
+# server builds its index.
+_DOC_STEMS = ("insert_before", "insert_after")
+
+
+# Tool name -> tool, built once per server
+_TOOLS_BY_SERVER: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _tool(mcp: FastMCP, name: str):
+    """Return the registered tool called name, indexing the server's tools once."""
+    tools = _TOOLS_BY_SERVER.get(mcp)
+    if tools is None:
+        tools = {tool.name: tool for tool in mcp._tool_manager._tools.values()}
+        _TOOLS_BY_SERVER[mcp] = tools
+    return tools[name]
+
+
+@pytest.fixture(scope="class")
+def shared_server(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Create the Markdown documents and one MCP server for the whole class."""
+    root = tmp_path_factory.mktemp("blank_lines_232")
+    for stem in _DOC_STEMS:
+        (root / f"{stem}.md").write_bytes(_DOC_CONTENT)
+    mcp = create_mcp_server(root)
+    return {"root": root, "mcp": mcp, "insert_tool": _tool(mcp, "insert_content")}
 
 
 class TestMcpInsertBlankLines:
     """Test that MCP insert_content handles blank lines correctly."""
 
-    def test_insert_before_adds_blank_line_after_content(self, temp_doc_for_blank_lines: Path):
+    def test_insert_before_adds_blank_line_after_content(self, shared_server: dict):
         """Issue #232: Insert before should add blank line when next is heading."""
-        mcp = create_mcp_server(temp_doc_for_blank_lines)
-
-        insert_tool = None
-        for tool in mcp._tool_manager._tools.values():
-            if tool.name == "insert_content":
-                insert_tool = tool
-                break
-
         # Insert content before Section 2
-        result = insert_tool.fn(
-            path="test:section-2", position="before", content="Some new paragraph.\n"
+        result = shared_server["insert_tool"].fn(
+            path="insert_before:section-2", position="before", content="Some new paragraph.\n"
         )
 
         assert result.get("success") is True
 
         # Read and check - should have blank line before Section 2
-        doc_file = temp_doc_for_blank_lines / "test.md"
+        doc_file = shared_server["root"] / "insert_before.md"
         content = doc_file.read_text()
 
-        # The content should have proper separation
-        assert "Some new paragraph." in content
         # There should be a blank line between our content and Section 2
-        lines = content.split("\n")
-        para_idx = next(i for i, line in enumerate(lines) if "Some new paragraph" in line)
-        sec2_idx = next(i for i, line in enumerate(lines) if "## Section 2" in line)
-
-        # Should have blank line between them
-        assert sec2_idx > para_idx + 1, (
-            f"Should have blank line between content and Section 2.\n" f"Content:\n{content}"
+        assert "Some new paragraph.\n\n## Section 2" in content, (
+            f"Should have blank line between content and Section 2.\nContent:\n{content}"
         )
 
-    def test_insert_after_adds_blank_line_before_next_heading(self, temp_doc_for_blank_lines: Path):
+    def test_insert_after_adds_blank_line_before_next_heading(self, shared_server: dict):
         """Issue #232: Insert after should add blank line before next heading."""
-        mcp = create_mcp_server(temp_doc_for_blank_lines)
-
-        insert_tool = None
-        for tool in mcp._tool_manager._tools.values():
-            if tool.name == "insert_content":
-                insert_tool = tool
-                break
-
         # Insert content after Section 1
-        result = insert_tool.fn(
-            path="test:section-1", position="after", content="## New Section\n\nNew content.\n"
+        result = shared_server["insert_tool"].fn(
+            path="insert_after:section-1",
+            position="after",
+            content="## New Section\n\nNew content.\n",
         )
 
         assert result.get("success") is True
 
         # Read and check
-        doc_file = temp_doc_for_blank_lines / "test.md"
+        doc_file = shared_server["root"] / "insert_after.md"
         content = doc_file.read_text()
 
-        # The new section should be properly separated from Section 2
+        # The new section should appear before Section 2, separated by a blank line
         assert "## New Section" in content
-        lines = content.split("\n")
-        new_idx = next(i for i, line in enumerate(lines) if "## New Section" in line)
-        sec2_idx = next(i for i, line in enumerate(lines) if "## Section 2" in line)
-
-        # New section should appear before Section 2
-        assert new_idx < sec2_idx
+        assert content.index("## New Section") < content.index("## Section 2")
+        assert "New content.\n\n## Section 2" in content
@@ -92,6 +92,8 @@ class TestSection:
 
         assert len(parent.children) == 1
         assert parent.children[0].title == "Goals"
+        assert parent.has_children
+        assert not child.has_children
 
     def test_create_section_with_anchor(self):
         """Test section with explicit anchor."""
@@ -108,6 +110,23 @@ class TestSection:
 
         assert section.anchor == "intro-anchor"
 
+    def test_section_uses_slots(self):
+        """Test that sections carry no per-instance __dict__."""
+        import pytest
+
+        from dacli.models import Section, SourceLocation
+
+        section = Section(
+            title="Introduction",
+            level=1,
+            path="introduction",
+            source_location=SourceLocation(file=Path("doc.adoc"), line=5),
+        )
+
+        assert not hasattr(section, "__dict__")
+        with pytest.raises(AttributeError):
+            section.unknown_field = "value"
+
 
 class TestElement:
     """Tests for Element dataclass."""
@@ -418,6 +437,26 @@ class TestJSONSerialization:
         assert data["sections"] == []
         assert data["elements"] == []
 
+    def test_nested_document_to_dict_is_independent_copy(self):
+        """Nested models are converted and the result shares no containers."""
+        import json
+
+        from dacli.models import Document, Element, SourceLocation, model_to_dict
+
+        element = Element(
+            type="list",
+            source_location=SourceLocation(file=Path("doc.md"), line=3),
+            attributes={"list_type": "task", "items": ["a", "b"]},
+            parent_section="doc",
+        )
+        doc = Document(file_path=Path("doc.md"), title="Doc", elements=[element])
+        data = model_to_dict(doc)
+
+        assert json.loads(json.dumps(data)) == data
+        assert data["elements"][0]["source_location"]["file"] == "doc.md"
+        data["elements"][0]["attributes"]["items"].append("c")
+        assert element.attributes["items"] == ["a", "b"]
+
     def test_cross_reference_to_dict(self):
         """Test CrossReference converts to dict for JSON."""
         from dacli.models import CrossReference, SourceLocation, model_to_dict
@@ -269,3 +269,31 @@ class TestEmptyIndex:
 
         assert data["sections"] == []
         assert data["count"] == 0
+
+
+# =============================================================================
+# Index Injection Tests
+# =============================================================================
+
+
+class TestIndexInjection:
+    """Tests for the per-app index provided via app.state."""
+
+    def test_missing_index_returns_503(self):
+        """App created without an index returns INDEX_NOT_READY."""
+        client = TestClient(create_app())
+
+        response = client.get("/api/v1/structure")
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["error"]["code"] == "INDEX_NOT_READY"
+
+    def test_apps_keep_separate_indexes(self, sample_index: StructureIndex):
+        """Creating a second app does not replace the first app's index."""
+        first = TestClient(create_app(sample_index))
+        empty_index = StructureIndex()
+        empty_index.build_from_documents([])
+        second = TestClient(create_app(empty_index))
+
+        assert first.get("/api/v1/structure").json()["total_sections"] > 0
+        assert second.get("/api/v1/structure").json()["total_sections"] == 0
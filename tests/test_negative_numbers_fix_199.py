@@ -6,20 +6,24 @@ These tests verify that:
 3. Zero and positive numbers continue to work correctly
 """
 
+import json
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from dacli.cli import cli
+from dacli.asciidoc_parser import AsciidocStructureParser
+from dacli.cli import CliContext, _validate_non_negative, cli
+from dacli.structure_index import StructureIndex
 
+pytestmark = pytest.mark.cli
 
-@pytest.fixture
-def temp_doc_dir(tmp_path: Path) -> Path:
-    """Create a temporary directory with test documents."""
-    doc_file = tmp_path / "test.adoc"
-    doc_file.write_text(
-        """= Test Document
+_RUNNER = CliRunner()
+
+_LEVEL_ADVICE = "Document hierarchies start at level 0 (document root)."
+
+_TEST_DOC = b"""= Test Document
 
 == Level 1 Section A
 
@@ -40,201 +44,167 @@ More nested content.
 === Level 2 Section B.2
 
 Even more nested.
-""",
-        encoding="utf-8",
-    )
+"""
+
+
+@pytest.fixture(scope="module")
+def temp_doc_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory with test documents.
+
+    The commands under test only read the document, so it is written once
+    for the whole module.
+    """
+    tmp_path = tmp_path_factory.mktemp("negative_levels_199")
+    (tmp_path / "test.adoc").write_bytes(_TEST_DOC)
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def doc_index(temp_doc_dir: Path) -> StructureIndex:
+    """Index of the test document, built once for the service-level tests."""
+    parser = AsciidocStructureParser(base_path=temp_doc_dir)
+    index = StructureIndex()
+    index.build_from_documents([parser.parse_file(temp_doc_dir / "test.adoc")])
+    return index
+
+
+@pytest.fixture(scope="module")
+def json_cli_context(temp_doc_dir: Path) -> CliContext:
+    """CLI context with JSON output; its index is built once and reused."""
+    return CliContext(docs_root=temp_doc_dir, output_format="json", pretty=False)
+
+
+def _invoke_command(obj: CliContext, name: str, **params) -> None:
+    """Run a CLI subcommand under obj directly, skipping command-line parsing."""
+    command = cli.get_command(None, name)
+    with click.Context(command, obj=obj) as ctx:
+        ctx.invoke(command, **params)
+
+
+def _invoke_level(docs_root: Path, level: str, *, command: str = "sections-at-level"):
+    """Run a sections-at-level command against docs_root and return the result."""
+    return _RUNNER.invoke(cli, ["--docs-root", str(docs_root), command, level])
+
+
 class TestNegativeNumberParsing:
     """Test that negative numbers are parsed correctly."""
 
-    def test_negative_one_is_parsed_not_treated_as_option(self, temp_doc_dir: Path):
-        """Negative number -1 should be parsed as argument, not option (Issue #199)."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "-1",
-            ],
-        )
-
-        # Should NOT fail with "No such option: -1"
-        assert "No such option: -1" not in result.output
+    @pytest.mark.parametrize("level", ["-1", "-10"])
+    def test_negative_number_is_parsed_not_treated_as_option(self, temp_doc_dir: Path, level: str):
+        """Negative numbers should be parsed as argument, not option (Issue #199)."""
+        result = _invoke_level(temp_doc_dir, level)
 
-        # Should fail with validation error instead
-        assert result.exit_code != 0
-        assert "Level must be non-negative" in result.output
+        # Should NOT fail with "No such option"
+        assert f"No such option: {level}" not in result.output
 
-    def test_negative_ten_is_parsed(self, temp_doc_dir: Path):
-        """Larger negative number -10 should be parsed as argument."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "-10",
-            ],
-        )
-
-        # Should NOT fail with "No such option: -10"
-        assert "No such option: -10" not in result.output
-
-        # Should fail with validation error
+        # Should fail with validation error instead
         assert result.exit_code != 0
         assert "Level must be non-negative" in result.output
+        assert "Document hierarchies start at level 0" in result.output
 
 
 class TestNegativeNumberValidation:
     """Test validation of negative levels."""
 
-    def test_negative_level_rejected_with_clear_message(self, temp_doc_dir: Path):
+    @pytest.mark.parametrize(
+        ("level", "expected_messages"),
+        [
+            (
+                -1,
+                (
+                    "Level must be non-negative",
+                    "got -1",
+                    "Document hierarchies start at level 0",
+                ),
+            ),
+            # The error message includes the actual negative value provided
+            (-5, ("got -5",)),
+        ],
+    )
+    def test_negative_level_rejected_with_clear_message(
+        self, level: int, expected_messages: tuple[str, ...]
+    ):
         """Negative level should be rejected with helpful error message."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "-1",
-            ],
-        )
+        with pytest.raises(click.BadParameter) as exc_info:
+            _validate_non_negative(level, "Level", _LEVEL_ADVICE, "level")
 
-        assert result.exit_code != 0
-        assert "Level must be non-negative" in result.output
-        assert "got -1" in result.output
-        assert "Document hierarchies start at level 0" in result.output
+        for message in expected_messages:
+            assert message in str(exc_info.value)
 
-    def test_negative_level_error_includes_level_value(self, temp_doc_dir: Path):
-        """Error message should include the actual negative value provided."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "-5",
-            ],
-        )
+    @pytest.mark.parametrize("level", ["-1", "-5"])
+    def test_command_reports_negative_level(self, temp_doc_dir: Path, level: str):
+        """The sections-at-level command shows the rejected value to the user."""
+        result = _invoke_level(temp_doc_dir, level)
 
         assert result.exit_code != 0
-        assert "got -5" in result.output
+        assert f"Level must be non-negative, got {level}." in result.output
 
 
 class TestPositiveNumbersStillWork:
     """Test that zero and positive numbers continue to work correctly."""
 
-    def test_level_zero_works(self, temp_doc_dir: Path):
-        """Level 0 (document root) should work."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "0",
-            ],
-        )
+    @pytest.mark.parametrize(
+        ("level", "expected_titles"),
+        [
+            # Level 0 returns the document root
+            (0, ["Test Document"]),
+            # Level 1 returns both top-level sections
+            (1, ["Level 1 Section A", "Level 1 Section B"]),
+            # Level 2 returns the nested sections
+            (2, ["Level 2 Section A.1", "Level 2 Section B.1", "Level 2 Section B.2"]),
+        ],
+    )
+    def test_level_works(self, doc_index: StructureIndex, level: int, expected_titles: list[str]):
+        """Non-negative levels pass validation and list the sections at that level."""
+        _validate_non_negative(level, "Level", _LEVEL_ADVICE, "level")
 
-        assert result.exit_code == 0
-        # Should return the document root
-        assert "test" in result.output or "count" in result.output
-
-    def test_level_one_works(self, temp_doc_dir: Path):
-        """Level 1 (top-level sections) should work."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "1",
-            ],
-        )
+        sections = doc_index.get_sections_at_level(level)
 
-        assert result.exit_code == 0
-        # Should return both Level 1 sections
-        assert "Level 1 Section A" in result.output or "level-1-section-a" in result.output
-        assert "Level 1 Section B" in result.output or "level-1-section-b" in result.output
-
-    def test_level_two_works(self, temp_doc_dir: Path):
-        """Level 2 (nested sections) should work."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "sections-at-level",
-                "2",
-            ],
-        )
+        assert [s.title for s in sections] == expected_titles
 
-        assert result.exit_code == 0
-        # Should return level 2 sections
-        assert "Level 2 Section A.1" in result.output or "level-2-section-a-1" in result.output
+    @pytest.mark.parametrize(
+        ("level", "expected_titles"),
+        [
+            ("0", ["Test Document"]),
+            ("2", ["Level 2 Section A.1", "Level 2 Section B.1", "Level 2 Section B.2"]),
+        ],
+    )
+    def test_command_text_output(self, temp_doc_dir: Path, level: str, expected_titles: list[str]):
+        """The sections-at-level command succeeds and prints the sections as text."""
+        result = _invoke_level(temp_doc_dir, level)
 
-    def test_level_one_json_format(self, temp_doc_dir: Path):
+        assert result.exit_code == 0
+        assert f"level: {level}\n" in result.output
+        for title in expected_titles:
+            assert f"title: {title}\n" in result.output
+        assert f"count: {len(expected_titles)}\n" in result.output
+
+    def test_level_one_json_format(
+        self, json_cli_context: CliContext, capsys: pytest.CaptureFixture[str]
+    ):
         """Level 1 with JSON format should work."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "--format",
-                "json",
-                "sections-at-level",
-                "1",
-            ],
-        )
+        _invoke_command(json_cli_context, "sections-at-level", level=1)
 
-        assert result.exit_code == 0
-        assert '"level": 1' in result.output
-        assert '"count":' in result.output
-        assert '"sections":' in result.output
+        data = json.loads(capsys.readouterr().out)
+        assert data["level"] == 1
+        assert data["count"] == len(data["sections"]) == 2
 
 
 class TestAliasStillWorks:
     """Test that the 'lv' alias still works correctly."""
 
-    def test_lv_alias_with_positive_number(self, temp_doc_dir: Path):
-        """The 'lv' alias should work with positive numbers."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "lv",  # Using alias
-                "1",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "Level 1 Section" in result.output or "level-1-section" in result.output
-
-    def test_lv_alias_rejects_negative(self, temp_doc_dir: Path):
-        """The 'lv' alias should also reject negative numbers."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "--docs-root",
-                str(temp_doc_dir),
-                "lv",  # Using alias
-                "-1",
-            ],
-        )
-
-        assert result.exit_code != 0
-        assert "Level must be non-negative" in result.output
+    @pytest.mark.parametrize(
+        ("level", "succeeds", "expected"),
+        [
+            ("1", True, ("Level 1 Section", "level-1-section")),
+            ("-1", False, ("Level must be non-negative",)),
+        ],
+    )
+    def test_lv_alias(
+        self, temp_doc_dir: Path, level: str, succeeds: bool, expected: tuple[str, ...]
+    ):
+        """The 'lv' alias should accept positive and reject negative numbers."""
+        result = _invoke_level(temp_doc_dir, level, command="lv")
+
+        assert (result.exit_code == 0) is succeeds
+        assert any(text in result.output for text in expected)
@@ -1,7 +1,12 @@
 """Tests for parser utility functions."""
 
 from dacli.models import Section, SourceLocation
-from dacli.parser_utils import collect_all_sections, find_section_by_path, slugify
+from dacli.parser_utils import (
+    build_title_path_map,
+    collect_all_sections,
+    find_section_by_path,
+    slugify,
+)
 
 
 class TestSlugify:
@@ -47,6 +52,19 @@ class TestSlugify:
         """Test string with only special characters."""
         assert slugify("!@#$%") == ""
 
+    def test_dropped_characters_between_separators(self):
+        """Test that separators around dropped characters collapse into one dash."""
+        assert slugify("A - ! - B") == "a-b"
+        assert slugify("Tab\tand_under__score") == "tab-and-under-score"
+
+    def test_repeated_titles_are_memoized(self):
+        """Test that slugifying a recurring title is served from the memo cache."""
+        slugify("Recurring Title")
+        hits = slugify.cache_info().hits
+
+        assert slugify("Recurring Title") == "recurring-title"
+        assert slugify.cache_info().hits == hits + 1
+
 
 class TestCollectAllSections:
     """Tests for the collect_all_sections function."""
@@ -103,6 +121,24 @@ class TestCollectAllSections:
         assert len(result) == 3
         assert [s.path for s in result] == ["a", "a.b", "a.b.c"]
 
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test that very deep trees do not hit the recursion limit."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        root = self._make_section("s0")
+        node = root
+        for i in range(1, depth):
+            child = self._make_section(f"s{i}")
+            node.children.append(child)
+            node = child
+
+        result: list[Section] = []
+        collect_all_sections([root], result)
+
+        assert len(result) == depth
+        assert result[-1].path == f"s{depth - 1}"
+
 
 class TestFindSectionByPath:
     """Tests for the find_section_by_path function."""
@@ -163,3 +199,36 @@ class TestFindSectionByPath:
 
         # "parent.chi" should not match "parent.child"
         assert find_section_by_path([parent], "parent.chi") is None
+
+
+class TestBuildTitlePathMap:
+    """Tests for the build_title_path_map function."""
+
+    def _make_section(self, title: str, path: str, children: list[Section] = None) -> Section:
+        """Helper to create a section."""
+        return Section(
+            title=title,
+            path=path,
+            level=path.count(".") + 1,
+            source_location=SourceLocation(file="test.adoc", line=1),
+            children=children or [],
+        )
+
+    def test_empty_list(self):
+        """Test with empty section list."""
+        assert build_title_path_map([]) == {}
+
+    def test_nested_titles(self):
+        """Test that nested section titles are mapped to their paths."""
+        child = self._make_section("Child", "parent.child")
+        parent = self._make_section("Parent", "parent", [child])
+
+        assert build_title_path_map([parent]) == {"Parent": "parent", "Child": "parent.child"}
+
+    def test_first_duplicate_title_wins(self):
+        """Test that a repeated title maps to the first section in document order."""
+        nested = self._make_section("Notes", "a.notes")
+        first = self._make_section("A", "a", [nested])
+        second = self._make_section("Notes", "notes")
+
+        assert build_title_path_map([first, second])["Notes"] == "a.notes"
@@ -231,3 +231,18 @@ include::chapter.adoc[]
         # Now we should have both
         assert chapter.resolve() in all_included
         assert section.resolve() in all_included
+
+    def test_scan_includes_rescans_only_changed_files(self, tmp_path):
+        """Test that an unchanged file is not read again and a changed one is."""
+        from dacli.asciidoc_parser import _scan_include_targets
+
+        main = tmp_path / "main.adoc"
+        main.write_text("include::a.adoc[]\n")
+        first = AsciidocStructureParser.scan_includes(main)
+
+        misses = _scan_include_targets.cache_info().misses
+        assert AsciidocStructureParser.scan_includes(main) == first
+        assert _scan_include_targets.cache_info().misses == misses
+
+        main.write_text("include::a.adoc[]\ninclude::b.adoc[]\n")
+        assert (tmp_path / "b.adoc").resolve() in AsciidocStructureParser.scan_includes(main)
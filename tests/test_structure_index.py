@@ -112,6 +112,49 @@ class TestIndexBuilding:
         assert index.get_section("chapter-1") is not None
         assert index.get_section("chapter-1.section-1-1") is not None
 
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Very deep section trees are indexed without hitting the recursion limit."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        location = SourceLocation(file=Path("test.adoc"), line=1)
+        root = Section(title="s0", level=1, path="s0", source_location=location)
+        node = root
+        for i in range(1, depth):
+            child = Section(title=f"s{i}", level=i + 1, path=f"s{i}", source_location=location)
+            node.children.append(child)
+            node = child
+
+        index = StructureIndex()
+        doc = Document(file_path=Path("test.adoc"), title="", sections=[root])
+        index.build_from_documents([doc])
+
+        assert index.stats()["total_sections"] == depth
+        assert index.get_section(f"s{depth - 1}") is node
+
+    def test_file_content_is_shared_by_its_sections(self, tmp_path: Path):
+        """Each section gets its own slice of the file for full-text search."""
+        doc_file = tmp_path / "test.adoc"
+        doc_file.write_text("= Doc\n\n== One\nalpha\n\n== Two\nbeta\n", encoding="utf-8")
+        one = Section(
+            title="One",
+            level=1,
+            path="one",
+            source_location=SourceLocation(file=doc_file, line=3, end_line=5),
+        )
+        two = Section(
+            title="Two",
+            level=1,
+            path="two",
+            source_location=SourceLocation(file=doc_file, line=6, end_line=7),
+        )
+
+        index = StructureIndex()
+        index.build_from_documents([Document(file_path=doc_file, title="Doc", sections=[one, two])])
+
+        assert index._section_content["one"] == "== One\nalpha\n"
+        assert index._section_content["two"] == "== Two\nbeta"
+
     def test_elements_are_indexed(self):
         """Elements from documents are indexed."""
         index = StructureIndex()
@@ -229,6 +272,32 @@ class TestGetStructure:
         assert len(structure["sections"][0]["children"]) == 1
         assert len(structure["sections"][0]["children"][0]["children"]) == 1
 
+    def test_get_structure_is_cached_until_rebuild(self):
+        """get_structure() is computed once per max_depth until the index is rebuilt."""
+        index = StructureIndex()
+
+        def make_doc(title: str) -> Document:
+            return Document(
+                file_path=Path("test.adoc"),
+                title="Test",
+                sections=[
+                    Section(
+                        title=title,
+                        level=1,
+                        path=title.lower(),
+                        source_location=SourceLocation(file=Path("test.adoc"), line=1),
+                    )
+                ],
+            )
+
+        index.build_from_documents([make_doc("Before")])
+        structure = index.get_structure()
+        assert index.get_structure() is structure
+        assert index.get_structure(max_depth=0) is not structure
+
+        index.build_from_documents([make_doc("After")])
+        assert index.get_structure()["sections"][0]["title"] == "After"
+
 
 class TestGetSection:
     """Tests for get_section() method."""
@@ -815,6 +884,45 @@ class TestGetSectionsByFile:
         index.clear()
         assert index.get_sections_by_file(file_path) == []
 
+    def test_get_resolved_files_is_cached_until_rebuild(self, tmp_path: Path):
+        """get_resolved_files() caches resolved paths and resets on rebuild."""
+        index = StructureIndex()
+        file1 = tmp_path / "doc1.adoc"
+        file2 = tmp_path / "doc2.adoc"
+
+        def make_doc(file_path: Path) -> Document:
+            return Document(
+                file_path=file_path,
+                title="Doc",
+                sections=[
+                    Section(
+                        title="Chapter",
+                        level=1,
+                        path=f"{file_path.stem}:chapter",
+                        source_location=SourceLocation(file=file_path, line=1),
+                    )
+                ],
+            )
+
+        index.build_from_documents([make_doc(file1)])
+        resolved = index.get_resolved_files()
+        assert resolved == {str(file1.resolve())}
+        assert index.get_resolved_files() is resolved
+
+        index.build_from_documents([make_doc(file2)])
+        assert index.get_resolved_files() == {str(file2.resolve())}
+
+    def test_revision_changes_on_rebuild_and_clear(self):
+        """get_revision() changes whenever the index is rebuilt or cleared."""
+        index = StructureIndex()
+        initial = index.get_revision()
+
+        index.build_from_documents([])
+        rebuilt = index.get_revision()
+        index.clear()
+
+        assert initial != rebuilt != index.get_revision()
+
 
 class TestElementIndex:
     """Tests for element index tracking within sections."""
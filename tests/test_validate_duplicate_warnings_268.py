@@ -109,3 +109,34 @@ class TestDuplicatePathWarningsInValidation:
         result = validate_structure(index, tmp_path)
         dup_warnings = [w for w in result["warnings"] if w["type"] == "duplicate_path"]
         assert len(dup_warnings) == 0
+
+    def test_orphaned_files_are_listed_first_in_sorted_order(self, tmp_path):
+        """Orphaned-file warnings come before duplicate warnings, sorted by path."""
+        (tmp_path / "z.md").write_text("# Z\n", encoding="utf-8")
+        (tmp_path / "m.md").write_text("# M\n", encoding="utf-8")
+        docs = [
+            Document(
+                file_path=tmp_path / name,
+                title="Doc",
+                sections=[
+                    Section(
+                        title="Intro",
+                        level=1,
+                        path="intro",
+                        source_location=SourceLocation(file=tmp_path / name, line=1),
+                    )
+                ],
+                elements=[],
+            )
+            for name in ("a.md", "b.md")
+        ]
+
+        index = StructureIndex()
+        index.build_from_documents(docs)
+
+        result = validate_structure(index, tmp_path)
+        assert [(w["type"], w["path"]) for w in result["warnings"]] == [
+            ("orphaned_file", "m.md"),
+            ("orphaned_file", "z.md"),
+            ("duplicate_path", "intro"),
+        ]
@@ -7,6 +7,7 @@ The implementation was done in Issue #219. This test file adds MCP-level
 coverage and closes Issue #160 which originally requested this feature.
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -20,70 +21,116 @@ from dacli.mcp_app import create_mcp_server
 from dacli.services.validation_service import validate_structure
 from dacli.structure_index import StructureIndex
 
+pytestmark = pytest.mark.mcp
+
+_RUNNER = CliRunner()
+
 # ── Fixtures ──────────────────────────────────────────────────────────────
 
+_CHAPTER_BROKEN = b"= Chapter\n\n== Section\n\nSome text.\n\ninclude::missing.adoc[]\n"
+_CHAPTER_VALID = b"= Chapter\n\n== Section\n\nSome text.\n\ninclude::included.adoc[]\n"
+_INCLUDED = b"Included content.\n"
+_CHAPTER_MULTIPLE_BROKEN = (
+    b"= Chapter\n\ninclude::missing_a.adoc[]\n\n== Section\n\ninclude::missing_b.adoc[]\n"
+)
+
+# Files written by _write_broken_include() and _write_valid_include()
+_BROKEN_DOC_FILES = ("chapter.adoc",)
+_VALID_DOC_FILES = ("chapter.adoc", "included.adoc")
+
+
+def _write_broken_include(root: Path) -> Path:
+    """Write a document that has a broken include into root."""
+    (root / "chapter.adoc").write_bytes(_CHAPTER_BROKEN)
+    return root
+
+
+def _write_valid_include(root: Path) -> Path:
+    """Write a document that has a valid include into root."""
+    (root / "included.adoc").write_bytes(_INCLUDED)
+    (root / "chapter.adoc").write_bytes(_CHAPTER_VALID)
+    return root
+
+
+def _index_docs(docs_root: Path, doc_files: tuple[str, ...]) -> StructureIndex:
+    """Parse the given AsciiDoc files in docs_root and build an index from them."""
+    parser = AsciidocStructureParser(base_path=docs_root)
+    index = StructureIndex()
+    docs = [parser.parse_file(docs_root / name) for name in doc_files]
+    index.build_from_documents(docs)
+    return index
+
 
 @pytest.fixture
 def docs_with_broken_include(tmp_path: Path) -> Path:
     """Create docs directory with a document that has a broken include."""
-    doc = tmp_path / "chapter.adoc"
-    doc.write_text(
-        "= Chapter\n\n== Section\n\nSome text.\n\ninclude::missing.adoc[]\n",
-        encoding="utf-8",
-    )
-    return tmp_path
+    return _write_broken_include(tmp_path)
 
 
 @pytest.fixture
 def docs_with_valid_include(tmp_path: Path) -> Path:
     """Create docs directory with a document that has a valid include."""
-    included = tmp_path / "included.adoc"
-    included.write_text("Included content.\n", encoding="utf-8")
-
-    doc = tmp_path / "chapter.adoc"
-    doc.write_text(
-        "= Chapter\n\n== Section\n\nSome text.\n\ninclude::included.adoc[]\n",
-        encoding="utf-8",
-    )
-    return tmp_path
+    return _write_valid_include(tmp_path)
 
 
-@pytest.fixture
-def docs_with_multiple_broken_includes(tmp_path: Path) -> Path:
-    """Create docs directory with multiple broken includes."""
-    doc = tmp_path / "chapter.adoc"
-    doc.write_text(
-        "= Chapter\n\n"
-        "include::missing_a.adoc[]\n\n"
-        "== Section\n\n"
-        "include::missing_b.adoc[]\n",
-        encoding="utf-8",
-    )
-    return tmp_path
+@pytest.fixture(scope="module")
+def shared_broken_docs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Broken-include docs shared by the module's read-only tests.
 
+    validate_structure() only reads the docs and the index, so tests that do
+    not modify them can share one copy.
+    """
+    return _write_broken_include(tmp_path_factory.mktemp("broken_include"))
 
-@pytest_asyncio.fixture
-async def mcp_broken(docs_with_broken_include: Path):
-    """MCP client wired to docs with a broken include."""
-    mcp = create_mcp_server(docs_root=docs_with_broken_include)
-    async with Client(transport=mcp) as client:
-        yield client
 
+@pytest.fixture(scope="module")
+def shared_valid_docs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Valid-include docs shared by the module's read-only tests."""
+    return _write_valid_include(tmp_path_factory.mktemp("valid_include"))
 
-@pytest_asyncio.fixture
-async def mcp_valid(docs_with_valid_include: Path):
-    """MCP client wired to docs with a valid include."""
-    mcp = create_mcp_server(docs_root=docs_with_valid_include)
-    async with Client(transport=mcp) as client:
-        yield client
 
+@pytest.fixture(scope="module")
+def broken_index(shared_broken_docs: Path) -> tuple[StructureIndex, Path]:
+    """Index and docs root for the broken-include layout, built once per module."""
+    return _index_docs(shared_broken_docs, _BROKEN_DOC_FILES), shared_broken_docs
 
-@pytest_asyncio.fixture
-async def mcp_multiple_broken(docs_with_multiple_broken_includes: Path):
-    """MCP client wired to docs with multiple broken includes."""
-    mcp = create_mcp_server(docs_root=docs_with_multiple_broken_includes)
+
+@pytest.fixture(scope="module")
+def valid_index(shared_valid_docs: Path) -> tuple[StructureIndex, Path]:
+    """Index and docs root for the valid-include layout, built once per module."""
+    return _index_docs(shared_valid_docs, _VALID_DOC_FILES), shared_valid_docs
+
+
+@pytest.fixture(scope="module")
+def shared_multiple_broken_docs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Docs directory with multiple broken includes, shared by the module."""
+    tmp_path = tmp_path_factory.mktemp("multiple_broken_includes")
+    (tmp_path / "chapter.adoc").write_bytes(_CHAPTER_MULTIPLE_BROKEN)
+    return tmp_path
+
+
+@pytest_asyncio.fixture(
+    scope="module",
+    loop_scope="module",
+    params=[
+        ("shared_broken_docs", ("missing.adoc",)),
+        ("shared_valid_docs", ()),
+        ("shared_multiple_broken_docs", ("missing_a.adoc", "missing_b.adoc")),
+    ],
+    ids=["broken", "valid", "multiple-broken"],
+)
+async def mcp_validation(request: pytest.FixtureRequest) -> tuple[dict, tuple[str, ...]]:
+    """Result of the MCP validate_structure tool for one docs layout.
+
+    Each layout gets one server, one client and one tool call, shared by all
+    tests. Returns the result data and the include targets expected to be
+    reported as missing.
+    """
+    docs_fixture, expected_missing = request.param
+    mcp = create_mcp_server(docs_root=request.getfixturevalue(docs_fixture))
     async with Client(transport=mcp) as client:
-        yield client
+        result = await client.call_tool("validate_structure", arguments={})
+    return result.data, expected_missing
 
 
 # ── MCP Tool Tests ────────────────────────────────────────────────────────
@@ -92,42 +139,32 @@ async def mcp_multiple_broken(docs_with_multiple_broken_includes: Path):
 class TestMCPValidateUnresolvedIncludes:
     """MCP validate_structure tool detects unresolved includes (Issue #160)."""
 
-    async def test_broken_include_makes_valid_false(self, mcp_broken: Client):
-        """validate_structure returns valid=false when an include is missing."""
-        result = await mcp_broken.call_tool("validate_structure", arguments={})
-        assert result.data["valid"] is False
+    def test_valid_only_without_unresolved_includes(
+        self, mcp_validation: tuple[dict, tuple[str, ...]]
+    ):
+        """validate_structure returns valid=false exactly when an include is missing."""
+        data, expected_missing = mcp_validation
+        error_types = [e["type"] for e in data["errors"]]
 
-    async def test_broken_include_reports_error_type(self, mcp_broken: Client):
-        """The error entry has type 'unresolved_include'."""
-        result = await mcp_broken.call_tool("validate_structure", arguments={})
-        error_types = [e["type"] for e in result.data["errors"]]
-        assert "unresolved_include" in error_types
+        assert ("unresolved_include" in error_types) is bool(expected_missing)
+        assert data["valid"] is (not expected_missing)
 
-    async def test_broken_include_error_has_path_and_message(self, mcp_broken: Client):
-        """The error entry includes path (file:line) and a descriptive message."""
-        result = await mcp_broken.call_tool("validate_structure", arguments={})
-        errors = [e for e in result.data["errors"] if e["type"] == "unresolved_include"]
-        assert len(errors) == 1
-        error = errors[0]
-        # path should be file:line format
-        assert ":" in error["path"]
-        # message should mention the missing file
-        assert "missing.adoc" in error["message"]
-
-    async def test_valid_include_no_unresolved_error(self, mcp_valid: Client):
-        """Valid includes should not produce unresolved_include errors."""
-        result = await mcp_valid.call_tool("validate_structure", arguments={})
-        error_types = [e["type"] for e in result.data["errors"]]
-        assert "unresolved_include" not in error_types
+    def test_each_broken_include_reported(self, mcp_validation: tuple[dict, tuple[str, ...]]):
+        """Each broken include produces its own error entry naming the missing file."""
+        data, expected_missing = mcp_validation
+        errors = [e for e in data["errors"] if e["type"] == "unresolved_include"]
 
-    async def test_multiple_broken_includes_all_reported(self, mcp_multiple_broken: Client):
-        """Each broken include produces its own error entry."""
-        result = await mcp_multiple_broken.call_tool("validate_structure", arguments={})
-        errors = [e for e in result.data["errors"] if e["type"] == "unresolved_include"]
-        assert len(errors) == 2
-        messages = [e["message"] for e in errors]
-        assert any("missing_a.adoc" in m for m in messages)
-        assert any("missing_b.adoc" in m for m in messages)
+        assert len(errors) == len(expected_missing)
+        messages = "\n".join(e["message"] for e in errors)
+        for name in expected_missing:
+            assert name in messages
+
+    def test_errors_have_file_line_path(self, mcp_validation: tuple[dict, tuple[str, ...]]):
+        """Every unresolved_include error has a path in file:line format."""
+        data, _ = mcp_validation
+        errors = [e for e in data["errors"] if e["type"] == "unresolved_include"]
+
+        assert all(":" in e["path"] for e in errors)
 
 
 # ── Service-Layer Tests ───────────────────────────────────────────────────
@@ -136,31 +173,35 @@ class TestMCPValidateUnresolvedIncludes:
 class TestServiceValidateUnresolvedIncludes:
     """Service-level validate_structure detects unresolved includes (#160)."""
 
-    def test_service_broken_include_detected(self, docs_with_broken_include: Path):
+    def test_service_broken_include_detected(self, broken_index: tuple[StructureIndex, Path]):
         """validate_structure reports unresolved_include for missing file."""
-        parser = AsciidocStructureParser(base_path=docs_with_broken_include)
-        index = StructureIndex()
-        docs = [parser.parse_file(f) for f in docs_with_broken_include.glob("*.adoc")]
-        index.build_from_documents(docs)
-
-        result = validate_structure(index, docs_with_broken_include)
+        result = validate_structure(*broken_index)
 
         assert result["valid"] is False
         error_types = [e["type"] for e in result["errors"]]
         assert "unresolved_include" in error_types
 
-    def test_service_valid_include_clean(self, docs_with_valid_include: Path):
+    def test_service_valid_include_clean(self, valid_index: tuple[StructureIndex, Path]):
         """validate_structure has no unresolved_include for existing file."""
-        parser = AsciidocStructureParser(base_path=docs_with_valid_include)
-        index = StructureIndex()
-        docs = [parser.parse_file(f) for f in docs_with_valid_include.glob("*.adoc")]
-        index.build_from_documents(docs)
-
-        result = validate_structure(index, docs_with_valid_include)
+        result = validate_structure(*valid_index)
 
         error_types = [e["type"] for e in result["errors"]]
         assert "unresolved_include" not in error_types
 
+    def test_service_rechecks_include_on_disk_without_rebuild(self, docs_with_broken_include: Path):
+        """Cached index findings still re-check include targets on each call."""
+        # Creates the missing file, so it needs its own docs and index
+        index = _index_docs(docs_with_broken_include, _BROKEN_DOC_FILES)
+
+        first = validate_structure(index, docs_with_broken_include)
+        first["errors"].clear()
+        (docs_with_broken_include / "missing.adoc").write_text("Now here.\n", encoding="utf-8")
+        second = validate_structure(index, docs_with_broken_include)
+
+        assert second["valid"] is True
+        # The new file is on disk but not yet indexed
+        assert [w["type"] for w in second["warnings"]] == ["orphaned_file"]
+
 
 # ── CLI Tests ─────────────────────────────────────────────────────────────
 
@@ -170,20 +211,21 @@ class TestCLIValidateUnresolvedIncludes:
 
     def test_cli_reports_broken_include(self, docs_with_broken_include: Path):
         """CLI validate exits with error and shows unresolved_include."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli,
-            ["--docs-root", str(docs_with_broken_include), "validate"],
+            ["--docs-root", str(docs_with_broken_include), "--format", "json", "validate"],
         )
         assert result.exit_code != 0
-        assert "unresolved_include" in result.output
+        data = json.loads(result.stdout)
+        assert [e["type"] for e in data["errors"]] == ["unresolved_include"]
 
     def test_cli_clean_when_include_exists(self, docs_with_valid_include: Path):
         """CLI validate exits cleanly when all includes resolve."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             cli,
-            ["--docs-root", str(docs_with_valid_include), "validate"],
+            ["--docs-root", str(docs_with_valid_include), "--format", "json", "validate"],
         )
         assert result.exit_code == 0
-        assert "unresolved_include" not in result.output
+        data = json.loads(result.stdout)
+        assert data["valid"] is True
+        assert "unresolved_include" not in {e["type"] for e in data["errors"]}